@@ -8,14 +8,19 @@ Version: 1.0
 Date: 02/08/2025
 """
 
+import time
+
+# Inicio del proceso, para medir el tiempo hasta el primer cuadro (SRS RNF-01)
+STARTUP_STARTED = time.perf_counter()
+
 import sys
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QIcon, QGuiApplication
 
-# Mantener los imports del sistema de hilos y la app principal
-from src.main_app import MainApp
+# Solo Qt y módulos ligeros en el hilo principal; MainApp se importa cuando
+# los datos están listos y pandas/openpyxl se cargan en el hilo inicializador
 from src.data_manager_initializer import DataManagerInitializer
 from src.config import Config
 
@@ -74,6 +79,26 @@ class ProfessionalSplashScreen(QWidget):
         status_bar_layout.addWidget(self.message_label, alignment=Qt.AlignmentFlag.AlignVCenter)
         status_bar_layout.addStretch()
 
+        # Duración de la última etapa completada y progreso global del inicio
+        self.timing_label = QLabel("")
+        self.timing_label.setStyleSheet(f"color: {Config.COLOR_GRAY_TEXT}; font-size: {Config.SPLASH_STATUS_FONT_SIZE};")
+        status_bar_layout.addWidget(self.timing_label, alignment=Qt.AlignmentFlag.AlignVCenter)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFixedWidth(Config.SPLASH_PROGRESS_WIDTH)
+        self.progress_bar.setStyleSheet(f"""
+            QProgressBar {{
+                border: 1px solid {Config.COLOR_CFE_BORDER};
+                border-radius: 3px;
+                text-align: center;
+                font-size: {Config.SPLASH_STATUS_FONT_SIZE};
+            }}
+            QProgressBar::chunk {{ background-color: {Config.COLOR_CFE_GREEN}; }}
+        """)
+        status_bar_layout.addWidget(self.progress_bar, alignment=Qt.AlignmentFlag.AlignVCenter)
+
         container_layout.addWidget(center_area)
         container_layout.addWidget(status_bar)
         
@@ -123,11 +148,27 @@ class ProfessionalSplashScreen(QWidget):
         self.message_label.setText(message)
         QApplication.processEvents()
 
+    def update_progress(self, percent: int):
+        """Actualiza la barra de progreso global del inicio (0-100)."""
+        self.progress_bar.setValue(percent)
+
+    def show_stage_timing(self, stage: str, seconds: float):
+        """Muestra la duración de la etapa de inicio recién completada."""
+        self.timing_label.setText(f"Última etapa: {seconds:.2f} s")
+
+
+def connect_splash(initializer, splash):
+    """Muestra en el splash el mensaje, la duración y el progreso de cada etapa de inicio."""
+    initializer.stage_started.connect(splash.update_message)
+    initializer.stage_finished.connect(splash.show_stage_timing)
+    initializer.progress.connect(splash.update_progress)
+
 
 def on_data_manager_ready(data_manager):
     """Callback de éxito del inicializador."""
     global main_window  # Hacer main_window global para evitar garbage collection
-    main_window = MainApp(data_manager)
+    from src.main_app import MainApp
+    main_window = MainApp(data_manager, startup_started=STARTUP_STARTED)
     main_window.update_connection_status()
     main_window.showMaximized()
     splash.close()
@@ -161,6 +202,7 @@ def main():
     initializer = DataManagerInitializer()
     
     # Conectar señales
+    connect_splash(initializer, splash)
     initializer.finished.connect(on_data_manager_ready)
     initializer.error.connect(on_data_manager_error)
     
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Startup import benchmark for RETI-C application.
+Measures the import cost of each startup module in a fresh interpreter.
+
+Uso:
+    python scripts/benchmark_startup.py [--repeat N] [--top N]
+
+Cada módulo se importa en un proceso nuevo con `python -X importtime`, de
+modo que la medición no se beneficia de módulos ya cargados. Se informa la
+mediana del tiempo acumulado, si el módulo arrastra pandas/openpyxl (que
+deben cargarse solo en el hilo de DataManagerInitializer) y, con --top, las
+dependencias más costosas del arranque (`run`).
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Módulos en el orden en que participan en el arranque
+STARTUP_MODULES = [
+    "src.config",
+    "src.data_manager_initializer",
+    "run",
+    "src.data_manager",
+    "src.main_app",
+    "src.views.registration_view",
+    "src.views.search_view",
+    "src.views.inventory_view",
+]
+
+HEAVY_MODULES = ("pandas", "openpyxl", "numpy")
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(module: str):
+    """
+    Importa `module` en un intérprete nuevo y analiza la salida de -X importtime.
+
+    Returns:
+        tuple: (tiempo acumulado en ms, módulos pesados cargados, lista de
+            (acumulado en ms, nombre) de las dependencias directas)
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total_ms = 0.0
+    heavy = set()
+    children = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if name in HEAVY_MODULES:
+            heavy.add(name)
+        if name == module and indent == 1:
+            total_ms = cumulative_us / 1000
+        elif indent == 3:
+            children.append((cumulative_us / 1000, name))
+    return total_ms, heavy, children
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mide el costo de importación de los módulos de arranque.")
+    parser.add_argument("--repeat", type=int, default=3, help="Mediciones por módulo (se usa la mediana)")
+    parser.add_argument("--top", type=int, default=10, help="Dependencias más costosas de `run` a mostrar")
+    args = parser.parse_args()
+
+    print(f"{'Módulo':<32} {'Importación (ms)':>17}  Carga pesada")
+    print("-" * 70)
+    for module in STARTUP_MODULES:
+        try:
+            samples = [measure(module) for _ in range(max(1, args.repeat))]
+        except RuntimeError as e:
+            print(f"{module:<32} {'error':>17}  {e}")
+            continue
+        median_ms = statistics.median(sample[0] for sample in samples)
+        heavy = ", ".join(sorted(samples[0][1])) or "-"
+        print(f"{module:<32} {median_ms:>17.1f}  {heavy}")
+
+    if args.top:
+        _, heavy, children = measure("run")
+        print("\nDependencias directas más costosas de `run`:")
+        for cumulative_ms, name in sorted(children, reverse=True)[:args.top]:
+            print(f"  {cumulative_ms:>8.1f} ms  {name}")
+        if heavy:
+            print(f"\nADVERTENCIA: `run` importa {', '.join(sorted(heavy))} en el hilo principal.")
+
+
+if __name__ == "__main__":
+    main()
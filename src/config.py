@@ -9,7 +9,10 @@ Date: 02/08/2025
 
 import os
 from pathlib import Path
-from PyQt6.QtGui import QColor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QColor
 
 
 class Config:
@@ -35,7 +38,62 @@ class Config:
 
     # Ruta de fallback para el entorno de desarrollo o modo offline
     EXCEL_LOCAL_PATH = DATA_DIR / EXCEL_FILENAME
-    
+
+    # Comprobación de la red con plazo máximo: un recurso SMB inaccesible puede
+    # bloquear exists()/os.access() hasta el tiempo de espera del sistema.
+    NETWORK_PROBE_TIMEOUT = 2.0  # segundos antes de arrancar en modo local
+    # Último resultado de accesibilidad: si la red estaba inaccesible se arranca
+    # en local sin esperar (la comprobación sigue en segundo plano).
+    NETWORK_STATE_FILE = DATA_DIR / "cache" / "network_state.json"
+    NETWORK_STATE_MAX_AGE = 12 * 3600  # segundos de validez de un resultado "sin red"
+    # Monitor de conectividad en modo local: reintentos con retroceso exponencial
+    CONNECTIVITY_MONITOR_ENABLED = True
+    CONNECTIVITY_RETRY_INITIAL = 5.0  # segundos hasta el primer reintento
+    CONNECTIVITY_RETRY_MAX = 300.0  # espera máxima entre reintentos
+    # Sincronización de lo guardado en modo local al volver a la red (ver src/sync.py)
+    SYNC_ON_RECONNECT = True
+    SYNC_STATE_FILE = DATA_DIR / "cache" / "sync_state.json"  # marca de agua por libro local
+
+    # --- Motor de Almacenamiento ---
+    # "excel": libro .xlsx en la ruta activa (formato histórico)
+    # "sqlite": base indexada junto al libro; el .xlsx se genera con DataManager.export_to_excel()
+    STORAGE_BACKEND = "excel"
+    SQLITE_SUFFIX = ".sqlite"
+    SQLITE_JOURNAL_MODE = "WAL"
+    # WAL requiere memoria compartida en el mismo equipo: en red se usa DELETE
+    SQLITE_NETWORK_JOURNAL_MODE = "DELETE"
+
+    # --- Instantánea Local ---
+    # Copia columnar (Feather si pyarrow está instalado, si no pickle) del libro de red,
+    # validada por su mtime y tamaño: evita procesar el .xlsx en cada arranque.
+    SNAPSHOT_ENABLED = True
+    SNAPSHOT_DIR = DATA_DIR / "cache"
+
+    # --- Caché de Datos ---
+    # Añade un hash del contenido a la firma (mtime, tamaño) del archivo.
+    # Más seguro en recursos SMB con mtime de baja resolución, pero lee el archivo completo.
+    CACHE_VERIFY_HASH = False
+
+    # --- Escritura de Registros ---
+    # Añade filas al libro existente en lugar de reescribir todo el DataFrame.
+    # Se usa la reescritura completa solo si el esquema no coincide con COLUMNS.
+    EXCEL_APPEND_MODE = True
+
+    # Bitácora de escritura anticipada (JSONL junto al libro): cada guardado añade una
+    # línea con fsync y los registros se integran al libro por lotes.
+    JOURNAL_ENABLED = False
+    JOURNAL_COMPACT_THRESHOLD = 25  # registros pendientes que disparan la compactación
+
+    # Importación masiva (CSV/XLSX heredados): filas leídas y guardadas por bloque
+    IMPORT_CHUNK_SIZE = 5000
+
+    # Lectura en streaming (solo lectura, values_only): filas por bloque
+    STREAM_CHUNK_SIZE = 2000
+
+    # Bloqueo de escritura entre estaciones (archivo .lock junto al libro)
+    WRITE_LOCK_TIMEOUT = 10.0  # segundos de espera antes de reportar error
+    WRITE_LOCK_STALE_AFTER = 60.0  # segundos (reloj local) sin cambios para considerar abandonado un bloqueo
+
     # Excel Column Headers (as per SRS)
     COLUMNS = [
         "ID",
@@ -62,11 +120,46 @@ class Config:
         "Estado"
     ]
     
+    # Sugerencias de número de serie mientras se escribe (SearchView)
+    SUGGEST_MIN_CHARS = 2
+    SUGGEST_LIMIT = 20
+    
+    # Hilos del pool de búsquedas de SearchView
+    SEARCH_THREADS = 2
+    
+    # Vistas diferidas: construir en segundo plano las no visitadas tras mostrar la ventana
+    PREBUILD_VIEWS_ON_IDLE = True
+    PREBUILD_VIEWS_DELAY_MS = 500
+    
+    # Búsqueda de texto completo (índice invertido, sin acentos ni mayúsculas)
+    TEXT_SEARCH_COLUMNS = ["Descripcion del Problema", "Historial Intervenciones"]
+    TEXT_SEARCH_LIMIT = 50
+    
+    # Consultas por criterios (DataManager.query): registros por página
+    QUERY_PAGE_SIZE = 200
+    
+    # Vista de inventario: filas que la tabla pide al modelo por lote
+    INVENTORY_FETCH_BATCH = 500
+    
+    # Esquema de tipos aplicado al cargar (ver src/schema.py)
+    DATE_COLUMNS = ["Fecha de Recepcion", "Fecha de Entrega"]
+    CATEGORY_COLUMNS = ["Tipo de Equipo", "Responsable Recepcion", "Estado"]
+    STRING_COLUMNS = ["Numero de Serie"]
+    
     # --- Mensajes y Textos de la UI ---
     MSG_ERROR_SERIAL_VACIO = "El número de serie no puede ser nulo o estar vacío."
     MSG_CAMPO_REQUERIDO = "El campo '{field_name}' es obligatorio."
     MSG_EXITO_REGISTRO = "Equipo con S/N '{serial_number}' ha sido registrado."
     MSG_ERROR_GUARDADO = "No se pudo guardar el registro en el archivo Excel. Verifique los permisos o si el archivo está en uso."
+    MSG_GUARDADOS_PENDIENTES = "💾 Guardando {count} registro(s)..."
+    MSG_REGISTRO_RESTAURADO = "Los datos capturados se recuperaron en el formulario de registro para reintentar."
+    MSG_SINCRONIZADOS = "🔄 {count} registro(s) del modo local subidos a la red"
+
+    # Etapas de inicio (mensajes del splash)
+    MSG_INICIO_RED = "Verificando conexión con la ruta de red..."
+    MSG_INICIO_ARCHIVO = "Preparando el archivo de inventario..."
+    MSG_INICIO_DATOS = "Leyendo y preparando los datos..."
+    MSG_INICIO_INDICES = "Construyendo índices de búsqueda..."
 
     # Títulos de MessageBox
     MSG_TITULO_CAMPOS_REQUERIDOS = "Campos Requeridos"
@@ -108,6 +201,7 @@ class Config:
     UI_CHIP_MIN_H = 32  # Altura mínima recomendada para chips interactivos
     UI_BUTTON_MIN_H = 44  # Altura mínima recomendada para botones
     UI_FIELD_HEIGHT = 44  # Altura estándar para campos de entrada
+    UI_TABLE_ROW_HEIGHT = 28  # Altura fija de fila en la tabla de inventario
     UI_COLUMN_LEFT_RATIO = 65  # Ajustado para mejor equilibrio
     UI_COLUMN_RIGHT_RATIO = 35  # Aumentado para dar más espacio a la columna derecha
     
@@ -118,6 +212,7 @@ class Config:
     SPLASH_STATUS_BAR_HEIGHT = 40
     SPLASH_STATUS_BAR_MARGINS = (20, 0, 20, 5)
     SPLASH_STATUS_FONT_SIZE = "10pt"
+    SPLASH_PROGRESS_WIDTH = 160
 
     # Al final de la sección "Mensajes y Textos de la UI"
     MSG_FALLBACK_LOGO_TEXT = "RETI-C\nComisión Federal de Electricidad"
@@ -158,6 +253,12 @@ class Config:
 
 
 # Utilidades de color para UI (usadas por delegates/QPainter)
-def qcolor(hex_str: str) -> QColor:
-    """Convierte un string hex (#RRGGBB) a QColor."""
+def qcolor(hex_str: str) -> "QColor":
+    """
+    Convierte un string hex (#RRGGBB) a QColor.
+
+    Qt se importa aquí y no al inicio del módulo: Config es el núcleo sin
+    dependencias de Qt que comparten DataManager, los backends y las pruebas.
+    """
+    from PyQt6.QtGui import QColor
     return QColor(hex_str)
\ No newline at end of file
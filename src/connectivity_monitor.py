@@ -0,0 +1,104 @@
+"""
+Connectivity Monitor for RETI-C application.
+Keeps probing the network share while working locally and switches back when it returns.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.config import Config
+from src.network_probe import NetworkProbe
+
+
+class ConnectivityMonitor(QThread):
+    """
+    Thread que reintenta la conexión con la ruta de red en modo local.
+
+    Sigue el patrón de `SaveWorker`: la espera y el sondeo ocurren en
+    `run()` y la UI solo recibe señales. Los intentos se espacian con
+    retroceso exponencial (Config.CONNECTIVITY_RETRY_INITIAL, duplicado en
+    cada fallo hasta Config.CONNECTIVITY_RETRY_MAX). Cada sondeo tiene el
+    plazo de Config.NETWORK_PROBE_TIMEOUT, así que detener el monitor nunca
+    espera el tiempo de espera de SMB del sistema operativo. Cuando la red
+    responde, el DataManager pasa a modo red, se suben los registros
+    guardados en local (SyncEngine, si Config.SYNC_ON_RECONNECT) y el
+    monitor termina. Si el DataManager ya está en modo red al iniciar, solo
+    se sincroniza lo pendiente de una sesión local anterior.
+    """
+
+    # Señal emitida cuando el DataManager volvió a modo red
+    connection_restored = pyqtSignal()
+
+    # Señal emitida tras cada intento fallido (causa, segundos hasta el siguiente)
+    probe_failed = pyqtSignal(str, float)
+
+    # Señal emitida al terminar la sincronización (reporte de SyncEngine.sync)
+    sync_finished = pyqtSignal(object)
+
+    def __init__(self, data_manager):
+        """
+        Inicializa el monitor.
+
+        Args:
+            data_manager: Instancia de DataManager a promover a modo red
+        """
+        super().__init__()
+        self.data_manager = data_manager
+        self.attempts = 0
+        self._stop_event = threading.Event()
+
+    def stop(self, timeout_ms: int = -1) -> bool:
+        """
+        Detiene el monitor; un sondeo en curso se abandona al vencer su plazo.
+
+        Args:
+            timeout_ms (int): Espera máxima en milisegundos (-1 = sin límite)
+
+        Returns:
+            bool: True si el thread terminó
+        """
+        self._stop_event.set()
+        if not self.isRunning():
+            return True
+        if timeout_ms < 0:
+            return self.wait()
+        return self.wait(timeout_ms)
+
+    def run(self):
+        """Sondea la ruta de red con retroceso exponencial hasta recuperarla o detenerse."""
+        if self.data_manager.is_network_mode:
+            self._sync()
+            return
+        delay = Config.CONNECTIVITY_RETRY_INITIAL
+        while not self._stop_event.wait(delay):
+            self.attempts += 1
+            probe = NetworkProbe(Config.EXCEL_NETWORK_PATH.parent, Config.NETWORK_STATE_FILE).start()
+            result = probe.wait(Config.NETWORK_PROBE_TIMEOUT)
+            if self._stop_event.is_set():
+                return
+            if result is not None and result[0] and self.data_manager.switch_to_network():
+                self.connection_restored.emit()
+                self._sync()
+                return
+
+            if result is None:
+                cause = f"La ruta de red no respondió en {Config.NETWORK_PROBE_TIMEOUT:g} s."
+            else:
+                cause = result[1] or self.data_manager.connection_error or ""
+            delay = min(delay * 2, Config.CONNECTIVITY_RETRY_MAX)
+            self.probe_failed.emit(cause, delay)
+
+    def _sync(self):
+        """Sube a la red los registros guardados en modo local."""
+        if not Config.SYNC_ON_RECONNECT:
+            return
+        from src.sync import SyncEngine
+        try:
+            report = SyncEngine(self.data_manager).sync()
+        except Exception as e:
+            print(f"Error al sincronizar los registros locales: {e}")
+            report = {'added': 0, 'error': str(e)}
+        self.sync_finished.emit(report)
@@ -1,72 +1,366 @@
 """
 Data Manager module for RETI-C application.
-Handles all Excel file operations and data persistence.
+Handles data persistence through the configured storage backend.
 
 Author: Carlos Verastegui
 Version: 1.0
 Date: 02/08/2025
 """
 
+import numpy as np
 import pandas as pd
-import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+from openpyxl import Workbook
 from .config import Config
+from .indexes import (SERIAL_COLUMN, BitmapIndex, DateIndex, PrefixIndex, SerialIndex,
+                      TextIndex, normalize_serial)
+from .network_probe import NetworkProbe, load_network_state
+from .query import QueryResult
+from .schema import apply_schema, concat_frames
+from .stats import StatsEngine
+from .storage import StorageBackend, create_backend
+from .storage.atomic_io import save_workbook_atomic
+from .storage.excel_backend import to_cell_value
 
 
 class DataManager:
-    """Manages Excel file operations for RETI-C application."""
+    """
+    Manages data operations for RETI-C application.
     
-    def __init__(self):
-        """Initialize the data manager with auto-fallback functionality."""
+    Persistence is delegated to a StorageBackend (Excel or SQLite, chosen
+    by Config.STORAGE_BACKEND); the in-memory cache and indexes live here.
+    """
+    
+    def __init__(self, open_storage: bool = True):
+        """
+        Initialize the data manager with auto-fallback functionality.
+        
+        Args:
+            open_storage (bool): If False, only the active path is probed and
+                open_storage() must be called before using the data (lets the
+                initializer report both stages separately)
+        """
         self.active_path: Path = None
         self.is_network_mode: bool = False
         self.connection_error: str | None = None
         self.columns = Config.COLUMNS
+        self.backend: StorageBackend = None
+        self.network_probe: Optional[NetworkProbe] = None
+        
+        # Protege la caché y los índices: las vistas leen desde el hilo de la UI
+        # mientras los guardados se ejecutan en un hilo en segundo plano
+        self._lock = threading.RLock()
+        # Serializa las escrituras con el cambio de backend (switch_to_network):
+        # un guardado en curso termina en el backend en que empezó
+        self._backend_lock = threading.RLock()
+        
+        # Caché en memoria del DataFrame, revalidada con la firma del archivo
+        self._cache_df: Optional[pd.DataFrame] = None
+        self._cache_signature: Optional[tuple] = None
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        
+        # Índices en memoria; se reconstruyen cuando cambia la versión de datos
+        self._data_version: int = 0
+        self.serial_index = SerialIndex()
+        self.prefix_index = PrefixIndex()
+        self.text_index = TextIndex(Config.TEXT_SEARCH_COLUMNS)
+        self.bitmap_index = BitmapIndex(Config.CATEGORY_COLUMNS)
+        self.date_index = DateIndex(Config.DATE_COLUMNS)
+        self.stats = StatsEngine()
+        self._indexes = [self.serial_index, self.prefix_index, self.text_index,
+                         self.bitmap_index, self.date_index, self.stats]
         
         self._initialize_path()
-        self._ensure_excel_exists()
+        if open_storage:
+            self.open_storage()
+    
+    def open_storage(self):
+        """Crea el backend de almacenamiento para la ruta activa y asegura que exista."""
+        self.backend = create_backend(Config.STORAGE_BACKEND, self.active_path,
+                                      self.columns, network_mode=self.is_network_mode)
+        self._ensure_storage_exists()
     
     def _initialize_path(self):
-        """Intenta establecer la ruta de red. Si falla, hace fallback a la local."""
+        """
+        Intenta establecer la ruta de red. Si falla, hace fallback a la local.
+        
+        La comprobación de la red corre en un hilo con plazo máximo
+        (Config.NETWORK_PROBE_TIMEOUT) mientras se prepara la ruta local; si
+        la red no responde a tiempo gana la local. Si el último arranque
+        registró la red como inaccesible, se arranca en local sin esperar y
+        la comprobación solo actualiza el estado guardado.
+        """
+        started = time.perf_counter()
+        state = load_network_state(Config.NETWORK_STATE_FILE)
+        known_offline = (state is not None and not state["reachable"]
+                         and time.time() - state["checked_at"] < Config.NETWORK_STATE_MAX_AGE)
         try:
-            network_dir = Config.EXCEL_NETWORK_PATH.parent
-            # Validación de existencia y permisos de escritura (más robusta)
-            if network_dir.exists() and os.access(network_dir, os.W_OK):
+            self.network_probe = NetworkProbe(Config.EXCEL_NETWORK_PATH.parent,
+                                              Config.NETWORK_STATE_FILE).start()
+            self._prepare_local_path()
+            timeout = 0 if known_offline else max(0.0, Config.NETWORK_PROBE_TIMEOUT
+                                                  - (time.perf_counter() - started))
+            result = self.network_probe.wait(timeout)
+            if result is not None and result[0]:
                 self.active_path = Config.EXCEL_NETWORK_PATH
                 self.is_network_mode = True
                 print("INFO: Conexión de red exitosa. Usando ruta de producción.")
+            elif result is not None:
+                raise ConnectionError(result[1])
+            elif known_offline:
+                raise ConnectionError(f"Red inaccesible en la última comprobación ({state['error']})")
             else:
-                raise ConnectionError("Directorio de red no existe o no hay permisos de escritura.")
+                raise ConnectionError(f"La ruta de red no respondió en {Config.NETWORK_PROBE_TIMEOUT:g} s.")
         except Exception as e:
             self.connection_error = str(e)
             print(f"ADVERTENCIA: No se pudo usar la ruta de red ({self.connection_error}). Haciendo fallback a modo local.")
             self.active_path = Config.EXCEL_LOCAL_PATH
             self.is_network_mode = False
 
-    def _ensure_excel_exists(self):
-        """Verifica que el archivo Excel exista en la ruta activa; si no, lo crea."""
-        if not self.active_path.exists():
-            df = pd.DataFrame(columns=self.columns)
-            self.active_path.parent.mkdir(parents=True, exist_ok=True)
-            df.to_excel(self.active_path, index=False)
-    
-    def load_data(self) -> pd.DataFrame:
+    def switch_to_network(self) -> bool:
         """
-        Load data from Excel file.
+        Pasa a la ruta de red cuando vuelve a estar disponible.
+        
+        El backend de red se abre antes de tomar los bloqueos, así que la
+        UI sigue leyendo mientras tanto; el cambio espera a que termine el
+        guardado en curso y los guardados encolados después se escriben en
+        la red. Los registros guardados en local durante la desconexión
+        permanecen en el libro local.
         
         Returns:
-            pd.DataFrame: The loaded data
+            bool: True si se activó el modo red
         """
+        if self.is_network_mode:
+            return True
         try:
-            return pd.read_excel(self.active_path)
+            backend = create_backend(Config.STORAGE_BACKEND, Config.EXCEL_NETWORK_PATH,
+                                     self.columns, network_mode=True)
+            backend.ensure_exists()
+        except Exception as e:
+            self.connection_error = str(e)
+            print(f"ADVERTENCIA: La ruta de red respondió pero no se pudo abrir ({e}).")
+            return False
+        with self._backend_lock, self._lock:
+            self.backend = backend
+            self.active_path = Config.EXCEL_NETWORK_PATH
+            self.is_network_mode = True
+            self.connection_error = None
+            self.invalidate_cache()
+        print("INFO: Conexión de red restablecida. Usando ruta de producción.")
+        return True
+
+    def _prepare_local_path(self):
+        """Prepara el directorio de la ruta local mientras se comprueba la red."""
+        try:
+            Config.EXCEL_LOCAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"ADVERTENCIA: No se pudo preparar el directorio local ({e}).")
+
+    def _ensure_storage_exists(self):
+        """Verifica que el almacenamiento exista en la ruta activa; si no, lo crea."""
+        self.backend.ensure_exists()
+    
+    def _file_signature(self) -> Optional[tuple]:
+        """Firma barata de la versión de los datos, delegada al backend."""
+        return self.backend.signature()
+
+    def _get_frame(self, strict: bool = False) -> pd.DataFrame:
+        """
+        Devuelve el DataFrame en caché, releyendo el archivo solo si cambió.
+
+        El DataFrame devuelto es compartido: los llamadores internos no deben
+        modificarlo. Para una copia independiente usar load_data().
+
+        La lectura del backend (lenta sobre la red) se hace fuera de
+        `self._lock`: mientras tanto las vistas siguen consultando la caché
+        anterior, y solo el intercambio del DataFrame se hace bajo el bloqueo.
+
+        Args:
+            strict (bool): Si es True, un error de lectura se propaga en lugar
+                de devolver un DataFrame vacío. Las escrituras lo necesitan:
+                con datos vacíos el ID máximo sería 0 (IDs duplicados) y una
+                reescritura completa borraría el libro.
+
+        Returns:
+            pd.DataFrame: Los datos actuales del archivo
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if (self._cache_df is not None and signature is not None
+                    and signature == self._cache_signature):
+                self.cache_hits += 1
+                return self._cache_df
+            self.cache_misses += 1
+            backend = self.backend
+
+        try:
+            df = apply_schema(backend.load())
         except Exception as e:
             print(f"Error loading data: {e}")
+            if strict:
+                raise
             return pd.DataFrame(columns=self.columns)
+
+        with self._lock:
+            if backend is self.backend:
+                if self._cache_df is not None and self._cache_signature == signature:
+                    # Otro hilo ya cargó esta misma versión durante la lectura
+                    return self._cache_df
+                # La firma se tomó antes de leer: si el archivo cambia durante la
+                # lectura, la siguiente consulta detectará la diferencia y releerá.
+                self._cache_df = df
+                self._cache_signature = signature
+                self._data_version += 1
+                return df
+        # switch_to_network() cambió el backend durante la lectura
+        return self._get_frame(strict)
+
+    def load_data(self) -> pd.DataFrame:
+        """
+        Load data from the storage backend.
+        
+        Uses the in-memory cache when the data has not changed since the
+        last read (same backend signature). Columns follow the explicit
+        schema in src/schema.py (text serials, datetime dates, categories).
+        
+        Returns:
+            pd.DataFrame: The loaded data
+        """
+        return self._get_frame().copy()
+
+    def current_frame(self) -> pd.DataFrame:
+        """
+        Devuelve el DataFrame en caché sin copiarlo (solo lectura).
+        
+        Pensado para modelos de vista sobre inventarios grandes: la caché
+        nunca se modifica en sitio (cada cambio crea un DataFrame nuevo),
+        así que la referencia sigue siendo coherente mientras se use. Quien
+        necesite modificar los datos debe usar load_data().
+        
+        Returns:
+            pd.DataFrame: Los datos actuales
+        """
+        return self._get_frame()
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Recorre los registros en bloques sin materializar todo el inventario.
+        
+        Si la caché en memoria está vigente se recorre directamente; si no,
+        el backend lee de forma incremental (openpyxl en modo de solo
+        lectura para Excel, cursor para SQLite) y la caché no se llena, de
+        modo que la memoria queda acotada por el tamaño del bloque. Quien
+        consume el iterador puede detenerse en cuanto encuentre lo que busca.
+        
+        Args:
+            chunk_size (Optional[int]): Filas por bloque (por defecto
+                Config.STREAM_CHUNK_SIZE)
+            
+        Returns:
+            Iterator[pd.DataFrame]: Bloques de registros en orden de archivo
+        """
+        chunk_size = chunk_size or Config.STREAM_CHUNK_SIZE
+        with self._lock:
+            signature = self._file_signature()
+            cached = self._cache_df if (signature is not None and signature == self._cache_signature) else None
+        if cached is not None:
+            for start in range(0, len(cached), chunk_size):
+                yield cached.iloc[start:start + chunk_size]
+            return
+        for chunk in self.backend.iter_chunks(chunk_size):
+            yield apply_schema(chunk)
+
+    def iter_records(self, chunk_size: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Recorre los registros uno a uno (ver iter_chunks()).
+        
+        Returns:
+            Iterator[Dict]: Registros en orden de archivo
+        """
+        for chunk in self.iter_chunks(chunk_size):
+            yield from chunk.to_dict('records')
+
+    def invalidate_cache(self):
+        """Descarta la caché en memoria para forzar una relectura del archivo."""
+        with self._lock:
+            self._cache_df = None
+            self._cache_signature = None
+
+    def _cached_frame(self) -> pd.DataFrame:
+        """
+        DataFrame en caché sin revalidar la firma.
+
+        Para usar con `self._lock` adquirido tras un _get_frame(). Sin caché
+        (la lectura falló o otro hilo la descartó entretanto) se devuelve un
+        DataFrame vacío en lugar de leer el archivo con el bloqueo tomado.
+        """
+        with self._lock:
+            if self._cache_df is None:
+                return pd.DataFrame(columns=self.columns)
+            return self._cache_df
+
+    def _get_indexed_frame(self, *indexes) -> pd.DataFrame:
+        """
+        Devuelve el DataFrame en caché con los índices indicados al día.
+
+        Los índices solo se reconstruyen si su versión no coincide con la
+        versión actual de los datos (es decir, una vez por cada relectura),
+        y solo cuando una consulta los necesita.
+
+        Debe llamarse con `self._lock` adquirido y justo después de validar
+        la caché con _get_frame() fuera del bloqueo: aquí se usa la caché
+        vigente sin volver a leer el archivo (ver _cached_frame()).
+
+        Args:
+            *indexes: Índices requeridos (por defecto, todos)
+
+        Returns:
+            pd.DataFrame: Los datos actuales del archivo
+        """
+        with self._lock:
+            df = self._cached_frame()
+            for index in indexes or self._indexes:
+                if index.version != self._data_version:
+                    index.build(df, self._data_version)
+            return df
+
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Deja la caché cargada y todos los índices construidos.
+        
+        Pensado para el arranque: así la primera búsqueda o guardado no paga
+        la lectura completa del libro ni la construcción de los índices.
+        
+        Returns:
+            Dict[str, float]: Segundos empleados por cada índice (por nombre de clase)
+        """
+        timings = {}
+        self._get_frame()
+        with self._lock:
+            df = self._cached_frame()
+            for index in self._indexes:
+                started = time.perf_counter()
+                if index.version != self._data_version:
+                    index.build(df, self._data_version)
+                timings[type(index).__name__] = time.perf_counter() - started
+        return timings
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Devuelve los contadores de aciertos y fallos de la caché.
+
+        Returns:
+            Dict[str, int]: Diccionario con las claves 'hits' y 'misses'
+        """
+        return {'hits': self.cache_hits, 'misses': self.cache_misses}
     
     def save_data(self, df: pd.DataFrame) -> bool:
         """
-        Save data to Excel file.
+        Save data, replacing every stored record.
         
         Args:
             df (pd.DataFrame): Data to save
@@ -75,27 +369,107 @@ class DataManager:
             bool: True if successful, False otherwise
         """
         try:
-            df.to_excel(self.active_path, index=False)
+            with self._backend_lock:
+                self.backend.save(df)
+                # Lo escrito es ahora el contenido vigente: evitar una relectura
+                # (tipado como una lectura, para no mezclar Timestamp y texto)
+                with self._lock:
+                    self._cache_df = apply_schema(df.reset_index(drop=True))
+                    self._cache_signature = self._file_signature()
+                    self._data_version += 1
+                    self.backend.on_frame_updated(self._cache_df)
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
     
+    def _append_rows(self, rows: List[Dict]) -> bool:
+        """
+        Añade filas mediante el backend y mantiene la caché sincronizada.
+
+        Args:
+            rows (List[Dict]): Registros a añadir
+
+        Returns:
+            bool: True si se añadieron; False si el backend requiere una
+                reescritura completa (p. ej. el esquema cambió)
+        """
+        with self._lock:
+            signature_before = self._file_signature()
+            was_cached = (self._cache_df is not None
+                          and signature_before == self._cache_signature)
+        if not self.backend.append(rows):
+            return False
+        
+        with self._lock:
+            if was_cached and self._cache_signature == signature_before:
+                # Mantener la caché sincronizada sin releer el archivo completo
+                start = len(self._cache_df)
+                new_rows = pd.DataFrame(rows, columns=self._cache_df.columns)
+                self._cache_df = concat_frames([self._cache_df, new_rows])
+                self._cache_signature = self._file_signature()
+                self.backend.on_frame_updated(self._cache_df)
+                # Los índices vigentes se actualizan en lugar de reconstruirse
+                for index in self._indexes:
+                    if index.version == self._data_version:
+                        for offset, row in enumerate(rows):
+                            index.add(start + offset, row)
+            elif self._cache_signature != self._file_signature():
+                # Si otro hilo ya releyó los datos nuevos la caché es válida
+                self.invalidate_cache()
+        return True
+
+    def _compute_max_id(self) -> int:
+        """
+        Calcula el ID máximo a partir de los datos (usa la caché si es válida).
+        
+        Raises:
+            Exception: Si los datos no se pueden leer (no se asume un libro vacío)
+        """
+        df = self._get_frame(strict=True)
+        if df.empty or 'ID' not in df.columns:
+            return 0
+        max_id = pd.to_numeric(df['ID'], errors='coerce').max()
+        return 0 if pd.isna(max_id) else int(max_id)
+
     def get_next_id(self) -> int:
         """
         Get the next available ID for a new record.
         
+        The backend resolves it without a full parse when it can (the Excel
+        backend keeps a high-water mark next to the workbook, SQLite uses an
+        indexed MAX).
+        
         Returns:
             int: Next available ID
         """
-        df = self.load_data()
-        if df.empty:
-            return 1
-        return df['ID'].max() + 1 if 'ID' in df.columns else 1
+        return self.backend.next_id(self._compute_max_id)
+    
+    def _write_rows(self, rows: List[Dict]) -> bool:
+        """
+        Escribe registros nuevos: añadiéndolos si es posible o, si no, con una
+        reescritura completa. Debe llamarse con el bloqueo de escritura adquirido.
+        
+        Args:
+            rows (List[Dict]): Registros con ID ya asignado
+            
+        Returns:
+            bool: True si se guardaron
+        """
+        # Ruta rápida: escribir solo las filas nuevas sobre el libro existente
+        if Config.EXCEL_APPEND_MODE and self._append_rows(rows):
+            return True
+        
+        # Fallback: reescritura completa (esquema distinto o modo desactivado)
+        df = concat_frames([self._get_frame(strict=True), pd.DataFrame(rows)])
+        return self.save_data(df)
     
     def add_record(self, record_data: Dict) -> bool:
         """
-        Add a new record to the Excel file.
+        Add a new record to the storage backend.
+        
+        The ID allocation and the write happen under the shared write lock,
+        so two workstations saving at the same time never get the same ID.
         
         Args:
             record_data (Dict): Record data to add
@@ -104,24 +478,113 @@ class DataManager:
             bool: True if successful, False otherwise
         """
         try:
-            df = self.load_data()
-            
-            # Add ID if not present
-            if 'ID' not in record_data:
-                record_data['ID'] = self.get_next_id()
-            
-            # Create new row
-            new_row = pd.DataFrame([record_data])
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            return self.save_data(df)
+            with self._backend_lock, self.backend.write_lock():
+                next_id = self.get_next_id()
+                
+                # Add ID if not present
+                if 'ID' not in record_data:
+                    record_data['ID'] = next_id
+                
+                saved = self._write_rows([record_data])
+                if saved:
+                    record_id = pd.to_numeric(record_data['ID'], errors='coerce')
+                    high_water_mark = next_id - 1 if pd.isna(record_id) else max(next_id - 1, int(record_id))
+                    self.backend.commit_high_water_mark(high_water_mark)
+                return saved
         except Exception as e:
             print(f"Error adding record: {e}")
             return False
     
+    def add_records(self, records: Iterable[Dict], row_offset: int = 0) -> Dict:
+        """
+        Add many records with a single write.
+        
+        Required fields (Config.REQUIRED_FIELDS) are validated with vectorized
+        checks; valid rows get a contiguous block of new IDs (incoming IDs are
+        ignored) and only columns in Config.COLUMNS are kept.
+        
+        Args:
+            records (Iterable[Dict]): Records to add
+            row_offset (int): Number added to each row position in the report
+                (e.g. the spreadsheet row of the first record)
+            
+        Returns:
+            Dict: Report with 'added', 'rejected' (list of {'row', 'reason'}),
+                'first_id' and 'last_id'; if the write fails every valid row
+                is reported as rejected with Config.MSG_ERROR_GUARDADO
+        """
+        report = {'added': 0, 'rejected': [], 'first_id': None, 'last_id': None}
+        df = pd.DataFrame(list(records))
+        if df.empty:
+            return report
+        
+        # Validación vectorizada: primer campo obligatorio vacío de cada fila
+        blank_cells = df.isna() | df.astype(str).apply(lambda col: col.str.strip().eq(''))
+        reasons = pd.Series([None] * len(df), index=df.index, dtype=object)
+        for field in Config.REQUIRED_FIELDS:
+            blank = blank_cells[field] if field in df.columns else pd.Series(True, index=df.index)
+            message = Config.MSG_CAMPO_REQUERIDO.format(field_name=field)
+            reasons = reasons.where(reasons.notna() | ~blank, message)
+        
+        # Filas completamente vacías (p. ej. al final de una hoja) se omiten sin reportarse
+        empty_rows = blank_cells.all(axis=1).to_numpy()
+        invalid = reasons.notna().to_numpy() & ~empty_rows
+        accepted = ~reasons.notna().to_numpy()
+        report['rejected'] = [{'row': row_offset + int(position), 'reason': reasons.iloc[position]}
+                              for position in invalid.nonzero()[0]]
+        valid = df.loc[accepted, [col for col in self.columns if col in df.columns and col != 'ID']]
+        if valid.empty:
+            return report
+        
+        rows = valid.astype(object).where(valid.notna(), None).to_dict('records')
+        try:
+            with self._backend_lock, self.backend.write_lock():
+                first_id = self.get_next_id()
+                for offset, row in enumerate(rows):
+                    row['ID'] = first_id + offset
+                if not self._write_rows(rows):
+                    raise IOError(Config.MSG_ERROR_GUARDADO)
+                last_id = first_id + len(rows) - 1
+                self.backend.commit_high_water_mark(last_id)
+        except Exception as e:
+            print(f"Error adding records: {e}")
+            report['rejected'] += [{'row': row_offset + int(position), 'reason': Config.MSG_ERROR_GUARDADO}
+                                   for position in accepted.nonzero()[0]]
+            report['rejected'].sort(key=lambda item: item['row'])
+            return report
+        
+        report.update(added=len(rows), first_id=first_id, last_id=last_id)
+        return report
+    
+    def compact_journal(self) -> int:
+        """
+        Integra en el almacenamiento principal las escrituras diferidas
+        (bitácora del backend Excel) en una sola escritura.
+        
+        Returns:
+            int: Número de registros integrados; -1 si ocurrió un error
+        """
+        try:
+            with self._backend_lock, self.backend.write_lock():
+                with self._lock:
+                    signature_before = self._file_signature()
+                    was_cached = (self._cache_df is not None
+                                  and signature_before == self._cache_signature)
+                # La compactación reescribe el libro: las vistas siguen leyendo mientras tanto
+                compacted = self.backend.compact()
+                # El contenido visible no cambia: solo se actualiza la firma
+                with self._lock:
+                    if was_cached and self._cache_signature == signature_before:
+                        self._cache_signature = self._file_signature()
+                        self.backend.on_frame_updated(self._cache_df)
+                return compacted
+        except Exception as e:
+            print(f"Error compacting journal: {e}")
+            return -1
+    
     def find_by_serial(self, serial_number: str) -> Optional[Dict]:
         """
-        Find a record by serial number.
+        Find the first visit (oldest Fecha de Recepcion) of a serial number.
         
         Args:
             serial_number (str): Serial number to search for
@@ -129,6 +592,26 @@ class DataManager:
         Returns:
             Optional[Dict]: Record data if found, None otherwise
             
+        Raises:
+            ValueError: If serial_number is None or empty
+        """
+        records = self.find_all_by_serial(serial_number)
+        return records[0] if records else None
+
+    def find_all_by_serial(self, serial_number: str) -> List[Dict]:
+        """
+        Find every visit (record) of the device with the given serial number.
+        
+        Uses the serial index (serial -> row positions, precomputed once
+        per data version) instead of scanning the column.
+        
+        Args:
+            serial_number (str): Serial number to search for
+            
+        Returns:
+            List[Dict]: Matching records ordered by Fecha de Recepcion, oldest
+                first; visits without a date go last (empty if none)
+            
         Raises:
             ValueError: If serial_number is None or empty
         """
@@ -137,22 +620,230 @@ class DataManager:
             raise ValueError(Config.MSG_ERROR_SERIAL_VACIO)
         
         try:
-            # Usar el método existente para mantener consistencia arquitectónica
-            df = self.load_data()
-            
-            # Validar DataFrame vacío
-            if df.empty:
-                return None
+            # Backends con búsqueda nativa (SQLite) no necesitan cargar los datos
+            records = self.backend.lookup_serial(normalize_serial(serial_number))
+            if records is not None:
+                return apply_schema(pd.DataFrame(records)).to_dict('records') if records else []
             
-            # Búsqueda eficiente y exacta sin modificar el DataFrame original
-            search_term = str(serial_number).strip()
-            result = df[df['Numero de Serie'].astype(str).str.strip() == search_term]
-            
-            if not result.empty:
-                return result.iloc[0].to_dict()
-            return None
+            # Caché validada + índice por serie: sin escaneo ni copia por consulta
+            self._get_frame()
+            with self._lock:
+                df = self._get_indexed_frame(self.serial_index)
+                
+                # Validar DataFrame vacío
+                if df.empty:
+                    return []
+                
+                positions = self.serial_index.lookup(serial_number)
+                visits = df.iloc[positions]
+                if 'Fecha de Recepcion' in visits.columns and len(visits) > 1:
+                    # Orden estable: visitas del mismo día conservan el orden de archivo
+                    visits = visits.sort_values('Fecha de Recepcion', kind='stable', na_position='last')
+                return visits.to_dict('records')
             
         except Exception as e:
             # Mantener consistencia con el patrón de logging existente
             print(f"Error finding record: {e}")
-            return None 
\ No newline at end of file
+            return []
+
+    def suggest_serials(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Sugiere números de serie que empiezan por `prefix` (sin distinguir mayúsculas).
+        
+        Pensada para llamarse en cada pulsación: una vez construido, el
+        índice de prefijos se consulta sin revalidar la firma del archivo,
+        por lo que no se accede al disco. Se actualiza con cada guardado
+        propio y en la siguiente relectura de los datos.
+        
+        Args:
+            prefix (str): Texto tecleado
+            limit (Optional[int]): Máximo de sugerencias (por defecto
+                Config.SUGGEST_LIMIT)
+            
+        Returns:
+            List[str]: Series coincidentes en orden alfabético
+        """
+        limit = limit or Config.SUGGEST_LIMIT
+        if not prefix or not str(prefix).strip():
+            return []
+        try:
+            if self.prefix_index.version is None:
+                self._get_frame()
+            with self._lock:
+                if self.prefix_index.version is None:
+                    self._get_indexed_frame(self.prefix_index)
+                return self.prefix_index.lookup(prefix, limit)
+        except Exception as e:
+            print(f"Error suggesting serials: {e}")
+            return []
+
+    def search_text(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Busca registros por palabras de la descripción del problema o del historial.
+        
+        Usa el índice invertido (sin acentos ni mayúsculas): se devuelven
+        los registros que contienen todos los términos, ordenados por
+        relevancia.
+        
+        Args:
+            query (str): Texto libre, p. ej. "pantalla" o "disco duro"
+            limit (Optional[int]): Máximo de resultados (por defecto
+                Config.TEXT_SEARCH_LIMIT)
+            
+        Returns:
+            List[Dict]: Registros coincidentes, el más relevante primero
+        """
+        limit = limit or Config.TEXT_SEARCH_LIMIT
+        if not query or not str(query).strip():
+            return []
+        try:
+            self._get_frame()
+            with self._lock:
+                df = self._get_indexed_frame(self.text_index)
+                if df.empty:
+                    return []
+                hits = self.text_index.query(query, limit)
+                return [df.iloc[position].to_dict() for position, _ in hits]
+        except Exception as e:
+            print(f"Error searching text: {e}")
+            return []
+
+    def query(self, status=None, equipment_type=None, technician=None,
+              received_from=None, received_to=None,
+              delivered_from=None, delivered_to=None,
+              page_size: Optional[int] = None) -> QueryResult:
+        """
+        Consulta registros combinando varios criterios (AND entre criterios).
+        
+        Se resuelve con los índices precalculados: mapas de bits por valor
+        para Estado, Tipo de Equipo y Responsable Recepcion, y búsqueda
+        binaria sobre las fechas ordenadas para los rangos. Por ejemplo, los
+        equipos en 'Recibido' con más de 15 días:
+        
+            dm.query(status='Recibido',
+                     received_to=pd.Timestamp.today().normalize() - pd.Timedelta(days=15))
+        
+        Args:
+            status: Estado o lista de estados aceptados
+            equipment_type: Tipo de Equipo o lista de tipos
+            technician: Responsable Recepcion o lista de responsables
+            received_from: Fecha de Recepcion mínima (incluida)
+            received_to: Fecha de Recepcion máxima (incluida)
+            delivered_from: Fecha de Entrega mínima (incluida)
+            delivered_to: Fecha de Entrega máxima (incluida)
+            page_size (Optional[int]): Registros por página (por defecto
+                Config.QUERY_PAGE_SIZE)
+            
+        Returns:
+            QueryResult: Resultado paginado en orden de archivo; los
+                registros se materializan al recorrer cada página
+        """
+        page_size = page_size or Config.QUERY_PAGE_SIZE
+        self._get_frame()
+        with self._lock:
+            df = self._get_indexed_frame(self.bitmap_index, self.date_index)
+            mask = np.ones(len(df), dtype=bool)
+            for column, values in (('Estado', status),
+                                   ('Tipo de Equipo', equipment_type),
+                                   ('Responsable Recepcion', technician)):
+                if values is not None:
+                    mask &= self.bitmap_index.mask(column, values)
+            for column, start, end in (('Fecha de Recepcion', received_from, received_to),
+                                       ('Fecha de Entrega', delivered_from, delivered_to)):
+                if start is not None or end is not None:
+                    mask &= self.date_index.mask(column, start, end)
+            return QueryResult(df, np.flatnonzero(mask), page_size)
+
+    def get_stats(self) -> Dict:
+        """
+        Devuelve los agregados del dashboard (ver StatsEngine.snapshot()).
+        
+        Los guardados de esta instancia actualizan los contadores sin
+        recalcular; solo se recalculan cuando el archivo cambió externamente.
+        
+        Returns:
+            Dict: Agregados actuales (vacíos si no se pudieron leer los datos)
+        """
+        try:
+            self._get_frame()
+            with self._lock:
+                self._get_indexed_frame(self.stats)
+                return self.stats.snapshot()
+        except Exception as e:
+            print(f"Error computing stats: {e}")
+            return StatsEngine().snapshot()
+
+    def scan_serial(self, serial_number: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Busca un número de serie recorriendo los datos en streaming.
+        
+        Alternativa a find_all_by_serial() que no carga el inventario ni
+        construye índices: útil para consultas puntuales sobre inventarios
+        muy grandes. La lectura se detiene al alcanzar `limit` coincidencias.
+        
+        Args:
+            serial_number (str): Serial number to search for
+            limit (Optional[int]): Máximo de coincidencias (None = todas)
+            
+        Returns:
+            List[Dict]: Matching records in file order
+            
+        Raises:
+            ValueError: If serial_number is None or empty
+        """
+        if not serial_number or not str(serial_number).strip():
+            raise ValueError(Config.MSG_ERROR_SERIAL_VACIO)
+        
+        key = normalize_serial(serial_number)
+        matches: List[Dict] = []
+        try:
+            for chunk in self.iter_chunks():
+                if SERIAL_COLUMN not in chunk.columns:
+                    continue
+                hits = chunk[chunk[SERIAL_COLUMN].map(normalize_serial) == key]
+                for record in hits.to_dict('records'):
+                    matches.append(record)
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+        except Exception as e:
+            print(f"Error scanning records: {e}")
+        return matches
+
+    def export_to_excel(self, destination: Optional[Path] = None) -> Optional[Path]:
+        """
+        Exporta todos los registros a un libro Excel bajo demanda.
+        
+        Con el backend SQLite mantiene actualizado el libro que el personal
+        sigue abriendo en la ruta activa. Los registros se leen y escriben
+        por bloques (ver iter_chunks()), sin cargar el inventario completo.
+        
+        Args:
+            destination (Optional[Path]): Ruta destino; por defecto la ruta
+                activa del libro Excel
+            
+        Returns:
+            Optional[Path]: Ruta del libro exportado, o None si falló
+        """
+        destination = Path(destination) if destination else self.active_path
+        if destination == self.backend.path:
+            # El backend Excel ya escribe en ese libro: no hay nada que exportar
+            return destination
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            # Libro en modo de solo escritura: las filas se vuelcan por bloques
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            header_written = False
+            for chunk in self.iter_chunks():
+                if not header_written:
+                    sheet.append(list(chunk.columns))
+                    header_written = True
+                for row in chunk.itertuples(index=False, name=None):
+                    sheet.append([to_cell_value(value) for value in row])
+            if not header_written:
+                sheet.append(list(self.columns))
+            save_workbook_atomic(workbook, destination)
+            return destination
+        except Exception as e:
+            print(f"Error exporting data: {e}")
+            return None
@@ -7,26 +7,51 @@ Version: 1.0
 Date: 05/08/2025
 """
 
+import time
 from PyQt6.QtCore import QThread, pyqtSignal
-from src.data_manager import DataManager
+from src.config import Config
 
 
 class DataManagerInitializer(QThread):
     """
     Thread para inicializar DataManager de forma asíncrona.
     Previene el bloqueo de la UI durante la inicialización.
+    
+    La inicialización se divide en etapas (ruta de red, archivo de datos,
+    lectura y tipado, índices). Cada etapa emite su mensaje y su duración,
+    de modo que el splash muestra el progreso y la ventana principal se
+    abre con la caché y los índices listos.
     """
     
-    # Señal emitida cuando la inicialización se completa exitosamente
-    finished = pyqtSignal(DataManager)
+    # Señal emitida cuando la inicialización se completa exitosamente (DataManager).
+    # Se declara como object para no importar DataManager (y pandas) en el hilo de la UI.
+    finished = pyqtSignal(object)
     
     # Señal emitida si ocurre un error durante la inicialización
     error = pyqtSignal(str)
     
+    # Señal emitida al iniciar cada etapa (mensaje para el splash)
+    stage_started = pyqtSignal(str)
+    
+    # Señal emitida al terminar cada etapa (clave de la etapa, segundos)
+    stage_finished = pyqtSignal(str, float)
+    
+    # Señal de progreso global (porcentaje 0-100)
+    progress = pyqtSignal(int)
+    
+    # Etapas en orden: (clave, mensaje para el splash)
+    STAGES = [
+        ("probe", Config.MSG_INICIO_RED),
+        ("storage", Config.MSG_INICIO_ARCHIVO),
+        ("load", Config.MSG_INICIO_DATOS),
+        ("indexes", Config.MSG_INICIO_INDICES),
+    ]
+    
     def __init__(self):
         """Inicializa el thread de inicialización."""
         super().__init__()
         self.data_manager = None
+        self.timings = {}
     
     def run(self):
         """
@@ -34,12 +59,33 @@ class DataManagerInitializer(QThread):
         Emite señales según el resultado.
         """
         try:
-            # Inicializar DataManager (operación potencialmente lenta)
-            self.data_manager = DataManager()
+            actions = {
+                "probe": self._probe_network,
+                "storage": lambda: self.data_manager.open_storage(),
+                "load": lambda: self.data_manager.current_frame(),
+                "indexes": lambda: self.data_manager.warm_up(),
+            }
+            for number, (stage, message) in enumerate(self.STAGES):
+                self.stage_started.emit(message)
+                started = time.perf_counter()
+                actions[stage]()
+                elapsed = time.perf_counter() - started
+                self.timings[stage] = elapsed
+                print(f"INFO: Etapa de inicio '{stage}' completada en {elapsed:.2f} s.")
+                self.stage_finished.emit(stage, elapsed)
+                self.progress.emit(int(100 * (number + 1) / len(self.STAGES)))
             
             # Emitir señal de éxito con el DataManager inicializado
             self.finished.emit(self.data_manager)
             
         except Exception as e:
             # Emitir señal de error con el mensaje de excepción
-            self.error.emit(str(e)) 
\ No newline at end of file
+            self.error.emit(str(e))
+    
+    def _probe_network(self):
+        # pandas y openpyxl se importan aquí, en el hilo secundario,
+        # mientras el splash ya se está pintando
+        from src.data_manager import DataManager
+        
+        # Solo se resuelve la ruta activa (red o local); el almacenamiento se abre en la etapa siguiente
+        self.data_manager = DataManager(open_storage=False)
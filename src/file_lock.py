@@ -0,0 +1,139 @@
+"""
+File Lock module for RETI-C application.
+Cross-workstation exclusive lock based on a lock file next to the workbook.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+def sidecar_path(workbook_path: Path, suffix: str) -> Path:
+    """
+    Construye la ruta de un archivo auxiliar junto al libro de trabajo.
+
+    Args:
+        workbook_path (Path): Ruta del libro Excel
+        suffix (str): Sufijo del archivo auxiliar (p. ej. ".lock")
+
+    Returns:
+        Path: Ruta del archivo auxiliar (".<nombre><sufijo>")
+    """
+    workbook_path = Path(workbook_path)
+    return workbook_path.with_name(f".{workbook_path.name}{suffix}")
+
+
+class FileLock:
+    """
+    Bloqueo exclusivo entre procesos y estaciones mediante un archivo .lock.
+
+    La creación con O_CREAT | O_EXCL es atómica también en recursos SMB,
+    por lo que solo una estación puede poseer el bloqueo a la vez. El
+    archivo guarda un testigo único del poseedor: al liberar solo se borra
+    si el testigo sigue siendo el propio (otra estación pudo haberlo dado
+    por abandonado y tomado). Un bloqueo ajeno se considera abandonado (p.
+    ej. por un cierre inesperado) cuando su testigo y su mtime no cambian
+    durante `stale_after` segundos medidos con el reloj local; así no se
+    compara el reloj del servidor SMB con el de la estación.
+    """
+
+    # Bloqueos ajenos observados: ruta -> (testigo, mtime_ns, instante local de
+    # la primera observación). Compartido entre instancias para que varios
+    # intentos de guardado acumulen el tiempo de observación.
+    _observed: Dict[str, Tuple[bytes, int, float]] = {}
+    _observed_lock = threading.Lock()
+
+    def __init__(self, path: Path, timeout: float = 10.0, stale_after: float = 60.0,
+                 poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._token: Optional[bytes] = None
+
+    def acquire(self) -> None:
+        """
+        Adquiere el bloqueo, esperando hasta `timeout` segundos.
+
+        Raises:
+            TimeoutError: Si otra estación mantiene el bloqueo más tiempo
+        """
+        token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}".encode("utf-8")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, token)
+                self._token = token
+                return
+            except FileExistsError:
+                self._remove_if_stale()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No se pudo obtener el bloqueo de escritura: {self.path}")
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        """Libera el bloqueo si está en posesión de este proceso."""
+        if self._fd is None:
+            return
+        token, self._token = self._token, None
+        try:
+            os.close(self._fd)
+        finally:
+            self._fd = None
+            if self._read_token() == token:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+            else:
+                print(f"ADVERTENCIA: El bloqueo ya pertenece a otra estación; no se elimina ({self.path}).")
+
+    def _read_token(self) -> Optional[bytes]:
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _remove_if_stale(self) -> None:
+        token = self._read_token()
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        key = str(self.path)
+        now = time.monotonic()
+        with self._observed_lock:
+            observed = self._observed.get(key)
+            if observed is None or observed[:2] != (token, mtime_ns):
+                self._observed[key] = (token, mtime_ns, now)
+                return
+            if now - observed[2] <= self.stale_after:
+                return
+            del self._observed[key]
+        # Solo se elimina si sigue siendo el mismo bloqueo observado
+        if self._read_token() != token:
+            return
+        print(f"ADVERTENCIA: Eliminando bloqueo abandonado ({self.path}).")
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
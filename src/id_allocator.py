@@ -0,0 +1,93 @@
+"""
+ID Allocator module for RETI-C application.
+Keeps the ID high-water mark so new IDs do not require re-parsing the workbook.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional
+
+from .file_lock import sidecar_path
+
+
+class IdAllocator:
+    """
+    Asigna IDs consecutivos a partir de la marca máxima (high-water mark).
+
+    La marca se guarda en memoria y en un archivo auxiliar junto al libro
+    (".<libro>.ids.json") acompañada de la firma del libro al momento de
+    escribirla. Si la firma coincide con la del libro actual, la marca es
+    válida y no hace falta procesar el Excel; si no coincide, se recalcula
+    a partir de los datos.
+
+    La asignación debe hacerse con el bloqueo de escritura adquirido para
+    que dos estaciones no obtengan el mismo ID.
+    """
+
+    def __init__(self, workbook_path: Path):
+        self.path = sidecar_path(workbook_path, ".ids.json")
+        self._high_water_mark: Optional[int] = None
+        self._signature: Optional[list] = None
+
+    def next_id(self, signature, compute_max: Callable[[], int]) -> int:
+        """
+        Devuelve el siguiente ID disponible sin reservarlo.
+
+        Args:
+            signature: Firma actual del libro (ver DataManager._file_signature)
+            compute_max (Callable[[], int]): Calcula el ID máximo desde los datos;
+                solo se invoca si ninguna marca conocida es válida
+
+        Returns:
+            int: Siguiente ID disponible
+        """
+        return self._current_max(signature, compute_max) + 1
+
+    def commit(self, high_water_mark: int, signature) -> None:
+        """
+        Registra la nueva marca máxima tras una escritura exitosa.
+
+        Args:
+            high_water_mark (int): Mayor ID presente en el libro
+            signature: Firma del libro después de la escritura
+        """
+        self._high_water_mark = int(high_water_mark)
+        self._signature = list(signature) if signature is not None else None
+        if self._signature is None:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"high_water_mark": self._high_water_mark,
+                           "signature": self._signature}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # La marca en disco es una optimización: sin ella se recalcula
+            print(f"ADVERTENCIA: No se pudo guardar la marca de IDs ({e}).")
+
+    def _current_max(self, signature, compute_max: Callable[[], int]) -> int:
+        current = list(signature) if signature is not None else None
+        if current is not None:
+            if self._signature == current and self._high_water_mark is not None:
+                return self._high_water_mark
+            stored = self._read_sidecar()
+            if stored is not None and stored.get("signature") == current:
+                self._high_water_mark = int(stored["high_water_mark"])
+                self._signature = current
+                return self._high_water_mark
+        high_water_mark = int(compute_max())
+        self._high_water_mark = high_water_mark
+        self._signature = current
+        return high_water_mark
+
+    def _read_sidecar(self) -> Optional[dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
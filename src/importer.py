@@ -0,0 +1,93 @@
+"""
+Importer module for RETI-C application.
+Streams legacy tracking spreadsheets (CSV/XLSX) into the inventory in chunks.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterator, List
+import pandas as pd
+
+from .config import Config
+from .storage.streaming import iter_xlsx_chunks
+
+
+def _normalize_header(name) -> str:
+    """Normaliza un encabezado para compararlo sin acentos, mayúsculas ni espacios extra."""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
+_HEADER_MAP = {_normalize_header(col): col for col in Config.COLUMNS}
+
+
+def _map_headers(headers: List) -> List[str]:
+    """Traduce los encabezados del archivo a los nombres de Config.COLUMNS cuando coinciden."""
+    return [_HEADER_MAP.get(_normalize_header(header), str(header)) for header in headers]
+
+
+def _iter_csv_chunks(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    for chunk in pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+        chunk.columns = _map_headers(list(chunk.columns))
+        yield chunk
+
+
+def iter_source_chunks(path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Recorre un archivo CSV o XLSX en bloques de `chunk_size` filas.
+
+    Args:
+        path (Path): Archivo de origen
+        chunk_size (int): Filas por bloque
+
+    Returns:
+        Iterator[pd.DataFrame]: Bloques con los encabezados ya traducidos
+
+    Raises:
+        ValueError: Si la extensión del archivo no es compatible
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return _iter_csv_chunks(path, chunk_size)
+    if suffix in (".xlsx", ".xlsm"):
+        return iter_xlsx_chunks(path, chunk_size, map_headers=_map_headers)
+    raise ValueError(f"Formato de archivo no compatible: {path.suffix}")
+
+
+def import_file(data_manager, path: Path, chunk_size: int = None) -> Dict:
+    """
+    Importa un archivo de seguimiento heredado al inventario.
+
+    El archivo se lee por bloques para acotar la memoria; cada bloque se
+    valida y se guarda con una sola escritura mediante
+    DataManager.add_records(). Las filas rechazadas se informan con su
+    número de fila en el archivo de origen (el encabezado es la fila 1).
+
+    Args:
+        data_manager: Instancia de DataManager destino
+        path (Path): Archivo CSV o XLSX de origen
+        chunk_size (int): Filas por bloque (por defecto Config.IMPORT_CHUNK_SIZE)
+
+    Returns:
+        Dict: Reporte con 'added', 'rejected' (lista de {'row', 'reason'}),
+            'chunks' e 'ids' (lista de rangos (primer_id, último_id))
+    """
+    chunk_size = chunk_size or Config.IMPORT_CHUNK_SIZE
+    report = {'added': 0, 'rejected': [], 'chunks': 0, 'ids': []}
+    next_row = 2  # Fila 1 = encabezados
+    for chunk in iter_source_chunks(path, chunk_size):
+        chunk_report = data_manager.add_records(chunk.to_dict('records'), row_offset=next_row)
+        report['added'] += chunk_report['added']
+        report['rejected'].extend(chunk_report['rejected'])
+        report['chunks'] += 1
+        if chunk_report['first_id'] is not None:
+            report['ids'].append((chunk_report['first_id'], chunk_report['last_id']))
+        next_row += len(chunk)
+    return report
+
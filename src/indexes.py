@@ -0,0 +1,502 @@
+"""
+Indexes module for RETI-C application.
+In-memory lookup structures built from the inventory DataFrame.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import bisect
+import math
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+SERIAL_COLUMN = "Numero de Serie"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Palabras demasiado frecuentes para distinguir registros
+_STOPWORDS = frozenset({
+    "de", "del", "la", "las", "el", "los", "en", "y", "o", "a", "al", "un",
+    "una", "con", "por", "para", "se", "no", "que", "su", "sin", "es",
+})
+
+
+def normalize_serial(value) -> str:
+    """
+    Normaliza un número de serie para usarlo como clave de índice.
+
+    Args:
+        value: Valor de la celda o término de búsqueda
+
+    Returns:
+        str: Serie sin espacios laterales; cadena vacía para valores nulos
+    """
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    # Series numéricas leídas como float (12345.0) deben coincidir con "12345"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+class SerialIndex:
+    """
+    Índice hash de número de serie normalizado -> posiciones de fila.
+
+    Se construye una vez por versión de datos y se actualiza de forma
+    incremental cuando DataManager añade registros.
+    """
+
+    def __init__(self):
+        self._positions: Dict[str, List[int]] = {}
+        self.version: Optional[int] = None
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Reconstruye el índice a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponde el índice
+        """
+        self._positions = {}
+        if SERIAL_COLUMN in df.columns:
+            for position, value in enumerate(df[SERIAL_COLUMN].tolist()):
+                self._insert(position, value)
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Registra una fila nueva añadida al final de los datos.
+
+        Args:
+            position (int): Posición de la fila en el DataFrame
+            record (Dict): Datos del registro
+        """
+        self._insert(position, record.get(SERIAL_COLUMN))
+
+    def _insert(self, position: int, value) -> None:
+        key = normalize_serial(value)
+        if key:
+            self._positions.setdefault(key, []).append(position)
+
+    def lookup(self, serial_number) -> List[int]:
+        """
+        Devuelve las posiciones de todas las filas con el número de serie dado.
+
+        Args:
+            serial_number: Número de serie a buscar
+
+        Returns:
+            List[int]: Posiciones de fila (vacía si no hay coincidencias)
+        """
+        return list(self._positions.get(normalize_serial(serial_number), ()))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class PrefixIndex:
+    """
+    Índice ordenado de números de serie para búsqueda por prefijo.
+
+    Guarda las series distintas en un arreglo ordenado por su forma sin
+    distinción de mayúsculas; una consulta es una búsqueda binaria más un
+    recorrido de las coincidencias, O(log n + k), sin tocar el DataFrame.
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._serials: List[str] = []
+        self.version: Optional[int] = None
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Reconstruye el índice a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponde el índice
+        """
+        serials = set()
+        if SERIAL_COLUMN in df.columns:
+            serials = {normalize_serial(value) for value in df[SERIAL_COLUMN].tolist()}
+        serials.discard("")
+        entries = sorted((serial.casefold(), serial) for serial in serials)
+        self._keys = [key for key, _ in entries]
+        self._serials = [serial for _, serial in entries]
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Registra la serie de una fila nueva (si no estaba ya indexada).
+
+        Args:
+            position (int): Posición de la fila en el DataFrame (no se usa)
+            record (Dict): Datos del registro
+        """
+        serial = normalize_serial(record.get(SERIAL_COLUMN))
+        if not serial:
+            return
+        key = serial.casefold()
+        slot = bisect.bisect_left(self._keys, key)
+        while slot < len(self._keys) and self._keys[slot] == key:
+            if self._serials[slot] == serial:
+                return
+            slot += 1
+        self._keys.insert(slot, key)
+        self._serials.insert(slot, serial)
+
+    def lookup(self, prefix, limit: int = 20) -> List[str]:
+        """
+        Devuelve las series que empiezan por `prefix`, en orden alfabético.
+
+        Args:
+            prefix: Texto tecleado (se ignoran mayúsculas y espacios laterales)
+            limit (int): Máximo de sugerencias
+
+        Returns:
+            List[str]: Series coincidentes tal como están en los datos
+        """
+        key = normalize_serial(prefix).casefold()
+        if not key:
+            return []
+        start = bisect.bisect_left(self._keys, key)
+        matches = []
+        for slot in range(start, min(start + limit, len(self._keys))):
+            if not self._keys[slot].startswith(key):
+                break
+            matches.append(self._serials[slot])
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def tokenize(text) -> List[str]:
+    """
+    Divide un texto en términos para el índice de texto completo.
+
+    Elimina acentos y mayúsculas ("Pantalla", "pantálla" -> "pantalla") y
+    descarta las palabras vacías y los términos de una sola letra.
+
+    Args:
+        text: Texto de la celda o consulta (los nulos producen [])
+
+    Returns:
+        List[str]: Términos en orden de aparición (con repeticiones)
+    """
+    if text is None:
+        return []
+    try:
+        if pd.isna(text):
+            return []
+    except (TypeError, ValueError):
+        pass
+    folded = unicodedata.normalize("NFKD", str(text))
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch)).casefold()
+    return [token for token in _TOKEN_RE.findall(folded)
+            if len(token) > 1 and token not in _STOPWORDS]
+
+
+class TextIndex:
+    """
+    Índice invertido término -> {posición de fila: frecuencia}.
+
+    Cubre las columnas de texto largo indicadas (descripción del problema e
+    historial). Las consultas exigen todos los términos y ordenan los
+    resultados por TF-IDF, de modo que nunca se recorren las columnas.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_count = 0
+        self.version: Optional[int] = None
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Reconstruye el índice a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponde el índice
+        """
+        self._postings = {}
+        self._doc_count = 0
+        columns = [col for col in self.columns if col in df.columns]
+        if columns:
+            for position, values in enumerate(df[columns].itertuples(index=False, name=None)):
+                self._insert(position, values)
+        self._doc_count = len(df)
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Registra una fila nueva añadida al final de los datos.
+
+        Args:
+            position (int): Posición de la fila en el DataFrame
+            record (Dict): Datos del registro
+        """
+        self._insert(position, [record.get(col) for col in self.columns])
+        self._doc_count = max(self._doc_count, position + 1)
+
+    def _insert(self, position: int, values) -> None:
+        for value in values:
+            for token in tokenize(value):
+                postings = self._postings.setdefault(token, {})
+                postings[position] = postings.get(position, 0) + 1
+
+    def query(self, text, limit: int = 50) -> List[Tuple[int, float]]:
+        """
+        Busca las filas que contienen todos los términos de `text`.
+
+        Args:
+            text: Consulta libre (p. ej. "disco duro")
+            limit (int): Máximo de resultados
+
+        Returns:
+            List[Tuple[int, float]]: (posición, puntuación) de mayor a menor
+                puntuación; a igual puntuación, las filas más recientes primero
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms:
+            return []
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return []
+        # Intersección empezando por el término menos frecuente
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        scores = {}
+        for posting in postings:
+            idf = math.log(1 + self._doc_count / len(posting))
+            for position in candidates:
+                scores[position] = scores.get(position, 0.0) + (1 + math.log(posting[position])) * idf
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit]
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+
+class BitmapIndex:
+    """
+    Mapas de bits por valor para columnas de pocos valores distintos.
+
+    Para cada columna y valor guarda un arreglo booleano con una posición
+    por fila; un filtro es un OR de los mapas de los valores pedidos, y
+    varios filtros se combinan con AND sin recorrer el DataFrame. Los
+    arreglos crecen por duplicación para que añadir filas sea amortizado O(1).
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self._bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        self._size = 0
+        self._capacity = 0
+        self.version: Optional[int] = None
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Reconstruye los mapas a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponde el índice
+        """
+        self._size = len(df)
+        self._capacity = max(self._size, 1)
+        self._bitmaps = {}
+        for col in self.columns:
+            bitmaps = {}
+            if col in df.columns:
+                values = df[col]
+                if not isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype("category")
+                codes = values.cat.codes.to_numpy()
+                for code, category in enumerate(values.cat.categories):
+                    key = _bitmap_key(category)
+                    bitmap = bitmaps.get(key)
+                    hits = codes == code
+                    bitmaps[key] = hits if bitmap is None else bitmap | hits
+            self._bitmaps[col] = bitmaps
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Registra una fila nueva añadida al final de los datos.
+
+        Args:
+            position (int): Posición de la fila en el DataFrame
+            record (Dict): Datos del registro
+        """
+        if position >= self._capacity:
+            self._grow(max(position + 1, self._capacity * 2))
+        self._size = max(self._size, position + 1)
+        for col in self.columns:
+            key = _bitmap_key(record.get(col))
+            if key is None:
+                continue
+            bitmaps = self._bitmaps.setdefault(col, {})
+            if key not in bitmaps:
+                bitmaps[key] = np.zeros(self._capacity, dtype=bool)
+            bitmaps[key][position] = True
+
+    def _grow(self, capacity: int) -> None:
+        for bitmaps in self._bitmaps.values():
+            for key, bitmap in bitmaps.items():
+                grown = np.zeros(capacity, dtype=bool)
+                grown[:len(bitmap)] = bitmap
+                bitmaps[key] = grown
+        self._capacity = capacity
+
+    def mask(self, column: str, values) -> np.ndarray:
+        """
+        Devuelve el mapa de las filas cuyo valor en `column` está en `values`.
+
+        Args:
+            column (str): Columna indexada
+            values: Valor o lista de valores aceptados
+
+        Returns:
+            np.ndarray: Arreglo booleano con una posición por fila
+        """
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        result = np.zeros(self._size, dtype=bool)
+        bitmaps = self._bitmaps.get(column, {})
+        for value in values:
+            bitmap = bitmaps.get(_bitmap_key(value))
+            if bitmap is not None:
+                result |= bitmap[:self._size]
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _bitmap_key(value) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    key = str(value).strip()
+    return key or None
+
+
+class DateIndex:
+    """
+    Índice ordenado de fechas para consultas por rango.
+
+    Para cada columna guarda las fechas (en nanosegundos) ordenadas junto
+    con la posición de su fila; un rango se resuelve con dos búsquedas
+    binarias (np.searchsorted). Las filas sin fecha no se indexan.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self._values: Dict[str, np.ndarray] = {}
+        self._positions: Dict[str, np.ndarray] = {}
+        self._size = 0
+        self.version: Optional[int] = None
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Reconstruye el índice a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponde el índice
+        """
+        self._size = len(df)
+        for col in self.columns:
+            if col in df.columns:
+                dates = pd.to_datetime(df[col], errors="coerce").to_numpy(dtype="datetime64[ns]")
+            else:
+                dates = np.array([], dtype="datetime64[ns]")
+            valid = ~np.isnat(dates)
+            positions = np.flatnonzero(valid)
+            values = dates[valid].astype(np.int64)
+            order = np.argsort(values, kind="stable")
+            self._values[col] = values[order]
+            self._positions[col] = positions[order]
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Registra una fila nueva añadida al final de los datos.
+
+        Args:
+            position (int): Posición de la fila en el DataFrame
+            record (Dict): Datos del registro
+        """
+        self._size = max(self._size, position + 1)
+        for col in self.columns:
+            value = _to_nanoseconds(record.get(col))
+            if value is None:
+                continue
+            values = self._values.get(col, np.array([], dtype=np.int64))
+            slot = int(np.searchsorted(values, value, side="right"))
+            self._values[col] = np.insert(values, slot, value)
+            self._positions[col] = np.insert(self._positions.get(col, np.array([], dtype=np.int64)),
+                                             slot, position)
+
+    def mask(self, column: str, start=None, end=None) -> np.ndarray:
+        """
+        Devuelve el mapa de las filas con fecha dentro de [start, end].
+
+        Args:
+            column (str): Columna indexada
+            start: Fecha mínima incluida (None o no interpretable = sin límite)
+            end: Fecha máxima incluida (None o no interpretable = sin límite)
+
+        Returns:
+            np.ndarray: Arreglo booleano con una posición por fila; sin
+                ningún límite válido no se filtra (todas las filas)
+        """
+        values = self._values.get(column, np.array([], dtype=np.int64))
+        start_ns = None if start is None else _to_nanoseconds(start)
+        end_ns = None if end is None else _to_nanoseconds(end)
+        if start_ns is None and end_ns is None:
+            return np.ones(self._size, dtype=bool)
+        low = 0 if start_ns is None else int(np.searchsorted(values, start_ns, side="left"))
+        high = len(values) if end_ns is None else int(np.searchsorted(values, end_ns, side="right"))
+        result = np.zeros(self._size, dtype=bool)
+        if high > low:
+            result[self._positions[column][low:high]] = True
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _to_nanoseconds(value) -> Optional[int]:
+    try:
+        timestamp = pd.Timestamp(value)
+    except (TypeError, ValueError):
+        return None
+    if pd.isna(timestamp):
+        return None
+    # .value siempre está en nanosegundos, sea cual sea la resolución
+    return int(timestamp.value)
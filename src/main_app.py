@@ -1,26 +1,38 @@
 # src/main_app.py
 import sys
+import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QStackedWidget, QStatusBar)
-from PyQt6.QtCore import Qt
+                             QHBoxLayout, QPushButton, QStackedWidget, QStatusBar,
+                             QLabel, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer
 from src.config import Config
-from src.data_manager import DataManager
-from src.views.registration_view import RegistrationView
+from src.save_worker import SaveWorker
 from src.views.dashboard_view import DashboardView
-from src.views.search_view import SearchView
 
 class MainApp(QMainWindow):
     """
     La ventana principal de la aplicación RETI-C.
     Actúa como el contenedor principal, gestionando la navegación entre vistas.
     """
-    def __init__(self, data_manager=None):
+    def __init__(self, data_manager=None, startup_started: float = None):
+        """
+        Args:
+            data_manager: Instancia de DataManager (puede ser None inicialmente)
+            startup_started: Instante de inicio del proceso (time.perf_counter())
+                para medir el tiempo hasta el primer cuadro; por defecto, la
+                creación de la ventana
+        """
         super().__init__()
+        self._startup_started = startup_started if startup_started is not None else time.perf_counter()
+        self._first_frame_pending = True
+        self.time_to_first_frame = None
         self.setWindowTitle(f"{Config.APP_NAME} v{Config.APP_VERSION}")
         self.setGeometry(*Config.WINDOW_MAIN_GEOMETRY)
 
         # Inicializar servicios (DataManager puede ser None inicialmente)
         self.data_manager = data_manager
+        self.save_worker = SaveWorker(self.data_manager) if self.data_manager else None
+        self.connectivity_monitor = None
         
         # Cargar estilos CFE
         self.load_styles()
@@ -37,6 +49,7 @@ class MainApp(QMainWindow):
         # Configurar estado de conexión en la barra de estado (solo si DataManager está disponible)
         if self.data_manager:
             self.update_connection_status()
+            self.start_connectivity_monitor()
 
     def setup_ui(self):
         """Configura la interfaz de usuario principal."""
@@ -76,6 +89,7 @@ class MainApp(QMainWindow):
         self.btn_dashboard = QPushButton("🏠 Dashboard")
         self.btn_registro = QPushButton("➕ Registrar Equipo")
         self.btn_busqueda = QPushButton("🔍 Consultar")
+        self.btn_inventario = QPushButton("📋 Inventario")
         
         # Aplicar estilos CFE a los botones de navegación
         nav_button_style = f"""
@@ -105,86 +119,154 @@ class MainApp(QMainWindow):
         self.btn_dashboard.setObjectName("nav_button")
         self.btn_registro.setObjectName("nav_button")
         self.btn_busqueda.setObjectName("nav_button")
+        self.btn_inventario.setObjectName("nav_button")
         self.btn_dashboard.setStyleSheet(nav_button_style)
         self.btn_registro.setStyleSheet(nav_button_style)
         self.btn_busqueda.setStyleSheet(nav_button_style)
+        self.btn_inventario.setStyleSheet(nav_button_style)
         
         # Hacer los botones checkables para mostrar estado activo
         self.btn_dashboard.setCheckable(True)
         self.btn_registro.setCheckable(True)
         self.btn_busqueda.setCheckable(True)
+        self.btn_inventario.setCheckable(True)
         self.btn_dashboard.setChecked(True)  # Dashboard activo por defecto
         
         nav_layout.addWidget(self.btn_dashboard)
         nav_layout.addWidget(self.btn_registro)
         nav_layout.addWidget(self.btn_busqueda)
+        nav_layout.addWidget(self.btn_inventario)
         nav_layout.addStretch()
 
         self.main_layout.addWidget(nav_bar)
         
     def setup_stacked_widget(self):
-        """Crea el QStackedWidget y añade todas las vistas."""
+        """
+        Crea el QStackedWidget con el Dashboard y marcadores para el resto de vistas.
+        
+        Solo el Dashboard (vista inicial) se construye aquí. Registro,
+        Consulta e Inventario se crean la primera vez que se navega a ellas
+        (ver _ensure_view) o, si Config.PREBUILD_VIEWS_ON_IDLE está activo,
+        en segundo plano cuando la ventana ya es visible.
+        """
         self.stacked_widget = QStackedWidget()
         self.main_layout.addWidget(self.stacked_widget)
+        
+        self.registration_page = None
+        self.search_page = None
+        self.inventory_page = None
+        
+        # Índice -> (atributo, fábrica, nombre para mensajes)
+        self._view_factories = {
+            1: ('registration_page', self._create_registration_view, "registro"),
+            2: ('search_page', self._create_search_view, "búsqueda"),
+            3: ('inventory_page', self._create_inventory_view, "inventario"),
+        }
 
-        # Crear instancias de las vistas con manejo de errores
         try:
             # Dashboard siempre se puede crear
-            self.dashboard_page = DashboardView()
+            self.dashboard_page = DashboardView(self.data_manager)
             self.stacked_widget.addWidget(self.dashboard_page)    # Índice 0
             
-            # Crear vistas que requieren DataManager (pueden ser None inicialmente)
-            try:
-                self.registration_page = RegistrationView(self.data_manager) if self.data_manager else None
-                if self.registration_page:
-                    self.stacked_widget.addWidget(self.registration_page) # Índice 1
-                else:
-                    from PyQt6.QtWidgets import QLabel
-                    placeholder_reg = QLabel("Cargando vista de registro...")
-                    placeholder_reg.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    placeholder_reg.setStyleSheet("font-size: 14px; color: #666;")
-                    self.stacked_widget.addWidget(placeholder_reg)
-            except Exception as e:
-                print(f"Error al crear vista de registro: {e}")
-                from PyQt6.QtWidgets import QLabel
-                placeholder_reg = QLabel("Error al cargar vista de registro")
-                placeholder_reg.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                placeholder_reg.setStyleSheet("font-size: 14px; color: #ff0000;")
-                self.stacked_widget.addWidget(placeholder_reg)
-                
-            try:
-                self.search_page = SearchView(self.data_manager) if self.data_manager else None
-                if self.search_page:
-                    self.stacked_widget.addWidget(self.search_page)       # Índice 2
-                else:
-                    from PyQt6.QtWidgets import QLabel
-                    placeholder_search = QLabel("Cargando vista de búsqueda...")
-                    placeholder_search.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    placeholder_search.setStyleSheet("font-size: 14px; color: #666;")
-                    self.stacked_widget.addWidget(placeholder_search)
-            except Exception as e:
-                print(f"Error al crear vista de búsqueda: {e}")
-                from PyQt6.QtWidgets import QLabel
-                placeholder_search = QLabel("Error al cargar vista de búsqueda")
-                placeholder_search.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                placeholder_search.setStyleSheet("font-size: 14px; color: #ff0000;")
-                self.stacked_widget.addWidget(placeholder_search)
+            # Marcadores ligeros hasta la primera navegación (índices 1, 2 y 3)
+            for index, (_, _, name) in sorted(self._view_factories.items()):
+                self.stacked_widget.addWidget(self._create_placeholder(f"Cargando vista de {name}..."))
             
         except Exception as e:
             print(f"Error crítico al crear las vistas: {e}")
             # En caso de error, mostrar mensaje pero no crashear
-            from PyQt6.QtWidgets import QLabel
             error_label = QLabel(f"Error al cargar las vistas: {e}")
             error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             error_label.setStyleSheet("font-size: 14px; color: #ff0000;")
             self.stacked_widget.addWidget(error_label)
 
+    # Fábricas de vistas diferidas: el módulo de cada vista se importa al construirla
+    def _create_registration_view(self):
+        from src.views.registration_view import RegistrationView
+        return RegistrationView(self.data_manager, self.save_worker)
+
+    def _create_search_view(self):
+        from src.views.search_view import SearchView
+        return SearchView(self.data_manager)
+
+    def _create_inventory_view(self):
+        from src.views.inventory_view import InventoryView
+        return InventoryView(self.data_manager)
+
+    def _create_placeholder(self, text: str, is_error: bool = False) -> QLabel:
+        """Crea el marcador que ocupa el lugar de una vista aún no construida."""
+        placeholder = QLabel(text)
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setStyleSheet(f"font-size: 14px; color: {'#ff0000' if is_error else '#666'};")
+        return placeholder
+
+    def _ensure_view(self, index: int):
+        """
+        Construye la vista del índice dado si aún es un marcador.
+        
+        Sin DataManager la vista no se puede crear y el marcador se mantiene.
+        
+        Args:
+            index: Índice de la vista en el QStackedWidget
+            
+        Returns:
+            La vista construida, o None si el índice no tiene vista diferida
+        """
+        if index not in self._view_factories:
+            return None
+        attribute, factory, name = self._view_factories[index]
+        view = getattr(self, attribute)
+        if view is not None or not self.data_manager:
+            return view
+        
+        placeholder = self.stacked_widget.widget(index)
+        try:
+            view = factory()
+        except Exception as e:
+            print(f"Error al crear vista de {name}: {e}")
+            view = self._create_placeholder(f"Error al cargar vista de {name}", is_error=True)
+            del self._view_factories[index]
+        else:
+            setattr(self, attribute, view)
+        
+        was_current = self.stacked_widget.currentIndex() == index
+        self.stacked_widget.insertWidget(index, view)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            self.stacked_widget.setCurrentIndex(index)
+        return view
+
+    def showEvent(self, event):
+        """Al mostrarse por primera vez, mide el primer cuadro y programa la preconstrucción."""
+        super().showEvent(event)
+        if self._first_frame_pending:
+            self._first_frame_pending = False
+            # singleShot(0) se ejecuta cuando el bucle de eventos ya pintó la ventana
+            QTimer.singleShot(0, self._on_first_frame)
+
+    def _on_first_frame(self):
+        """Registra el tiempo hasta el primer cuadro interactivo (SRS RNF-01)."""
+        self.time_to_first_frame = time.perf_counter() - self._startup_started
+        print(f"INFO: Primer cuadro interactivo en {self.time_to_first_frame:.2f} s.")
+        if Config.PREBUILD_VIEWS_ON_IDLE:
+            QTimer.singleShot(Config.PREBUILD_VIEWS_DELAY_MS, self._prebuild_next_view)
+
+    def _prebuild_next_view(self):
+        """Construye una vista pendiente por ciclo ocioso, sin bloquear la UI de golpe."""
+        for index, (attribute, _, _) in sorted(self._view_factories.items()):
+            if getattr(self, attribute) is None and self.data_manager:
+                self._ensure_view(index)
+                QTimer.singleShot(0, self._prebuild_next_view)
+                return
+
     def setup_navigation_signals(self):
         """Conecta las señales de navegación entre vistas."""
         try:
             self.btn_dashboard.clicked.connect(lambda: self.navigate_to_view(0))
             self.btn_registro.clicked.connect(lambda: self.navigate_to_view(1))
             self.btn_busqueda.clicked.connect(lambda: self.navigate_to_view(2))
+            self.btn_inventario.clicked.connect(lambda: self.navigate_to_view(3))
         except Exception as e:
             print(f"Error al conectar señales de navegación: {e}")
             # Si hay error, intentar conectar las señales de forma más simple
@@ -192,6 +274,7 @@ class MainApp(QMainWindow):
                 self.btn_dashboard.clicked.connect(self._navigate_dashboard)
                 self.btn_registro.clicked.connect(self._navigate_registration)
                 self.btn_busqueda.clicked.connect(self._navigate_search)
+                self.btn_inventario.clicked.connect(self._navigate_inventory)
             except Exception as e2:
                 print(f"Error crítico al conectar señales: {e2}")
 
@@ -206,6 +289,10 @@ class MainApp(QMainWindow):
     def _navigate_search(self):
         """Navegación a la búsqueda."""
         self.navigate_to_view(2)
+
+    def _navigate_inventory(self):
+        """Navegación al inventario."""
+        self.navigate_to_view(3)
     
     def navigate_to_view(self, index: int):
         """
@@ -216,12 +303,15 @@ class MainApp(QMainWindow):
         """
         try:
             if 0 <= index < self.stacked_widget.count():
+                # Las vistas diferidas se construyen en la primera navegación
+                self._ensure_view(index)
                 self.stacked_widget.setCurrentIndex(index)
                 
                 # Actualizar estado visual de botones
                 self.btn_dashboard.setChecked(index == 0)
                 self.btn_registro.setChecked(index == 1)
                 self.btn_busqueda.setChecked(index == 2)
+                self.btn_inventario.setChecked(index == 3)
             else:
                 print(f"Error: Índice de vista inválido: {index}")
         except Exception as e:
@@ -231,9 +321,95 @@ class MainApp(QMainWindow):
         """Configura la barra de estado para mostrar información de conexión."""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        
+        # Indicador permanente de guardados en segundo plano
+        self.pending_saves_label = QLabel("")
+        self.pending_saves_label.setStyleSheet("padding: 0px 10px;")
+        self.status_bar.addPermanentWidget(self.pending_saves_label)
+        
+        if self.save_worker:
+            self.save_worker.pending_changed.connect(self.update_pending_saves)
+            self.save_worker.saved.connect(self.on_record_saved)
+            self.save_worker.failed.connect(self.on_record_save_failed)
+    
+    def update_pending_saves(self, pending: int):
+        """Actualiza el indicador de guardados pendientes en la barra de estado."""
+        if pending > 0:
+            self.pending_saves_label.setText(Config.MSG_GUARDADOS_PENDIENTES.format(count=pending))
+    
+    def on_record_saved(self, serial_number: str):
+        """Confirma en la barra de estado un guardado realizado en segundo plano."""
+        if self.save_worker and self.save_worker.pending == 0:
+            self.pending_saves_label.setText(f"✅ {Config.MSG_EXITO_REGISTRO.format(serial_number=serial_number)}")
+        if self.dashboard_page.isVisible():
+            self.dashboard_page.refresh_stats()
+    
+    def on_record_save_failed(self, serial_number: str, error_message: str, record_data: dict = None):
+        """
+        Notifica al usuario que un guardado en segundo plano falló.
+
+        RegistrationView recupera los datos del registro (ver restore_failed_record).
+        """
+        self.pending_saves_label.setText(f"❌ S/N '{serial_number}' sin guardar")
+        details = f"\n\nS/N: {serial_number}" + (f"\n{error_message}" if error_message else "")
+        if record_data:
+            details += f"\n\n{Config.MSG_REGISTRO_RESTAURADO}"
+        QMessageBox.critical(self, Config.MSG_TITULO_ERROR_GUARDADO, Config.MSG_ERROR_GUARDADO + details)
     
-    def update_connection_status(self):
-        """Actualiza la barra de estado con el estado de conexión actual."""
+    def closeEvent(self, event):
+        """Espera a que terminen los guardados pendientes antes de cerrar."""
+        if self.connectivity_monitor:
+            self.connectivity_monitor.stop()
+        if self.save_worker:
+            self.save_worker.stop()
+        super().closeEvent(event)
+    
+    def start_connectivity_monitor(self):
+        """
+        En modo local, reintenta la conexión de red en segundo plano; en modo
+        red, sube lo guardado en una sesión local anterior (ver ConnectivityMonitor).
+        """
+        if not Config.CONNECTIVITY_MONITOR_ENABLED or not self.data_manager or self.connectivity_monitor:
+            return
+        if self.data_manager.is_network_mode:
+            from src.sync import SyncEngine
+            if not (Config.SYNC_ON_RECONNECT and SyncEngine(self.data_manager).has_local_data()):
+                return
+        from src.connectivity_monitor import ConnectivityMonitor
+        self.connectivity_monitor = ConnectivityMonitor(self.data_manager)
+        self.connectivity_monitor.connection_restored.connect(self.on_connection_restored)
+        self.connectivity_monitor.probe_failed.connect(self.on_connectivity_probe_failed)
+        self.connectivity_monitor.sync_finished.connect(self.on_sync_finished)
+        self.connectivity_monitor.start()
+    
+    def on_connection_restored(self):
+        """Refleja el regreso a modo red en la barra de estado y en el Dashboard."""
+        self.update_connection_status()
+        if self.dashboard_page.isVisible():
+            self.dashboard_page.refresh_stats()
+    
+    def on_connectivity_probe_failed(self, cause: str, retry_in: float):
+        """Muestra la causa del último intento fallido y cuándo se reintentará."""
+        if cause:
+            self.data_manager.connection_error = cause
+        self.update_connection_status(retry_in)
+    
+    def on_sync_finished(self, report: dict):
+        """Informa en la barra de estado del resultado de la sincronización."""
+        if report.get('error'):
+            self.pending_saves_label.setText(f"⚠️ Sincronización pendiente: {report['error']}")
+        elif report.get('added'):
+            self.pending_saves_label.setText(Config.MSG_SINCRONIZADOS.format(count=report['added']))
+            if self.dashboard_page.isVisible():
+                self.dashboard_page.refresh_stats()
+    
+    def update_connection_status(self, retry_in: float = None):
+        """
+        Actualiza la barra de estado con el estado de conexión actual.
+        
+        Args:
+            retry_in: Segundos hasta el siguiente reintento de conexión (modo local)
+        """
         if not self.data_manager:
             self.status_bar.showMessage("⏳ Inicializando...")
             self.status_bar.setStyleSheet("background-color: #FFA500; color: black; font-weight: bold;")
@@ -244,6 +420,8 @@ class MainApp(QMainWindow):
             self.status_bar.setStyleSheet(f"background-color: {Config.COLOR_CFE_GREEN}; color: white; font-weight: bold;")
         else:
             message = f"⚠️ Trabajando en Modo Local. Causa: {self.data_manager.connection_error}"
+            if retry_in is not None:
+                message += f" (reintento en {retry_in:g} s)"
             self.status_bar.showMessage(message)
             self.status_bar.setStyleSheet("background-color: #FFA500; color: black; font-weight: bold;")
     
@@ -0,0 +1,128 @@
+"""
+Network Probe module for RETI-C application.
+Bounded reachability check of the network share with a last-known-good cache.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+def check_network_dir(network_dir: Path) -> Tuple[bool, Optional[str]]:
+    """
+    Comprueba que el directorio de red exista y admita escritura.
+
+    En un servidor SMB inaccesible estas llamadas pueden bloquearse hasta el
+    tiempo de espera del sistema operativo; usar NetworkProbe para acotarlas.
+
+    Args:
+        network_dir (Path): Directorio que contiene el libro de red
+
+    Returns:
+        Tuple[bool, Optional[str]]: (accesible, causa del fallo o None)
+    """
+    try:
+        if Path(network_dir).exists() and os.access(network_dir, os.W_OK):
+            return True, None
+        return False, "Directorio de red no existe o no hay permisos de escritura."
+    except Exception as e:
+        return False, str(e)
+
+
+def load_network_state(state_path: Path) -> Optional[dict]:
+    """
+    Lee el último resultado de accesibilidad guardado.
+
+    Args:
+        state_path (Path): Archivo JSON de estado
+
+    Returns:
+        Optional[dict]: {'reachable', 'error', 'checked_at'} o None si no hay
+            un estado legible
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if isinstance(state.get("reachable"), bool) and isinstance(state.get("checked_at"), (int, float)):
+            return state
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def save_network_state(state_path: Path, reachable: bool, error: Optional[str]) -> None:
+    """
+    Guarda el resultado de accesibilidad para el próximo arranque.
+
+    Args:
+        state_path (Path): Archivo JSON de estado
+        reachable (bool): Si la ruta de red fue accesible
+        error (Optional[str]): Causa del fallo, si lo hubo
+    """
+    state_path = Path(state_path)
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"reachable": reachable, "error": error, "checked_at": time.time()}, f)
+        os.replace(tmp_path, state_path)
+    except OSError as e:
+        print(f"ADVERTENCIA: No se pudo guardar el estado de la red ({e}).")
+
+
+class NetworkProbe:
+    """
+    Comprobación de la ruta de red en un hilo daemon con plazo máximo.
+
+    Las llamadas al sistema de archivos no se pueden interrumpir, así que
+    el llamador espera como mucho `timeout` segundos y, si vence el plazo,
+    abandona la comprobación: el hilo termina por su cuenta, sin retener el
+    cierre de la aplicación, y su resultado tardío solo actualiza el
+    archivo de estado para el siguiente arranque.
+    """
+
+    def __init__(self, network_dir: Path, state_path: Optional[Path] = None):
+        self.network_dir = Path(network_dir)
+        self.state_path = state_path
+        self.result: Optional[Tuple[bool, Optional[str]]] = None
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "NetworkProbe":
+        """Inicia la comprobación en segundo plano."""
+        self._thread = threading.Thread(target=self._run, name="network-probe", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float]) -> Optional[Tuple[bool, Optional[str]]]:
+        """
+        Espera el resultado como máximo `timeout` segundos.
+
+        Args:
+            timeout (Optional[float]): Plazo en segundos (None = sin límite)
+
+        Returns:
+            Optional[Tuple[bool, Optional[str]]]: (accesible, causa) o None si
+                venció el plazo
+        """
+        if self._done.wait(timeout):
+            return self.result
+        return None
+
+    @property
+    def done(self) -> bool:
+        """Indica si la comprobación ya terminó."""
+        return self._done.is_set()
+
+    def _run(self) -> None:
+        self.result = check_network_dir(self.network_dir)
+        self._done.set()
+        if self.state_path is not None:
+            save_network_state(self.state_path, *self.result)
@@ -0,0 +1,65 @@
+"""
+Query module for RETI-C application.
+Lazily paged results for multi-criteria inventory queries.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+from typing import Dict, Iterator, List
+import numpy as np
+import pandas as pd
+
+
+class QueryResult:
+    """
+    Resultado de DataManager.query(): posiciones de fila más los datos.
+
+    Solo guarda las posiciones coincidentes; los registros se materializan
+    página a página al recorrerlo, de modo que contar resultados o mostrar
+    la primera página no convierte todo el resultado a diccionarios. Los
+    datos son los vigentes al ejecutar la consulta (la caché nunca se
+    modifica en sitio: cada cambio crea un DataFrame nuevo).
+    """
+
+    def __init__(self, df: pd.DataFrame, positions: np.ndarray, page_size: int):
+        self._df = df
+        self.positions = positions
+        self.page_size = max(1, int(page_size))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __iter__(self) -> Iterator[List[Dict]]:
+        """Recorre el resultado página a página (listas de registros)."""
+        for start in range(0, len(self.positions), self.page_size):
+            yield self._records(self.positions[start:start + self.page_size])
+
+    @property
+    def page_count(self) -> int:
+        """Número de páginas del resultado."""
+        return -(-len(self.positions) // self.page_size)
+
+    def page(self, number: int) -> List[Dict]:
+        """
+        Devuelve una página concreta del resultado.
+
+        Args:
+            number (int): Número de página (desde 0)
+
+        Returns:
+            List[Dict]: Registros de la página (vacía si está fuera de rango)
+        """
+        start = number * self.page_size
+        return self._records(self.positions[start:start + self.page_size])
+
+    def records(self) -> Iterator[Dict]:
+        """Recorre los registros uno a uno, materializando de página en página."""
+        for page in self:
+            yield from page
+
+    def _records(self, positions: np.ndarray) -> List[Dict]:
+        if len(positions) == 0:
+            return []
+        return self._df.iloc[positions].to_dict('records')
@@ -0,0 +1,108 @@
+"""
+Save Worker for RETI-C application.
+Runs DataManager writes on a background thread so the UI never blocks on I/O.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import queue
+import threading
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+_STOP = object()
+
+
+class SaveWorker(QThread):
+    """
+    Thread escritor con cola de trabajos de guardado.
+
+    Sigue el patrón de `DataManagerInitializer`: el trabajo lento ocurre en
+    `run()` y el resultado se comunica a la UI únicamente mediante señales.
+    Los trabajos se procesan en orden de llegada; al detenerse, el hilo
+    termina primero todos los guardados pendientes.
+    """
+
+    # Señal emitida cuando un registro se guardó (número de serie)
+    saved = pyqtSignal(str)
+
+    # Señal emitida si un guardado falla (número de serie, mensaje, datos
+    # del registro tal como se encolaron, para no perder lo capturado)
+    failed = pyqtSignal(str, str, object)
+
+    # Señal emitida cuando cambia el número de guardados pendientes
+    pending_changed = pyqtSignal(int)
+
+    def __init__(self, data_manager):
+        """
+        Inicializa el thread escritor.
+
+        Args:
+            data_manager: Instancia de DataManager que realiza las escrituras
+        """
+        super().__init__()
+        self.data_manager = data_manager
+        self._jobs: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Número de guardados encolados o en curso."""
+        with self._pending_lock:
+            return self._pending
+
+    def submit(self, record_data: dict) -> None:
+        """
+        Encola un registro para guardarlo en segundo plano.
+
+        Args:
+            record_data (dict): Datos del registro (se copia al encolar)
+        """
+        self._change_pending(+1)
+        self._jobs.put(dict(record_data))
+        if not self.isRunning():
+            self.start()
+
+    def stop(self, timeout_ms: int = -1) -> bool:
+        """
+        Detiene el thread después de procesar los guardados pendientes.
+
+        Args:
+            timeout_ms (int): Espera máxima en milisegundos (-1 = sin límite)
+
+        Returns:
+            bool: True si el thread terminó
+        """
+        if not self.isRunning():
+            return True
+        self._jobs.put(_STOP)
+        if timeout_ms < 0:
+            return self.wait()
+        return self.wait(timeout_ms)
+
+    def run(self):
+        """Procesa la cola de guardados hasta recibir la orden de detenerse."""
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                return
+            serial_number = str(job.get('Numero de Serie', ''))
+            submitted = dict(job)  # add_record() le añade el ID asignado
+            try:
+                if self.data_manager.add_record(job):
+                    self.saved.emit(serial_number)
+                else:
+                    self.failed.emit(serial_number, "", submitted)
+            except Exception as e:
+                self.failed.emit(serial_number, str(e), submitted)
+            finally:
+                self._change_pending(-1)
+
+    def _change_pending(self, delta: int) -> None:
+        with self._pending_lock:
+            self._pending += delta
+            pending = self._pending
+        self.pending_changed.emit(pending)
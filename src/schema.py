@@ -0,0 +1,170 @@
+"""
+Schema module for RETI-C application.
+Explicit column types for the inventory DataFrame.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import datetime
+from typing import Dict, List
+import pandas as pd
+
+from .config import Config
+
+
+def _strftime_format(qt_format: str) -> str:
+    """Traduce un formato de fecha de Qt (yyyy-MM-dd) a strftime (%Y-%m-%d)."""
+    for token, directive in (("yyyy", "%Y"), ("MM", "%m"), ("dd", "%d")):
+        qt_format = qt_format.replace(token, directive)
+    return qt_format
+
+
+# Formato de las fechas guardadas como texto y mostradas en la UI
+DATE_FORMAT = _strftime_format(Config.FORMATO_FECHA)
+
+
+def read_dtypes() -> Dict[str, object]:
+    """
+    Tipos para pd.read_excel: evita que pandas infiera floats en series
+    numéricas y construye las categorías directamente al leer.
+
+    Returns:
+        Dict[str, object]: Mapa columna -> dtype
+    """
+    dtypes: Dict[str, object] = {col: str for col in Config.STRING_COLUMNS}
+    dtypes.update({col: "category" for col in Config.CATEGORY_COLUMNS})
+    return dtypes
+
+
+def _as_string(values: pd.Series) -> pd.Series:
+    # Series leídas como número (12345.0) se guardan como "12345"
+    def convert(value):
+        if value is None:
+            return None
+        try:
+            if pd.isna(value):
+                return None
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+    return values.map(convert).astype(object)
+
+
+def _as_dates(values: pd.Series) -> pd.Series:
+    """
+    Convierte una columna a datetime64 solo si todos sus valores son fechas.
+
+    Una reescritura completa guarda el DataFrame en memoria: convertir a NaT
+    un valor heredado que no se puede interpretar lo borraría del libro.
+    """
+    blank = values.isna() | values.astype(str).str.strip().eq("")
+    parsed = pd.to_datetime(values.where(~blank), errors="coerce")
+    if (parsed.isna() & ~blank).any():
+        return values
+    return parsed
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aplica el esquema de Config a un DataFrame del inventario.
+
+    Es idempotente y barata sobre un DataFrame ya tipado, por lo que se
+    puede aplicar a cualquier origen (libro, instantánea, SQLite, bitácora).
+
+    Args:
+        df (pd.DataFrame): Datos tal como los entrega el backend
+
+    Returns:
+        pd.DataFrame: Los mismos datos con series como texto, fechas como
+            datetime64 y los campos de valores repetidos como categorías
+    """
+    if df.empty:
+        return df
+    df = df.copy(deep=False)
+    for col in Config.STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = _as_string(df[col])
+    for col in Config.DATE_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = _as_dates(df[col])
+    for col in Config.CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatena DataFrames tipados conservando las columnas categóricas.
+
+    pd.concat convierte a object las categóricas con categorías distintas;
+    aquí se unen las categorías antes de concatenar.
+
+    Args:
+        frames (List[pd.DataFrame]): DataFrames con el esquema aplicado
+
+    Returns:
+        pd.DataFrame: DataFrame combinado con el esquema aplicado
+    """
+    frames = [apply_schema(frame) for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=Config.COLUMNS)
+    for col in Config.CATEGORY_COLUMNS:
+        if all(col in frame.columns for frame in frames):
+            # Categorías como object: el dtype inferido puede variar entre orígenes
+            categories = pd.Index([], dtype=object)
+            for frame in frames:
+                categories = categories.append(frame[col].cat.categories.astype(object)).unique()
+            for frame in frames:
+                frame[col] = frame[col].cat.set_categories(categories)
+    return apply_schema(pd.concat(frames, ignore_index=True))
+
+
+def format_date(value, default: str = "N/A") -> str:
+    """
+    Formatea una fecha del inventario para mostrarla (Config.FORMATO_FECHA).
+
+    Args:
+        value: Fecha (Timestamp, texto o nulo)
+        default (str): Texto para valores vacíos
+
+    Returns:
+        str: Fecha como AAAA-MM-DD, el texto original si no es una fecha,
+            o `default` si está vacía
+    """
+    if value is None:
+        return default
+    try:
+        if pd.isna(value):
+            return default
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return value.strftime(DATE_FORMAT)
+    return str(value)
+
+
+def to_storage_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepara un DataFrame tipado para escribirlo en el libro.
+
+    Las fechas se guardan como texto con Config.FORMATO_FECHA, igual que
+    las filas añadidas desde el formulario: sin esto una reescritura
+    completa escribiría celdas datetime ("AAAA-MM-DD HH:MM:SS") y la
+    columna mezclaría tipos y formatos.
+
+    Args:
+        df (pd.DataFrame): Datos con el esquema aplicado
+
+    Returns:
+        pd.DataFrame: Copia con las columnas de fecha como texto
+    """
+    df = df.copy(deep=False)
+    for col in Config.DATE_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(lambda value: format_date(value, default=None)).astype(object)
+    return df
@@ -0,0 +1,67 @@
+"""
+Search Worker for RETI-C application.
+Runs DataManager lookups on a thread pool so the UI never blocks on a cache miss.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+from typing import Callable
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class SearchSignals(QObject):
+    """
+    Señales de resultados de búsqueda.
+
+    Una instancia vive en el hilo de la UI y la comparten todas las tareas;
+    al emitirse desde el hilo del pool, Qt entrega los resultados en el
+    hilo de la UI mediante conexiones en cola.
+    """
+
+    # Generación de la búsqueda, tipo de búsqueda y resultado (lista de registros)
+    finished = pyqtSignal(int, str, object)
+
+    # Generación de la búsqueda, tipo de búsqueda y mensaje de error
+    failed = pyqtSignal(int, str, str)
+
+
+class SearchTask(QRunnable):
+    """
+    Tarea de búsqueda para QThreadPool.
+
+    Cada tarea lleva la generación de la búsqueda que la lanzó. Si al
+    empezar ya hay una búsqueda más reciente, la tarea se descarta sin
+    consultar los datos; si termina tarde, la vista ignora su resultado.
+    """
+
+    def __init__(self, signals: SearchSignals, generation: int, kind: str,
+                 search: Callable[[], object], is_current: Callable[[int], bool]):
+        """
+        Inicializa la tarea.
+
+        Args:
+            signals (SearchSignals): Señales compartidas de la vista
+            generation (int): Generación de la búsqueda
+            kind (str): Tipo de búsqueda ("serial", "text"...)
+            search (Callable): Función que realiza la consulta
+            is_current (Callable[[int], bool]): Indica si la generación sigue vigente
+        """
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.kind = kind
+        self.search = search
+        self.is_current = is_current
+
+    def run(self):
+        """Ejecuta la consulta si sigue vigente y emite el resultado."""
+        if not self.is_current(self.generation):
+            return
+        try:
+            result = self.search()
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.kind, str(e))
+            return
+        self.signals.finished.emit(self.generation, self.kind, result)
@@ -0,0 +1,151 @@
+"""
+Stats Engine module for RETI-C application.
+Dashboard aggregates maintained incrementally alongside the data cache.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+from collections import Counter
+from datetime import date
+from typing import Dict, Optional
+import pandas as pd
+
+
+def _to_day(value) -> Optional[date]:
+    """Convierte un valor de fecha a `date`; None si está vacío o no es una fecha."""
+    if value is None:
+        return None
+    try:
+        timestamp = pd.Timestamp(value)
+    except (TypeError, ValueError):
+        return None
+    if pd.isna(timestamp):
+        return None
+    return timestamp.date()
+
+
+def _status_key(value) -> str:
+    if value is None:
+        return "Sin estado"
+    try:
+        if pd.isna(value):
+            return "Sin estado"
+    except (TypeError, ValueError):
+        pass
+    return str(value).strip() or "Sin estado"
+
+
+class StatsEngine:
+    """
+    Agregados del dashboard mantenidos de forma incremental.
+
+    Sigue el protocolo de los índices de DataManager (`build`, `add`,
+    `version`): se recalcula desde cero solo cuando cambia la versión de
+    los datos (es decir, cuando el archivo cambió fuera de esta instancia)
+    y cada registro guardado por la aplicación solo actualiza contadores.
+
+    Mantiene: equipos por Estado, ingresos por día (Fecha de Recepcion),
+    equipos pendientes de entrega (sin Fecha de Entrega) y la suma de
+    tiempos de atención (Fecha de Entrega - Fecha de Recepcion).
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.total = 0
+        self.by_status: Counter = Counter()
+        self.intakes_per_day: Counter = Counter()
+        self.open_backlog = 0
+        self._turnaround_days = 0.0
+        self._turnaround_count = 0
+
+    def build(self, df: pd.DataFrame, version: int) -> None:
+        """
+        Recalcula todos los agregados a partir de un DataFrame completo.
+
+        Args:
+            df (pd.DataFrame): Datos del inventario
+            version (int): Versión de datos a la que corresponden los agregados
+        """
+        self._reset()
+        self.total = len(df)
+        empty = pd.Series([None] * len(df), index=df.index, dtype=object)
+
+        status = df['Estado'] if 'Estado' in df.columns else empty
+        # Normalizar antes de contar: NaN y '' son el mismo "Sin estado"
+        self.by_status = Counter({key: int(count) for key, count
+                                  in status.map(_status_key).value_counts().items()})
+
+        received = pd.to_datetime(df['Fecha de Recepcion'] if 'Fecha de Recepcion' in df.columns else empty,
+                                  errors='coerce')
+        delivered = pd.to_datetime(df['Fecha de Entrega'] if 'Fecha de Entrega' in df.columns else empty,
+                                   errors='coerce')
+        self.intakes_per_day = Counter({day.date(): int(count) for day, count
+                                        in received.dropna().dt.normalize().value_counts().items()})
+        self.open_backlog = int(delivered.isna().sum())
+
+        turnaround = ((delivered.dt.normalize() - received.dt.normalize()).dt.total_seconds() / 86400).dropna()
+        self._turnaround_days = float(turnaround.sum())
+        self._turnaround_count = int(len(turnaround))
+        self.version = version
+
+    def add(self, position: int, record: Dict) -> None:
+        """
+        Actualiza los contadores con un registro nuevo.
+
+        Args:
+            position (int): Posición de la fila en el DataFrame (no se usa)
+            record (Dict): Datos del registro
+        """
+        self.total += 1
+        self.by_status[_status_key(record.get('Estado'))] += 1
+        received = _to_day(record.get('Fecha de Recepcion'))
+        delivered = _to_day(record.get('Fecha de Entrega'))
+        if received is not None:
+            self.intakes_per_day[received] += 1
+        if delivered is None:
+            self.open_backlog += 1
+        elif received is not None:
+            self._turnaround_days += (delivered - received).days
+            self._turnaround_count += 1
+
+    @property
+    def mean_turnaround_days(self) -> Optional[float]:
+        """Tiempo medio de atención en días (None si ningún equipo se ha entregado)."""
+        if not self._turnaround_count:
+            return None
+        return self._turnaround_days / self._turnaround_count
+
+    def intakes_per_week(self) -> Dict[str, int]:
+        """
+        Agrupa los ingresos diarios por semana ISO.
+
+        Returns:
+            Dict[str, int]: Semana ("2025-W32") -> ingresos, en orden cronológico
+        """
+        weeks: Counter = Counter()
+        for day, count in self.intakes_per_day.items():
+            year, week, _ = day.isocalendar()
+            weeks[f"{year}-W{week:02d}"] += count
+        return dict(sorted(weeks.items()))
+
+    def snapshot(self) -> Dict:
+        """
+        Copia de los agregados para mostrarlos.
+
+        Returns:
+            Dict: 'total', 'by_status', 'intakes_per_day', 'intakes_per_week',
+                'open_backlog' y 'mean_turnaround_days'
+        """
+        return {
+            'total': self.total,
+            'by_status': dict(self.by_status.most_common()),
+            'intakes_per_day': dict(sorted(self.intakes_per_day.items())),
+            'intakes_per_week': self.intakes_per_week(),
+            'open_backlog': self.open_backlog,
+            'mean_turnaround_days': self.mean_turnaround_days,
+        }
@@ -0,0 +1,39 @@
+# Este archivo hace que el directorio storage sea un paquete de Python
+from pathlib import Path
+from typing import List
+
+from ..config import Config
+from .base import StorageBackend
+from .excel_backend import ExcelBackend
+from .sqlite_backend import SQLiteBackend
+
+
+def create_backend(kind: str, workbook_path: Path, columns: List[str],
+                   network_mode: bool = False) -> StorageBackend:
+    """
+    Crea el backend de almacenamiento configurado.
+
+    Args:
+        kind (str): "excel" o "sqlite" (ver Config.STORAGE_BACKEND)
+        workbook_path (Path): Ruta activa del libro Excel
+        columns (List[str]): Columnas del inventario
+        network_mode (bool): True si la ruta activa está en la red
+
+    Returns:
+        StorageBackend: Instancia del backend
+
+    Raises:
+        ValueError: Si el tipo de backend no existe
+    """
+    if kind == ExcelBackend.name:
+        return ExcelBackend(workbook_path, columns)
+    if kind == SQLiteBackend.name:
+        # WAL necesita memoria compartida entre procesos del mismo equipo;
+        # sobre un recurso SMB se usa el modo de journal configurado para red.
+        journal_mode = Config.SQLITE_NETWORK_JOURNAL_MODE if network_mode else Config.SQLITE_JOURNAL_MODE
+        return SQLiteBackend(Path(workbook_path).with_suffix(Config.SQLITE_SUFFIX), columns,
+                             journal_mode=journal_mode, seed_path=workbook_path)
+    raise ValueError(f"Backend de almacenamiento desconocido: {kind}")
+
+
+__all__ = ['StorageBackend', 'ExcelBackend', 'SQLiteBackend', 'create_backend']
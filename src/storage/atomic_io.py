@@ -0,0 +1,96 @@
+"""
+Atomic File I/O module for RETI-C application.
+Whole-file reads and crash-safe replacements tuned for SMB shares.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import io
+import os
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+from ..file_lock import sidecar_path
+
+
+def read_bytes(path: Path) -> io.BytesIO:
+    """
+    Lee un archivo completo con una sola lectura secuencial.
+
+    openpyxl y pandas recorren el .xlsx (un ZIP) con muchas lecturas
+    pequeñas y saltos; sobre SMB cada una es un viaje al servidor. Leer el
+    archivo de una vez y procesarlo desde memoria deja un solo viaje.
+
+    Args:
+        path (Path): Archivo a leer
+
+    Returns:
+        io.BytesIO: Contenido del archivo, posicionado al inicio
+    """
+    with open(path, "rb") as f:
+        return io.BytesIO(f.read())
+
+
+def write_bytes_atomic(path: Path, data: Union[bytes, io.BytesIO]) -> None:
+    """
+    Reemplaza un archivo de forma atómica.
+
+    El contenido se escribe de una vez en un archivo temporal junto al
+    destino (mismo directorio, y por tanto mismo volumen), se fuerza a
+    disco con fsync y se intercambia con os.replace: quien lea el archivo
+    ve la versión anterior o la nueva completa, nunca un libro a medias
+    aunque la conexión se corte durante el guardado.
+
+    Args:
+        path (Path): Archivo destino
+        data (Union[bytes, io.BytesIO]): Contenido completo
+
+    Raises:
+        OSError: Si no se pudo escribir; el archivo original queda intacto
+    """
+    path = Path(path)
+    if isinstance(data, io.BytesIO):
+        data = data.getvalue()
+    tmp_path = sidecar_path(path, f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_workbook_atomic(workbook, path: Path) -> None:
+    """
+    Serializa un libro de openpyxl en memoria y lo guarda de forma atómica.
+
+    Args:
+        workbook: Libro de openpyxl
+        path (Path): Archivo destino
+    """
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    write_bytes_atomic(path, buffer)
+
+
+def write_frame_atomic(df: pd.DataFrame, path: Path) -> None:
+    """
+    Guarda un DataFrame como .xlsx (sin índice) de forma atómica.
+
+    Args:
+        df (pd.DataFrame): Datos a guardar
+        path (Path): Archivo destino
+    """
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    write_bytes_atomic(path, buffer)
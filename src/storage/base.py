@@ -0,0 +1,124 @@
+"""
+Storage Backend interface for RETI-C application.
+Defines the operations DataManager needs from any persistence engine.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import pandas as pd
+
+from ..config import Config
+from ..file_lock import FileLock, sidecar_path
+
+
+class StorageBackend(ABC):
+    """
+    Interfaz común de los motores de almacenamiento.
+
+    DataManager mantiene la caché en memoria y los índices por encima de
+    esta interfaz; cada backend solo se ocupa de leer, añadir y reemplazar
+    registros en su formato y de exponer una firma barata de versión.
+    """
+
+    name = ""
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = Path(path)
+        self.columns = list(columns)
+
+    @abstractmethod
+    def ensure_exists(self) -> None:
+        """Crea el almacenamiento vacío (con las columnas configuradas) si no existe."""
+
+    def exists(self) -> bool:
+        """Indica si el almacenamiento ya existe (sin crearlo)."""
+        return self.path.exists()
+
+    @abstractmethod
+    def signature(self) -> Optional[tuple]:
+        """
+        Devuelve una firma barata que cambia cada vez que cambian los datos.
+
+        Returns:
+            Optional[tuple]: Firma actual, o None si no se puede obtener
+        """
+
+    @abstractmethod
+    def load(self) -> pd.DataFrame:
+        """Lee todos los registros como DataFrame."""
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Recorre los registros en bloques de `chunk_size` filas.
+
+        La implementación por defecto divide load(); los backends que pueden
+        leer de forma incremental la sobrescriben para acotar la memoria.
+        """
+        df = self.load()
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+    @abstractmethod
+    def save(self, df: pd.DataFrame) -> None:
+        """Reemplaza todos los registros por el contenido de `df`."""
+
+    @abstractmethod
+    def append(self, rows: List[Dict]) -> bool:
+        """
+        Añade registros al final del almacenamiento.
+
+        Returns:
+            bool: False si el esquema no lo permite y se requiere save()
+        """
+
+    @abstractmethod
+    def next_id(self, compute_max: Callable[[], int]) -> int:
+        """
+        Devuelve el siguiente ID disponible.
+
+        Args:
+            compute_max (Callable[[], int]): Calcula el ID máximo desde los
+                datos en memoria, para backends que no lo conocen por sí mismos
+        """
+
+    def commit_high_water_mark(self, high_water_mark: int) -> None:
+        """Registra el mayor ID escrito (opcional para cada backend)."""
+
+    def compact(self) -> int:
+        """
+        Integra escrituras diferidas en el almacenamiento principal.
+
+        Returns:
+            int: Número de registros integrados (0 si el backend no difiere escrituras)
+        """
+        return 0
+
+    def on_frame_updated(self, df: pd.DataFrame) -> None:
+        """
+        Notifica que `df` es el contenido vigente tras una escritura propia.
+
+        Permite a un backend refrescar estructuras derivadas (p. ej. una
+        instantánea local) sin volver a leer el almacenamiento.
+        """
+
+    def lookup_serial(self, serial_key: str) -> Optional[List[Dict]]:
+        """
+        Búsqueda nativa por número de serie normalizado.
+
+        Returns:
+            Optional[List[Dict]]: Registros encontrados ordenados por Fecha de
+                Recepcion (sin fecha al final), o None si el backend no tiene
+                búsqueda nativa y se debe usar el índice en memoria
+        """
+        return None
+
+    def write_lock(self) -> FileLock:
+        """Crea el bloqueo de escritura compartido por todas las estaciones."""
+        return FileLock(sidecar_path(self.path, ".lock"),
+                        timeout=Config.WRITE_LOCK_TIMEOUT,
+                        stale_after=Config.WRITE_LOCK_STALE_AFTER)
@@ -0,0 +1,310 @@
+"""
+Excel Storage Backend for RETI-C application.
+Persists the inventory in a single .xlsx workbook.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import datetime
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import pandas as pd
+from openpyxl import load_workbook
+
+from ..config import Config
+from ..file_lock import sidecar_path
+from ..id_allocator import IdAllocator
+from ..schema import apply_schema, concat_frames, format_date, read_dtypes, to_storage_frame
+from .atomic_io import read_bytes, save_workbook_atomic, write_frame_atomic
+from .base import StorageBackend
+from .journal import WriteAheadJournal
+from .snapshot import ColumnarSnapshot
+from .streaming import iter_xlsx_chunks
+
+
+class ExcelBackend(StorageBackend):
+    """
+    Backend basado en un libro Excel (formato histórico de RETI-C).
+
+    El libro se lee con una sola lectura en memoria y se escribe de forma
+    atómica (archivo temporal + fsync + os.replace, ver atomic_io): sobre
+    SMB cada guardado o carga es una transferencia secuencial y un corte de
+    conexión no deja el libro a medio escribir.
+
+    Con Config.JOURNAL_ENABLED los registros nuevos se escriben primero en
+    una bitácora JSONL junto al libro y se compactan por lotes; las lecturas
+    combinan el libro con los registros pendientes de la bitácora.
+    """
+
+    name = "excel"
+
+    def __init__(self, path: Path, columns: List[str]):
+        super().__init__(path, columns)
+        self._id_allocator = IdAllocator(self.path)
+        self.snapshot = ColumnarSnapshot(self.path, Config.SNAPSHOT_DIR) if Config.SNAPSHOT_ENABLED else None
+        self.journal = WriteAheadJournal(sidecar_path(self.path, ".journal.jsonl"))
+
+    def ensure_exists(self) -> None:
+        """
+        Verifica que el archivo Excel exista; si no, lo crea.
+
+        Un archivo de 0 bytes (creado vacío por otra herramienta) también se
+        inicializa: las escrituras ya no asumen un libro vacío cuando la
+        lectura falla (ver DataManager._get_frame(strict=True)).
+        """
+        try:
+            if os.stat(self.path).st_size > 0:
+                return
+        except FileNotFoundError:
+            pass
+        df = pd.DataFrame(columns=self.columns)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_frame_atomic(df, self.path)
+
+    def signature(self) -> Optional[tuple]:
+        """
+        Firma de los datos visibles: el libro más la bitácora pendiente.
+
+        Returns:
+            Optional[tuple]: Firma combinada, o None si el libro no se puede leer
+        """
+        signature = self._workbook_signature()
+        if signature is None:
+            return None
+        return signature + (self.journal.signature(),)
+
+    def _workbook_signature(self) -> Optional[tuple]:
+        """
+        Calcula una firma barata del libro para validar la caché.
+
+        Usa mtime y tamaño (un solo stat). Si Config.CACHE_VERIFY_HASH está
+        activo se añade un hash del contenido, útil en recursos compartidos
+        SMB donde la resolución del mtime puede ocultar escrituras rápidas.
+
+        Returns:
+            Optional[tuple]: Firma del archivo, o None si no se puede leer
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if Config.CACHE_VERIFY_HASH:
+            hasher = hashlib.blake2b(digest_size=16)
+            try:
+                with open(self.path, 'rb') as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        hasher.update(block)
+            except OSError:
+                return None
+            signature += (hasher.hexdigest(),)
+        return signature
+
+    def load(self) -> pd.DataFrame:
+        """
+        Lee el libro y le añade los registros pendientes de la bitácora.
+
+        El libro se carga desde la instantánea columnar local si sigue
+        vigente; solo se procesa el .xlsx cuando su firma cambió, y en ese
+        caso la instantánea se reconstruye en segundo plano.
+        """
+        df = self._load_workbook_frame()
+        pending = self._pending_journal_rows(df)
+        if pending:
+            df = concat_frames([df, pd.DataFrame(pending)])
+        return df
+
+    def _load_workbook_frame(self) -> pd.DataFrame:
+        signature = self._workbook_signature()
+        if self.snapshot is not None:
+            df = self.snapshot.load(signature)
+            if df is not None:
+                return df
+        # Tipos explícitos: la instantánea guarda el DataFrame ya tipado
+        df = apply_schema(pd.read_excel(read_bytes(self.path), dtype=read_dtypes()))
+        if self.snapshot is not None:
+            self.snapshot.save_async(df, signature)
+        return df
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Recorre el libro en modo streaming y después la bitácora pendiente.
+
+        Si la instantánea local está vigente se recorre esa copia (ya es
+        más barata que el .xlsx); si no, el libro se lee fila a fila con
+        openpyxl en modo de solo lectura, sin materializarlo completo.
+
+        Args:
+            chunk_size (int): Filas por bloque
+
+        Returns:
+            Iterator[pd.DataFrame]: Bloques de registros en orden de archivo
+        """
+        df = self.snapshot.load(self._workbook_signature()) if self.snapshot is not None else None
+        if df is not None:
+            chunks = (df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size))
+        else:
+            chunks = iter_xlsx_chunks(self.path, chunk_size)
+
+        # Solo se conservan los IDs vistos, para omitir registros ya compactados
+        seen_ids = set()
+        for chunk in chunks:
+            if 'ID' in chunk.columns:
+                seen_ids.update(pd.to_numeric(chunk['ID'], errors='coerce').dropna().astype(int))
+            yield chunk
+        pending = [row for row in self.journal.read() if _as_int(row.get('ID')) not in seen_ids]
+        if pending:
+            yield pd.DataFrame(pending)
+
+    def _pending_journal_rows(self, workbook_df: pd.DataFrame) -> List[Dict]:
+        """
+        Registros de la bitácora que aún no están en el libro.
+
+        Si una compactación se interrumpió tras escribir el libro pero antes
+        de vaciar la bitácora, sus registros ya presentes (mismo ID) se omiten.
+        """
+        rows = self.journal.read()
+        if not rows or 'ID' not in workbook_df.columns:
+            return rows
+        existing_ids = set(pd.to_numeric(workbook_df['ID'], errors='coerce').dropna().astype(int))
+        return [row for row in rows if _as_int(row.get('ID')) not in existing_ids]
+
+    def save(self, df: pd.DataFrame) -> None:
+        # `df` es el contenido completo (incluye lo pendiente en la bitácora)
+        write_frame_atomic(to_storage_frame(df), self.path)
+        self.journal.clear()
+
+    def append(self, rows: List[Dict]) -> bool:
+        """
+        Añade registros, vía bitácora o directamente al libro.
+
+        Con la bitácora activa el guardado solo añade líneas JSONL (con
+        fsync); al alcanzar Config.JOURNAL_COMPACT_THRESHOLD registros
+        pendientes se compactan todos en el libro en una sola escritura.
+
+        Args:
+            rows (List[Dict]): Registros a añadir
+
+        Returns:
+            bool: False si el esquema requiere una reescritura completa
+        """
+        if any(set(row) - set(self.columns) for row in rows):
+            return False
+        if not Config.JOURNAL_ENABLED:
+            return self._append_to_workbook(rows)
+
+        self.journal.append(rows)
+        if len(self.journal.read()) >= Config.JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+        return True
+
+    def compact(self) -> int:
+        """
+        Integra en el libro los registros pendientes de la bitácora.
+
+        Debe llamarse con el bloqueo de escritura adquirido. Es idempotente:
+        los registros cuyo ID ya está en el libro no se vuelven a escribir.
+
+        Returns:
+            int: Número de registros integrados en el libro
+        """
+        rows = self.journal.read()
+        if not rows:
+            self.journal.clear()
+            return 0
+        workbook_df = self._load_workbook_frame()
+        pending = self._pending_journal_rows(workbook_df)
+        if pending and not self._append_to_workbook(pending):
+            # Esquema distinto en el libro: reescritura completa, una sola vez,
+            # partiendo del libro ya tipado (una serie "00777" sigue siendo texto)
+            df = concat_frames([workbook_df, pd.DataFrame(pending)])
+            write_frame_atomic(to_storage_frame(df), self.path)
+        self.journal.clear()
+        print(f"INFO: {len(pending)} registros de la bitácora integrados en el libro.")
+        return len(pending)
+
+    def _append_to_workbook(self, rows: List[Dict]) -> bool:
+        """
+        Añade filas al final de la hoja activa sin reconstruir el DataFrame.
+
+        Abre el libro existente con openpyxl y escribe únicamente las filas
+        nuevas respetando el orden de Config.COLUMNS, evitando el ciclo
+        read_excel + concat + to_excel de la reescritura completa.
+
+        Args:
+            rows (List[Dict]): Registros a añadir
+
+        Returns:
+            bool: True si se añadieron; False si el libro no se puede abrir o
+                si el esquema del archivo o de los registros no coincide con
+                Config.COLUMNS, casos que requieren una reescritura completa
+        """
+        if any(set(row) - set(self.columns) for row in rows):
+            return False
+
+        try:
+            workbook = load_workbook(read_bytes(self.path))
+        except Exception as e:
+            # Libro ilegible o vacío: la reescritura completa lo regenera
+            print(f"ADVERTENCIA: No se pudo abrir el libro para añadir filas ({e}).")
+            return False
+        try:
+            sheet = workbook.active
+            header = [cell.value for cell in sheet[1]] if sheet.max_row >= 1 else []
+            if header != self.columns:
+                return False
+
+            for row in rows:
+                sheet.append([to_cell_value(row.get(col)) for col in self.columns])
+            save_workbook_atomic(workbook, self.path)
+        finally:
+            workbook.close()
+        return True
+
+    def next_id(self, compute_max: Callable[[], int]) -> int:
+        """
+        Devuelve el siguiente ID usando la marca máxima guardada junto al libro.
+
+        La marca se valida contra la firma del libro; los datos solo se
+        procesan (vía `compute_max`) si ninguna marca conocida es válida.
+        """
+        return self._id_allocator.next_id(self.signature(), compute_max)
+
+    def commit_high_water_mark(self, high_water_mark: int) -> None:
+        self._id_allocator.commit(high_water_mark, self.signature())
+
+    def on_frame_updated(self, df: pd.DataFrame) -> None:
+        # Tras una escritura propia la instantánea se reconstruye en segundo
+        # plano; con registros en la bitácora `df` no corresponde solo al libro.
+        if self.snapshot is not None and self.journal.signature() is None:
+            self.snapshot.save_async(df, self._workbook_signature())
+
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_cell_value(value):
+    """
+    Convierte un valor de registro a un tipo aceptado por openpyxl (NaN -> celda vacía).
+
+    Las fechas se escriben como texto con Config.FORMATO_FECHA (ver
+    schema.to_storage_frame), el mismo formato que el resto de la columna.
+    """
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, (pd.Timestamp, datetime.date)):
+        return format_date(value)
+    return value
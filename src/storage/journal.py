@@ -0,0 +1,104 @@
+"""
+Write-Ahead Journal module for RETI-C application.
+Append-only JSONL log of registrations pending compaction into the workbook.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class WriteAheadJournal:
+    """
+    Bitácora de escritura anticipada en formato JSON Lines.
+
+    Cada registro se añade como una línea y se sincroniza a disco (fsync)
+    antes de confirmar el guardado: escribir unos cientos de bytes es
+    mucho más barato que reescribir el libro completo. Un compactador
+    integra después los registros acumulados en el libro en una sola
+    escritura. Las escrituras deben hacerse con el bloqueo de escritura
+    adquirido.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def append(self, rows: List[Dict]) -> None:
+        """
+        Añade registros a la bitácora y los sincroniza a disco.
+
+        Si un corte dejó una última línea sin salto de línea, se recorta
+        antes de escribir: pegar el registro nuevo a ese fragmento lo
+        volvería ilegible y se perdería un guardado ya confirmado.
+
+        Args:
+            rows (List[Dict]): Registros a añadir
+        """
+        payload = "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows)
+        with open(self.path, "a+b") as f:
+            self._truncate_partial_tail(f)
+            f.write(payload.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _truncate_partial_tail(self, f) -> None:
+        """Recorta una última línea incompleta (sin confirmar) de la bitácora abierta."""
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        f.seek(0)
+        content = f.read()
+        keep = content.rfind(b"\n") + 1
+        f.truncate(keep)
+        print(f"ADVERTENCIA: Línea incompleta descartada de la bitácora ({self.path.name}): "
+              f"{content[keep:][:80]!r}")
+
+    def read(self) -> List[Dict]:
+        """
+        Lee los registros pendientes de compactar.
+
+        Una última línea incompleta (corte durante la escritura) se ignora:
+        ese guardado nunca llegó a confirmarse.
+
+        Returns:
+            List[Dict]: Registros en orden de escritura
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        rows = []
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                print(f"ADVERTENCIA: Línea {number} ilegible ignorada en la bitácora "
+                      f"({self.path.name}): {line[:80]!r}")
+        return rows
+
+    def signature(self) -> Optional[tuple]:
+        """Firma (mtime, tamaño) de la bitácora, o None si no existe."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def clear(self) -> None:
+        """Elimina la bitácora tras compactar sus registros en el libro."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
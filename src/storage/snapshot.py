@@ -0,0 +1,131 @@
+"""
+Columnar Snapshot module for RETI-C application.
+Local binary copy of the workbook data for fast cold loads.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (solo se comprueba su disponibilidad)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+class ColumnarSnapshot:
+    """
+    Copia local en formato columnar (Feather) de los datos de un libro.
+
+    La instantánea se identifica por la ruta del libro y se valida con su
+    firma (mtime, tamaño): si la firma coincide, cargarla evita procesar el
+    .xlsx con openpyxl. Sin pyarrow se usa pickle de pandas, que también
+    evita el procesamiento del Excel. Las reconstrucciones se hacen en un
+    hilo en segundo plano y se agrupan: si llegan varias seguidas, solo se
+    escribe la más reciente.
+    """
+
+    def __init__(self, workbook_path: Path, snapshot_dir: Path):
+        key = hashlib.sha1(str(Path(workbook_path)).encode("utf-8")).hexdigest()[:16]
+        self.snapshot_dir = Path(snapshot_dir)
+        self.meta_path = self.snapshot_dir / f"{key}.json"
+        self._data_base = self.snapshot_dir / key
+        self._lock = threading.Lock()
+        self._pending = None
+        self._worker: Optional[threading.Thread] = None
+
+    def load(self, signature) -> Optional[pd.DataFrame]:
+        """
+        Carga la instantánea si corresponde a la firma actual del libro.
+
+        Args:
+            signature: Firma actual del libro
+
+        Returns:
+            Optional[pd.DataFrame]: Datos, o None si no hay instantánea válida
+        """
+        if signature is None:
+            return None
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("signature") != list(signature):
+                return None
+            data_path = Path(f"{self._data_base}.{meta['format']}")
+            if meta["format"] == "feather":
+                return pd.read_feather(data_path)
+            with open(data_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError, ImportError):
+            return None
+        except Exception as e:
+            print(f"ADVERTENCIA: Instantánea local ilegible, se ignorará ({e}).")
+            return None
+
+    def save_async(self, df: pd.DataFrame, signature) -> None:
+        """
+        Programa la reconstrucción de la instantánea en segundo plano.
+
+        Args:
+            df (pd.DataFrame): Datos vigentes del libro
+            signature: Firma del libro que corresponde a `df`
+        """
+        if signature is None:
+            return
+        with self._lock:
+            self._pending = (df.copy(), list(signature))
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._drain, name="snapshot-writer", daemon=True)
+                self._worker.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Espera a que termine la reconstrucción en curso (útil al cerrar y en pruebas)."""
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                pending, self._pending = self._pending, None
+                if pending is None:
+                    return
+            try:
+                self._write(*pending)
+            except Exception as e:
+                print(f"ADVERTENCIA: No se pudo actualizar la instantánea local ({e}).")
+
+    def _write(self, df: pd.DataFrame, signature: list) -> None:
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        df = df.reset_index(drop=True)
+        fmt = "pickle"
+        if HAS_PYARROW:
+            try:
+                tmp_path = Path(f"{self._data_base}.feather.tmp")
+                df.to_feather(tmp_path)
+                fmt = "feather"
+            except Exception:
+                # Columnas de tipos mixtos que Arrow no admite: usar pickle
+                fmt = "pickle"
+        if fmt == "pickle":
+            tmp_path = Path(f"{self._data_base}.pickle.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, f"{self._data_base}.{fmt}")
+
+        # Los metadatos se escriben al final: una lectura concurrente nunca
+        # valida datos a medio escribir.
+        meta_tmp = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "format": fmt}, f)
+        os.replace(meta_tmp, self.meta_path)
@@ -0,0 +1,182 @@
+"""
+SQLite Storage Backend for RETI-C application.
+Persists the inventory in an indexed SQLite database.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import pandas as pd
+
+from ..config import Config
+from ..indexes import normalize_serial, SERIAL_COLUMN
+from ..schema import apply_schema, read_dtypes
+from .atomic_io import read_bytes
+from .base import StorageBackend
+
+
+TABLE_NAME = "registros"
+SERIAL_KEY_COLUMN = "serial_key"
+
+
+def _quote(identifier: str) -> str:
+    """Entrecomilla un nombre de columna (las columnas del SRS llevan espacios)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _to_sql_value(value):
+    """Convierte un valor de registro a un tipo nativo de SQLite."""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    if hasattr(value, "item"):
+        # Escalares de numpy (int64, float64...) -> tipos de Python
+        return value.item()
+    return value
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Backend basado en SQLite con índices por número de serie y fecha.
+
+    Cada escritura incrementa un contador en la tabla `meta`, que sirve como
+    firma barata para la caché de DataManager. Si al crear la base existe
+    el libro Excel histórico (`seed_path`), sus registros se importan.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path, columns: List[str], journal_mode: str = "WAL",
+                 seed_path: Optional[Path] = None):
+        super().__init__(path, columns)
+        self.journal_mode = journal_mode
+        self.seed_path = Path(seed_path) if seed_path else None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Una conexión por operación: el backend se usa desde varios hilos
+        conn = sqlite3.connect(self.path, timeout=Config.WRITE_LOCK_TIMEOUT)
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def ensure_exists(self) -> None:
+        """Crea la base, sus índices y, la primera vez, importa el libro Excel."""
+        is_new = not self.path.exists()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        column_defs = ", ".join(
+            f"{_quote(col)} INTEGER" if col == "ID" else f"{_quote(col)} TEXT"
+            for col in self.columns
+        )
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} "
+                         f"({column_defs}, {SERIAL_KEY_COLUMN} TEXT)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_serial "
+                         f"ON {TABLE_NAME} ({SERIAL_KEY_COLUMN})")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_recepcion "
+                         f"ON {TABLE_NAME} ({_quote('Fecha de Recepcion')})")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_id "
+                         f"ON {TABLE_NAME} ({_quote('ID')})")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0)")
+
+        if is_new and self.seed_path is not None and self.seed_path.exists():
+            try:
+                # Mismo tipado que ExcelBackend: una serie "00123" no debe leerse como 123
+                seed = apply_schema(pd.read_excel(read_bytes(self.seed_path), dtype=read_dtypes()))
+            except Exception as e:
+                print(f"ADVERTENCIA: No se pudo importar el libro Excel existente ({e}).")
+                return
+            if not seed.empty:
+                self.save(seed)
+                print(f"INFO: {len(seed)} registros importados desde {self.seed_path.name}.")
+
+    def _table_columns(self, conn: sqlite3.Connection) -> List[str]:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({TABLE_NAME})")
+                if row[1] != SERIAL_KEY_COLUMN]
+
+    def signature(self) -> Optional[tuple]:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0],) if row else None
+
+    def load(self) -> pd.DataFrame:
+        with closing(self._connect()) as conn:
+            columns = self._table_columns(conn)
+            select = ", ".join(_quote(col) for col in columns)
+            return pd.read_sql_query(f"SELECT {select} FROM {TABLE_NAME} ORDER BY rowid", conn)
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Recorre la tabla con un cursor (fetchmany) sin cargarla completa."""
+        with closing(self._connect()) as conn:
+            columns = self._table_columns(conn)
+            select = ", ".join(_quote(col) for col in columns)
+            cursor = conn.execute(f"SELECT {select} FROM {TABLE_NAME} ORDER BY rowid")
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield pd.DataFrame.from_records(rows, columns=columns)
+
+    def _insert(self, conn: sqlite3.Connection, columns: List[str], rows: List[Dict]) -> None:
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        names = ", ".join(_quote(col) for col in columns)
+        conn.executemany(
+            f"INSERT INTO {TABLE_NAME} ({names}, {SERIAL_KEY_COLUMN}) VALUES ({placeholders})",
+            ([_to_sql_value(row.get(col)) for col in columns]
+             + [normalize_serial(row.get(SERIAL_COLUMN))] for row in rows),
+        )
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+
+    def save(self, df: pd.DataFrame) -> None:
+        rows = df.to_dict("records")
+        with closing(self._connect()) as conn, conn:
+            existing = self._table_columns(conn)
+            # Columnas nuevas (cambio de esquema) se añaden en lugar de perderse
+            for col in df.columns:
+                if col not in existing:
+                    conn.execute(f"ALTER TABLE {TABLE_NAME} ADD COLUMN {_quote(col)} TEXT")
+                    existing.append(col)
+            conn.execute(f"DELETE FROM {TABLE_NAME}")
+            self._insert(conn, existing, rows)
+
+    def append(self, rows: List[Dict]) -> bool:
+        with closing(self._connect()) as conn, conn:
+            existing = self._table_columns(conn)
+            if any(set(row) - set(existing) for row in rows):
+                return False
+            self._insert(conn, existing, rows)
+        return True
+
+    def next_id(self, compute_max: Callable[[], int]) -> int:
+        # MAX sobre una columna indexada: no requiere los datos en memoria
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT MAX(CAST({_quote('ID')} AS INTEGER)) FROM {TABLE_NAME}").fetchone()
+        return int(row[0] or 0) + 1
+
+    def lookup_serial(self, serial_key: str) -> Optional[List[Dict]]:
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            columns = self._table_columns(conn)
+            select = ", ".join(_quote(col) for col in columns)
+            # Visitas por fecha de recepción (texto ISO), sin fecha al final
+            reception = _quote("Fecha de Recepcion")
+            cursor = conn.execute(
+                f"SELECT {select} FROM {TABLE_NAME} WHERE {SERIAL_KEY_COLUMN} = ? "
+                f"ORDER BY {reception} IS NULL, {reception}, rowid",
+                (serial_key,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
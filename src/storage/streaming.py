@@ -0,0 +1,54 @@
+"""
+Workbook Streaming module for RETI-C application.
+Reads .xlsx workbooks row by row with bounded memory.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+import pandas as pd
+from openpyxl import load_workbook
+
+from .atomic_io import read_bytes
+
+
+def iter_xlsx_chunks(path: Path, chunk_size: int,
+                     map_headers: Optional[Callable[[List], List[str]]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Recorre la hoja activa de un libro en bloques de `chunk_size` filas.
+
+    Usa el modo de solo lectura de openpyxl con `values_only`: las filas se
+    leen del XML a medida que se consumen, sin construir el modelo completo
+    de celdas, de modo que la memoria queda acotada por el tamaño del bloque.
+    El libro se cierra aunque el consumidor abandone la iteración antes de
+    terminar (p. ej. al encontrar una coincidencia). El archivo comprimido
+    se lee de una vez (ver atomic_io.read_bytes): pesa mucho menos que las
+    filas ya procesadas y evita las lecturas dispersas sobre SMB.
+
+    Args:
+        path (Path): Libro a recorrer
+        chunk_size (int): Filas por bloque
+        map_headers (Optional[Callable]): Traduce la fila de encabezados a
+            nombres de columna; por defecto se usan tal cual
+
+    Returns:
+        Iterator[pd.DataFrame]: Bloques con las columnas del encabezado
+    """
+    workbook = load_workbook(read_bytes(path), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = list(next(rows, ()))
+        headers = map_headers(headers) if map_headers else [str(header) for header in headers]
+        buffer = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=headers)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=headers)
+    finally:
+        workbook.close()
@@ -0,0 +1,200 @@
+"""
+Sync module for RETI-C application.
+Batched reconciliation of records saved in local fallback mode into the network workbook.
+
+Author: Carlos Verastegui
+Version: 1.0
+Date: 18/10/2026
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+
+from .config import Config
+from .indexes import SERIAL_COLUMN, normalize_serial
+from .schema import apply_schema, concat_frames, format_date
+from .storage import create_backend
+
+RECEPTION_COLUMN = "Fecha de Recepcion"
+
+
+def visit_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Construye la clave de visita (número de serie + fecha de recepción).
+
+    Un mismo equipo puede tener varias visitas, así que la serie sola no
+    identifica un registro; la fecha se normaliza a AAAA-MM-DD para que
+    "2025-08-04" y un datetime del mismo día coincidan.
+
+    Args:
+        df (pd.DataFrame): Registros del inventario
+
+    Returns:
+        pd.Series: Clave "serie|fecha" por fila
+    """
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+    serials = df[SERIAL_COLUMN].map(normalize_serial) if SERIAL_COLUMN in df.columns else ""
+    if RECEPTION_COLUMN in df.columns:
+        dates = df[RECEPTION_COLUMN].map(lambda value: format_date(value, default=""))
+    else:
+        dates = ""
+    return serials + "|" + dates
+
+
+class SyncEngine:
+    """
+    Sube al libro de red los registros guardados en modo local.
+
+    La sincronización es incremental: una marca de agua persistente
+    (Config.SYNC_STATE_FILE) guarda el mayor ID local ya procesado, así que
+    cada ejecución solo lee las filas locales posteriores. Las visitas que
+    ya existen en la red (misma serie y fecha de recepción) se omiten; las
+    demás se escriben con una sola escritura mediante
+    DataManager.add_records(), que les asigna IDs nuevos de la red y evita
+    así colisiones con los IDs locales.
+    """
+
+    def __init__(self, data_manager, local_path: Optional[Path] = None,
+                 state_path: Optional[Path] = None):
+        """
+        Args:
+            data_manager: DataManager en modo red (destino)
+            local_path (Path): Libro local de origen (por defecto Config.EXCEL_LOCAL_PATH)
+            state_path (Path): Archivo de la marca de agua (por defecto Config.SYNC_STATE_FILE)
+        """
+        self.data_manager = data_manager
+        self.local_path = Path(local_path or Config.EXCEL_LOCAL_PATH)
+        self.state_path = Path(state_path or Config.SYNC_STATE_FILE)
+
+    def load_watermark(self) -> int:
+        """Devuelve el mayor ID local ya sincronizado (0 si nunca se sincronizó)."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return int(state.get(str(self.local_path), 0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0
+
+    def save_watermark(self, watermark: int) -> None:
+        """Guarda la marca de agua del libro local (escritura atómica)."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if not isinstance(state, dict):
+                state = {}
+        except (OSError, ValueError):
+            state = {}
+        state[str(self.local_path)] = int(watermark)
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def local_backend(self):
+        """
+        Backend del almacenamiento local de origen.
+
+        Con Config.STORAGE_BACKEND = "sqlite" los registros locales están en
+        la base .sqlite junto al libro, no en el .xlsx de `local_path`.
+        """
+        return create_backend(Config.STORAGE_BACKEND, self.local_path, Config.COLUMNS)
+
+    def has_local_data(self) -> bool:
+        """Indica si existe almacenamiento local distinto del activo que sincronizar."""
+        if self.local_path == Path(self.data_manager.active_path):
+            return False
+        return self.local_backend().exists()
+
+    def pending_records(self) -> pd.DataFrame:
+        """
+        Lee del libro local las filas posteriores a la marca de agua.
+
+        Si el mayor ID local es menor que la marca, el libro local se
+        recreó y se vuelve a considerar completo.
+
+        Returns:
+            pd.DataFrame: Filas locales pendientes, ordenadas por ID
+        """
+        backend = self.local_backend()
+        if not backend.exists():
+            return pd.DataFrame(columns=Config.COLUMNS)
+        watermark = self.load_watermark()
+        chunks = []
+        max_id = 0
+        for chunk in backend.iter_chunks(Config.STREAM_CHUNK_SIZE):
+            ids = pd.to_numeric(chunk['ID'], errors='coerce')
+            if ids.notna().any():
+                max_id = max(max_id, int(ids.max()))
+            chunks.append(chunk.assign(ID=ids))
+        if not chunks:
+            return pd.DataFrame(columns=Config.COLUMNS)
+        df = apply_schema(concat_frames(chunks))
+        if max_id < watermark:
+            print("ADVERTENCIA: El libro local se recreó; se reinicia la marca de sincronización.")
+            watermark = 0
+        return df[df['ID'] > watermark].sort_values('ID', kind='stable')
+
+    def sync(self) -> Dict:
+        """
+        Sincroniza los registros locales pendientes con el libro de red.
+
+        Returns:
+            Dict: Reporte con 'pending', 'added', 'duplicates', 'rejected'
+                (lista de {'id', 'reason'}), 'id_map' (ID local -> ID de red)
+                y 'watermark'; 'error' si no se pudo escribir
+
+        Raises:
+            ConnectionError: Si el DataManager no está en modo red
+        """
+        if not self.data_manager.is_network_mode:
+            raise ConnectionError("La sincronización requiere la ruta de red.")
+        report = {'pending': 0, 'added': 0, 'duplicates': 0, 'rejected': [],
+                  'id_map': {}, 'watermark': self.load_watermark()}
+        if self.local_path == Path(self.data_manager.active_path):
+            return report
+        pending = self.pending_records()
+        report['pending'] = len(pending)
+        if pending.empty:
+            return report
+
+        # Omitir visitas que ya están en la red y repetidas dentro del lote
+        network_keys = set(visit_keys(self.data_manager.current_frame()))
+        keys = visit_keys(pending)
+        duplicated = keys.isin(network_keys) | keys.duplicated()
+        report['duplicates'] = int(duplicated.sum())
+        to_push = pending[~duplicated.to_numpy()]
+
+        local_ids: List[int] = [int(value) for value in to_push['ID']]
+        rows = []
+        for record in to_push.astype(object).where(to_push.notna(), None).to_dict('records'):
+            for column in Config.DATE_COLUMNS:
+                if column in record:
+                    record[column] = format_date(record[column], default=None)
+            rows.append(record)
+
+        if rows:
+            batch = self.data_manager.add_records(rows)
+            if batch['added'] == 0 and any(item['reason'] == Config.MSG_ERROR_GUARDADO
+                                           for item in batch['rejected']):
+                # Nada se escribió: la marca no avanza y el lote se reintenta
+                report['error'] = Config.MSG_ERROR_GUARDADO
+                return report
+            rejected_positions = {item['row'] for item in batch['rejected']}
+            report['rejected'] = [{'id': local_ids[item['row']], 'reason': item['reason']}
+                                  for item in batch['rejected']]
+            accepted = [local_id for position, local_id in enumerate(local_ids)
+                        if position not in rejected_positions]
+            report['id_map'] = {local_id: batch['first_id'] + offset
+                                for offset, local_id in enumerate(accepted)}
+            report['added'] = batch['added']
+
+        report['watermark'] = int(pending['ID'].max())
+        self.save_watermark(report['watermark'])
+        print(f"INFO: Sincronización completada: {report['added']} registro(s) subidos, "
+              f"{report['duplicates']} duplicado(s) omitidos.")
+        return report
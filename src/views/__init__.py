@@ -1,6 +1,20 @@
 # Este archivo hace que el directorio views sea un paquete de Python
-from .dashboard_view import DashboardView
-from .registration_view import RegistrationView
-from .search_view import SearchView
+# Las vistas se importan bajo demanda: importar una vista no debe cargar las
+# demás (ni pandas) durante el arranque.
+import importlib
 
-__all__ = ['DashboardView', 'RegistrationView', 'SearchView'] 
\ No newline at end of file
+_VIEW_MODULES = {
+    'DashboardView': '.dashboard_view',
+    'RegistrationView': '.registration_view',
+    'SearchView': '.search_view',
+    'InventoryView': '.inventory_view',
+}
+
+
+def __getattr__(name):
+    if name in _VIEW_MODULES:
+        return getattr(importlib.import_module(_VIEW_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['DashboardView', 'RegistrationView', 'SearchView', 'InventoryView']
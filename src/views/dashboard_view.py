@@ -1,6 +1,7 @@
 # src/views/dashboard_view.py
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFrame
 from PyQt6.QtCore import Qt
+from datetime import date
 from src.config import Config
 
 class DashboardView(QWidget):
@@ -8,8 +9,9 @@ class DashboardView(QWidget):
     Vista de bienvenida o panel principal de RETI-C.
     Proporciona información general y acceso rápido a funcionalidades principales.
     """
-    def __init__(self):
+    def __init__(self, data_manager=None):
         super().__init__()
+        self.data_manager = data_manager
         self.setup_ui()
 
     def setup_ui(self):
@@ -21,7 +23,11 @@ class DashboardView(QWidget):
         # Header Section
         self.create_header_section(main_layout)
         
-        # Stats/Info Section (placeholder para futuras métricas)
+        # Métricas del inventario (solo con datos disponibles)
+        if self.data_manager is not None:
+            self.create_stats_section(main_layout)
+        
+        # Info Section
         self.create_info_section(main_layout)
         
         # Spacer para centrar verticalmente
@@ -75,6 +81,76 @@ class DashboardView(QWidget):
         
         parent_layout.addLayout(header_layout)
 
+    def create_stats_section(self, parent_layout):
+        """Crea las tarjetas de métricas y el desglose por estado."""
+        stats_layout = QHBoxLayout()
+        stats_layout.setSpacing(20)
+        stats_layout.addStretch()
+        
+        self.stat_labels = {}
+        for key, title in (('total', "Equipos registrados"),
+                           ('open_backlog', "Pendientes de entrega"),
+                           ('intakes_week', "Ingresos esta semana"),
+                           ('mean_turnaround_days', "Tiempo medio de atención")):
+            card = QFrame()
+            card.setObjectName("stat_card")
+            card.setStyleSheet(f"""
+                #stat_card {{
+                    background-color: white;
+                    border: 1px solid {Config.COLOR_CFE_BORDER};
+                    border-radius: 8px;
+                    padding: 12px;
+                }}
+            """)
+            card.setMinimumWidth(170)
+            card_layout = QVBoxLayout(card)
+            value_label = QLabel("—")
+            value_label.setStyleSheet(f"color: {Config.COLOR_CFE_GREEN}; font-size: 26px; font-weight: bold;")
+            value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            title_label = QLabel(title)
+            title_label.setStyleSheet(f"color: {Config.COLOR_GRAY_TEXT}; font-size: 12px;")
+            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            card_layout.addWidget(value_label)
+            card_layout.addWidget(title_label)
+            self.stat_labels[key] = value_label
+            stats_layout.addWidget(card)
+        
+        stats_layout.addStretch()
+        parent_layout.addLayout(stats_layout)
+        
+        # Desglose por estado
+        self.status_breakdown_label = QLabel("")
+        self.status_breakdown_label.setStyleSheet("color: #333333; font-size: 13px;")
+        self.status_breakdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        parent_layout.addWidget(self.status_breakdown_label)
+
+    def refresh_stats(self):
+        """
+        Actualiza las métricas desde el motor de estadísticas de DataManager.
+        
+        Los agregados se mantienen de forma incremental, por lo que la
+        actualización no recorre el inventario salvo que el archivo haya
+        cambiado externamente.
+        """
+        if self.data_manager is None:
+            return
+        stats = self.data_manager.get_stats()
+        
+        year, week, _ = date.today().isocalendar()
+        turnaround = stats['mean_turnaround_days']
+        
+        self.stat_labels['total'].setText(str(stats['total']))
+        self.stat_labels['open_backlog'].setText(str(stats['open_backlog']))
+        self.stat_labels['intakes_week'].setText(str(stats['intakes_per_week'].get(f"{year}-W{week:02d}", 0)))
+        self.stat_labels['mean_turnaround_days'].setText("—" if turnaround is None else f"{turnaround:.1f} días")
+        self.status_breakdown_label.setText(
+            "   ·   ".join(f"{status}: {count}" for status, count in stats['by_status'].items()))
+
+    def showEvent(self, event):
+        """Refresca las métricas cada vez que se muestra el dashboard."""
+        super().showEvent(event)
+        self.refresh_stats()
+
     def create_info_section(self, parent_layout):
         """Crea la sección de información del sistema."""
         info_frame = QFrame()
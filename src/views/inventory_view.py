@@ -0,0 +1,170 @@
+# src/views/inventory_view.py
+import numpy as np
+import pandas as pd
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from src.config import Config
+from src.schema import format_date
+
+
+class InventoryTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla virtualizado sobre el DataFrame en caché de DataManager.
+
+    No copia los datos: guarda una referencia al DataFrame (de solo
+    lectura) y un arreglo con el orden de las filas. Las filas se exponen a
+    la vista por lotes mediante canFetchMore/fetchMore y cada celda se lee
+    solo cuando la vista la pinta; ordenar una columna solo reordena el
+    arreglo de posiciones.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._df = pd.DataFrame(columns=Config.COLUMNS)
+        self._order = np.arange(0)
+        self._loaded = 0
+
+    def set_frame(self, df: pd.DataFrame):
+        """
+        Reemplaza los datos del modelo (orden de archivo, primer lote cargado).
+
+        Args:
+            df (pd.DataFrame): DataFrame de solo lectura a mostrar
+        """
+        self.beginResetModel()
+        self._df = df
+        self._order = np.arange(len(df))
+        self._loaded = min(len(df), Config.INVENTORY_FETCH_BATCH)
+        self.endResetModel()
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._df
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._order)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._order) - self._loaded
+        batch = min(remaining, Config.INVENTORY_FETCH_BATCH)
+        if batch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + batch - 1)
+        self._loaded += batch
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self._df.iat[int(self._order[index.row()]), index.column()]
+        if isinstance(value, pd.Timestamp) or self._df.columns[index.column()] in Config.DATE_COLUMNS:
+            return format_date(value, default="")
+        try:
+            if pd.isna(value):
+                return ""
+        except (TypeError, ValueError):
+            pass
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Ordena reordenando el arreglo de posiciones (las celdas no se tocan)."""
+        if column < 0 or column >= len(self._df.columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        values = self._df.iloc[:, column].reset_index(drop=True)
+        if values.dtype == object:
+            # Texto sin distinguir mayúsculas; valores mixtos comparables como texto
+            values = values.map(lambda v: v if pd.isna(v) else str(v).casefold())
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            # Se ordenan solo las categorías; cada fila toma el rango de su código
+            names = [str(category).casefold() for category in values.cat.categories]
+            ranks = np.empty(len(names), dtype=float)
+            ranks[np.argsort(names, kind="stable")] = np.arange(len(names))
+            codes = values.cat.codes.to_numpy()
+            values = pd.Series(np.where(codes >= 0, ranks[codes] if len(ranks) else 0, np.nan))
+        ascending = order == Qt.SortOrder.AscendingOrder
+        self._order = values.sort_values(ascending=ascending, kind="stable",
+                                         na_position="last").index.to_numpy()
+        self.layoutChanged.emit()
+
+
+class InventoryView(QWidget):
+    """
+    Vista de consulta del inventario completo en una tabla.
+    Evita abrir el libro compartido en Excel (y bloquearlo) solo para consultarlo.
+    """
+
+    def __init__(self, data_manager):
+        super().__init__()
+        self.data_manager = data_manager
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configura la interfaz de usuario del inventario."""
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(Config.UI_LAYOUT_SPACING)
+        main_layout.setContentsMargins(*Config.UI_VIEW_MARGINS)
+
+        title_label = QLabel("📋 Inventario de Equipos")
+        title_label.setObjectName("inventory_title")
+        title_label.setStyleSheet(f"""
+            #inventory_title {{
+                color: {Config.COLOR_CFE_GREEN};
+                font-size: 28px;
+                font-weight: bold;
+            }}
+        """)
+
+        self.count_label = QLabel("")
+        self.count_label.setStyleSheet(f"color: {Config.COLOR_GRAY_TEXT}; font-size: 13px;")
+
+        self.model = InventoryTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+        # Altura de fila fija: la vista no mide el contenido de cada fila
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(Config.UI_TABLE_ROW_HEIGHT)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setDefaultSectionSize(150)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+
+        main_layout.addWidget(title_label)
+        main_layout.addWidget(self.count_label)
+        main_layout.addWidget(self.table)
+
+    def refresh(self):
+        """Vuelve a cargar el modelo si los datos cambiaron desde la última vez."""
+        df = self.data_manager.current_frame()
+        if df is self.model.frame:
+            return
+        header = self.table.horizontalHeader()
+        column, order = header.sortIndicatorSection(), header.sortIndicatorOrder()
+        self.model.set_frame(df)
+        if 0 <= column < self.model.columnCount():
+            self.model.sort(column, order)
+        self.count_label.setText(f"{len(df)} registro(s)")
+
+    def showEvent(self, event):
+        """Actualiza la tabla cada vez que se muestra la vista."""
+        super().showEvent(event)
+        self.refresh()
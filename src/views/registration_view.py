@@ -20,22 +20,34 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QDate, Qt, QSize, QRect, QAbstractListModel, QModelIndex, QTimer
 from PyQt6.QtGui import QPainter, QPen, QFont
 from PyQt6.QtWidgets import QStyledItemDelegate
-from src.data_manager import DataManager
+from typing import TYPE_CHECKING
 from src.config import Config
 
+if TYPE_CHECKING:
+    from src.data_manager import DataManager
+
 class RegistrationView(QWidget):
     """
     Encapsula toda la UI y la lógica para el registro de nuevos equipos.
     """
-    def __init__(self, data_manager: DataManager):
+    def __init__(self, data_manager: "DataManager", save_worker=None):
         """
         Inicializa la vista de registro.
 
         Args:
             data_manager: Una instancia de la clase DataManager para la interacción con los datos.
+            save_worker: SaveWorker opcional; si se proporciona, los guardados se
+                ejecutan en segundo plano y el formulario se limpia de inmediato.
+                Un guardado fallido se devuelve al formulario (ver restore_failed_record).
         """
         super().__init__()
         self.data_manager = data_manager
+        self.save_worker = save_worker
+        # Registros cuyo guardado falló mientras se capturaba otro; se
+        # recuperan en el formulario en cuanto vuelve a quedar libre
+        self.failed_records: list[dict] = []
+        if self.save_worker is not None:
+            self.save_worker.failed.connect(self.restore_failed_record)
         
         # Layout raíz con scroll para contenido y footer fijo abajo
         self.outer_layout = QVBoxLayout(self)
@@ -396,6 +408,22 @@ class RegistrationView(QWidget):
         for chip in getattr(self, 'component_chips', []):
             chip.setChecked(False)
         self._seed_demo_timeline()
+        if self.failed_records:
+            self.set_form_data(self.failed_records.pop(0))
+
+    def restore_failed_record(self, serial_number: str, error_message: str, record_data: dict):
+        """
+        Recupera en el formulario un registro cuyo guardado en segundo plano falló.
+
+        Si el formulario ya tiene otro registro en captura no se sobrescribe:
+        el fallido queda en `failed_records` y aparece al limpiar el formulario.
+        """
+        if not record_data:
+            return
+        if self.fields['Numero de Serie'].text().strip():
+            self.failed_records.append(record_data)
+        else:
+            self.set_form_data(record_data)
 
 
     def save_record(self):
@@ -409,6 +437,12 @@ class RegistrationView(QWidget):
                                    Config.MSG_CAMPO_REQUERIDO.format(field_name=required_field))
                 return
 
+        # Guardado en segundo plano: el resultado llega por señales del SaveWorker
+        if self.save_worker is not None:
+            self.save_worker.submit(data)
+            self.clear_form()
+            return
+
         # Usar el método correcto del data_manager y manejar el resultado
         if self.data_manager.add_record(data):
             serial_number = data.get('Numero de Serie', '')
@@ -425,6 +459,23 @@ class RegistrationView(QWidget):
         else:
             self.fields['Marca y Modelo'].clear()
     
+    def set_form_data(self, data: dict):
+        """Rellena los widgets del formulario con un diccionario (inverso de get_form_data)."""
+        for field_name, field_widget in self.fields.items():
+            value = data.get(field_name)
+            if value is None:
+                continue
+            if isinstance(field_widget, QLineEdit):
+                field_widget.setText(str(value))
+            elif isinstance(field_widget, QComboBox):
+                field_widget.setCurrentText(str(value))
+            elif isinstance(field_widget, QDateEdit):
+                date = QDate.fromString(str(value), Config.FORMATO_FECHA)
+                if date.isValid():
+                    field_widget.setDate(date)
+            elif isinstance(field_widget, QTextEdit):
+                field_widget.setPlainText(str(value))
+
     def get_form_data(self) -> dict:
         """Recopila los datos de todos los widgets del formulario en un diccionario."""
         data = {}
@@ -1,8 +1,12 @@
 # src/views/search_view.py
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QTextEdit, QFrame)
-from PyQt6.QtCore import Qt
+                             QLineEdit, QPushButton, QTextEdit, QFrame, QCompleter,
+                             QListWidget, QListWidgetItem)
+from PyQt6.QtCore import Qt, QStringListModel, QThreadPool, pyqtSignal
+import pandas as pd
 from src.config import Config
+from src.schema import format_date
+from src.search_worker import SearchSignals, SearchTask
 
 class SearchView(QWidget):
     """
@@ -10,9 +14,22 @@ class SearchView(QWidget):
     Permite consultar el historial completo de un equipo.
     """
     
+    # Señal emitida cuando se muestra el resultado de la búsqueda más reciente
+    search_completed = pyqtSignal()
+    
     def __init__(self, data_manager):
         super().__init__()
         self.data_manager = data_manager
+        
+        # Búsquedas en segundo plano: solo se muestra la generación más reciente
+        self._search_generation = 0
+        self._active_query = ""
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(Config.SEARCH_THREADS)
+        self.search_signals = SearchSignals(self)
+        self.search_signals.finished.connect(self.on_search_finished)
+        self.search_signals.failed.connect(self.on_search_failed)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -128,11 +145,44 @@ class SearchView(QWidget):
         input_layout.addStretch()
         
         search_layout.addLayout(input_layout)
+        
+        # Búsqueda por texto libre en descripción e historial
+        text_layout = QHBoxLayout()
+        
+        text_label = QLabel("Texto libre:")
+        text_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        
+        self.text_input = QLineEdit()
+        self.text_input.setPlaceholderText("Ej: pantalla, disco duro")
+        self.text_input.setToolTip("Busca en la descripción del problema y en el historial de intervenciones")
+        self.text_input.setStyleSheet(self.serial_input.styleSheet())
+        
+        self.text_search_button = QPushButton("📝 Buscar texto")
+        self.text_search_button.setStyleSheet(self.search_button.styleSheet())
+        
+        text_layout.addWidget(text_label)
+        text_layout.addWidget(self.text_input)
+        text_layout.addWidget(self.text_search_button)
+        text_layout.addStretch()
+        
+        search_layout.addLayout(text_layout)
         parent_layout.addWidget(search_frame)
         
+        # Sugerencias mientras se escribe, alimentadas por el índice de prefijos
+        self.suggestion_model = QStringListModel(self)
+        self.serial_completer = QCompleter(self.suggestion_model, self)
+        self.serial_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.serial_completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.serial_completer.setMaxVisibleItems(Config.SUGGEST_LIMIT)
+        self.serial_input.setCompleter(self.serial_completer)
+        
         # Conectar señales
         self.search_button.clicked.connect(self.perform_search)
         self.serial_input.returnPressed.connect(self.perform_search)
+        self.serial_input.textEdited.connect(self.update_suggestions)
+        self.serial_completer.activated.connect(self.on_suggestion_activated)
+        self.text_search_button.clicked.connect(self.perform_text_search)
+        self.text_input.returnPressed.connect(self.perform_text_search)
     
     def create_results_section(self, parent_layout):
         """Crea la sección de resultados."""
@@ -176,58 +226,162 @@ class SearchView(QWidget):
             }}
         """)
         
+        # Lista de coincidencias de la búsqueda por texto (oculta hasta usarla)
+        self.text_results_list = QListWidget()
+        self.text_results_list.setMaximumHeight(160)
+        self.text_results_list.setVisible(False)
+        self.text_results_list.currentItemChanged.connect(self.on_text_result_selected)
+        
         results_layout.addWidget(self.results_header)
+        results_layout.addWidget(self.text_results_list)
         results_layout.addWidget(self.results_text)
         parent_layout.addWidget(results_frame)
     
+    def update_suggestions(self, text):
+        """Actualiza las sugerencias del completador con las series que empiezan por `text`."""
+        if len(text.strip()) < Config.SUGGEST_MIN_CHARS:
+            self.suggestion_model.setStringList([])
+            return
+        self.suggestion_model.setStringList(self.data_manager.suggest_serials(text))
+        self.serial_completer.complete()
+    
+    def on_suggestion_activated(self, serial_number):
+        """Busca directamente la serie elegida en la lista de sugerencias."""
+        self.serial_input.setText(serial_number)
+        self.perform_search()
+    
+    def perform_text_search(self):
+        """Lanza la búsqueda por texto libre en segundo plano."""
+        query = self.text_input.text().strip()
+        self.text_results_list.clear()
+        self.text_results_list.setVisible(False)
+        
+        if not query:
+            self._search_generation += 1  # Descarta cualquier búsqueda en curso
+            self.show_message("Por favor, ingresa el texto a buscar.", "warning")
+            return
+        
+        self._start_search("text", query, lambda: self.data_manager.search_text(query))
+    
+    def show_text_results(self, query, records):
+        """Muestra la lista de registros de la búsqueda por texto, ordenada por relevancia."""
+        if not records:
+            self.show_message(f"No se encontraron equipos que mencionen: {query}", "info")
+            return
+        
+        for record in records:
+            description = str(record.get('Descripcion del Problema') or '').strip()
+            if len(description) > 60:
+                description = description[:57] + "..."
+            item = QListWidgetItem(f"{record.get('Numero de Serie', 'N/A')} · "
+                                   f"{record.get('Tipo de Equipo', 'N/A')} · {description}")
+            item.setData(Qt.ItemDataRole.UserRole, record)
+            self.text_results_list.addItem(item)
+        
+        self.text_results_list.setVisible(True)
+        self.text_results_list.setCurrentRow(0)
+        self.results_header.setText(f"✅ {len(records)} equipo(s) mencionan «{query}»")
+    
+    def on_text_result_selected(self, current, previous=None):
+        """Muestra el detalle del registro elegido en la lista de coincidencias."""
+        if current is None:
+            return
+        header = self.results_header.text()
+        self.display_result([current.data(Qt.ItemDataRole.UserRole)])
+        # Conservar el resumen de la búsqueda por texto en el encabezado
+        self.results_header.setText(header)
+    
     def perform_search(self):
-        """Ejecuta la búsqueda y muestra los resultados."""
+        """Lanza la búsqueda por número de serie en segundo plano."""
         serial_number = self.serial_input.text().strip()
+        self.text_results_list.setVisible(False)
         
         if not serial_number:
+            self._search_generation += 1  # Descarta cualquier búsqueda en curso
             self.show_message("Por favor, ingresa un número de serie.", "warning")
             return
         
-        try:
-            result = self.data_manager.find_by_serial(serial_number)
-            
-            if result:
-                self.display_result(result)
-            else:
-                self.show_message(f"No se encontró ningún equipo con el número de serie: {serial_number}", "info")
-                
-        except Exception as e:
-            self.show_message(f"Error al realizar la búsqueda: {str(e)}", "error")
-    
-    def display_result(self, record):
-        """Muestra el resultado de la búsqueda."""
-        self.results_header.setText("✅ Equipo Encontrado")
-        
-        # Formatear resultado
+        self._start_search("serial", serial_number,
+                           lambda: self.data_manager.find_all_by_serial(serial_number))
+    
+    def _start_search(self, kind, query, search):
+        """
+        Envía una consulta al pool de hilos con una nueva generación.
+        
+        Las búsquedas anteriores aún en curso quedan obsoletas: si no han
+        empezado se descartan y, si terminan después, su resultado se ignora.
+        """
+        self._search_generation += 1
+        self._active_query = query
+        self.results_header.setText("⏳ Buscando...")
+        self.thread_pool.start(SearchTask(self.search_signals, self._search_generation, kind, search,
+                                          lambda generation: generation == self._search_generation))
+    
+    def on_search_finished(self, generation, kind, result):
+        """Muestra el resultado de una búsqueda si sigue siendo la más reciente."""
+        if generation != self._search_generation:
+            return
+        if kind == "text":
+            self.show_text_results(self._active_query, result)
+        elif result:
+            self.display_result(result)
+        else:
+            self.show_message(f"No se encontró ningún equipo con el número de serie: {self._active_query}", "info")
+        self.search_completed.emit()
+    
+    def on_search_failed(self, generation, kind, error_message):
+        """Informa del error de una búsqueda si sigue siendo la más reciente."""
+        if generation != self._search_generation:
+            return
+        self.show_message(f"Error al realizar la búsqueda: {error_message}", "error")
+        self.search_completed.emit()
+    
+    def display_result(self, records):
+        """
+        Muestra el historial completo de un equipo: una sección por visita.
+        
+        Args:
+            records: Lista de visitas ordenadas por fecha de recepción (o un
+                único registro)
+        """
+        if isinstance(records, dict):
+            records = [records]
+        latest = records[-1]
+        
+        if len(records) == 1:
+            self.results_header.setText("✅ Equipo Encontrado")
+        else:
+            self.results_header.setText(f"✅ Equipo Encontrado · {len(records)} visitas")
+        
+        # Datos del equipo (de la visita más reciente) y una sección por visita
         result_text = f"""
 📋 INFORMACIÓN DEL EQUIPO
 ═══════════════════════════════════════════════════════════════════════════════
 
-🆔 ID: {record.get('ID', 'N/A')}
-💻 Tipo de Equipo: {record.get('Tipo de Equipo', 'N/A')}
-🏷️  Marca y Modelo: {record.get('Marca y Modelo', 'N/A')}
-🔢 Número de Serie: {record.get('Numero de Serie', 'N/A')}
-📅 Fecha de Recepción: {record.get('Fecha de Recepcion', 'N/A')}
-📤 Fecha de Entrega: {record.get('Fecha de Entrega', 'N/A')}
-👤 Responsable: {record.get('Responsable Recepcion', 'N/A')}
-📊 Estado: {record.get('Estado', 'N/A')}
-
-🔧 DESCRIPCIÓN DEL PROBLEMA
+💻 Tipo de Equipo: {_text(latest.get('Tipo de Equipo'))}
+🏷️  Marca y Modelo: {_text(latest.get('Marca y Modelo'))}
+🔢 Número de Serie: {_text(latest.get('Numero de Serie'))}
+🔁 Visitas registradas: {len(records)}
+"""
+        for number, record in enumerate(records, start=1):
+            result_text += f"""
+🗓️ VISITA {number} DE {len(records)}
 ═══════════════════════════════════════════════════════════════════════════════
-{record.get('Descripcion del Problema', 'No especificado')}
 
-📦 COMPONENTES ENTREGADOS
-═══════════════════════════════════════════════════════════════════════════════
-{record.get('Componentes Entregados', 'No especificado')}
+🆔 ID: {_text(record.get('ID'))}
+📅 Fecha de Recepción: {format_date(record.get('Fecha de Recepcion'))}
+📤 Fecha de Entrega: {format_date(record.get('Fecha de Entrega'))}
+👤 Responsable: {_text(record.get('Responsable Recepcion'))}
+📊 Estado: {_text(record.get('Estado'))}
 
-📝 HISTORIAL DE INTERVENCIONES
-═══════════════════════════════════════════════════════════════════════════════
-{record.get('Historial Intervenciones', 'Sin intervenciones registradas')}
+🔧 Descripción del problema:
+{_text(record.get('Descripcion del Problema'), 'No especificado')}
+
+📦 Componentes entregados:
+{_text(record.get('Componentes Entregados'), 'No especificado')}
+
+📝 Historial de intervenciones:
+{_text(record.get('Historial Intervenciones'), 'Sin intervenciones registradas')}
 """
         
         self.results_text.setPlainText(result_text)
@@ -241,4 +395,17 @@ class SearchView(QWidget):
         elif message_type == "error":
             self.results_text.setPlainText(f"❌ {message}")
         else:
-            self.results_text.setPlainText(f"ℹ️ {message}")
\ No newline at end of file
+            self.results_text.setPlainText(f"ℹ️ {message}")
+
+
+def _text(value, default="N/A") -> str:
+    """Texto de una celda para mostrarlo; las celdas vacías (NaN) usan `default`."""
+    if value is None:
+        return default
+    try:
+        if pd.isna(value):
+            return default
+    except (TypeError, ValueError):
+        pass
+    text = str(value).strip()
+    return text or default
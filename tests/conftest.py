@@ -0,0 +1,56 @@
+# tests/conftest.py
+import pytest
+from src.config import Config
+from src.data_manager import DataManager
+
+
+@pytest.fixture(autouse=True)
+def aislar_archivos_locales(tmp_path, monkeypatch):
+    """Redirige los archivos auxiliares locales (instantáneas, estado de red y de sincronización) a un directorio temporal."""
+    monkeypatch.setattr(Config, 'SNAPSHOT_DIR', tmp_path / "cache")
+    monkeypatch.setattr(Config, 'NETWORK_STATE_FILE', tmp_path / "cache" / "network_state.json")
+    monkeypatch.setattr(Config, 'SYNC_STATE_FILE', tmp_path / "cache" / "sync_state.json")
+
+
+@pytest.fixture
+def libro_temporal(tmp_path, monkeypatch):
+    """Apunta las rutas de red y local a un mismo libro Excel temporal."""
+    excel_path = tmp_path / "test_inventario.xlsx"
+    monkeypatch.setattr(Config, 'EXCEL_NETWORK_PATH', excel_path)
+    monkeypatch.setattr(Config, 'EXCEL_LOCAL_PATH', excel_path)
+    return excel_path
+
+
+@pytest.fixture
+def rutas(tmp_path, monkeypatch):
+    """Libros de red y local temporales en directorios distintos."""
+    red = tmp_path / "red" / "test_inventario.xlsx"
+    local = tmp_path / "local" / "test_inventario.xlsx"
+    red.parent.mkdir()
+    monkeypatch.setattr(Config, 'EXCEL_NETWORK_PATH', red)
+    monkeypatch.setattr(Config, 'EXCEL_LOCAL_PATH', local)
+    return red, local
+
+
+@pytest.fixture
+def data_manager(libro_temporal):
+    """DataManager sobre el libro temporal."""
+    return DataManager()
+
+
+@pytest.fixture
+def nuevo_registro():
+    """Fábrica de registros válidos: nuevo_registro(serie, fecha=..., **campos)."""
+    def crear(serial, fecha='2025-08-04', **extra):
+        registro = {
+            'Tipo de Equipo': 'Laptop',
+            'Marca y Modelo': 'Dell XPS 15',
+            'Numero de Serie': serial,
+            'Fecha de Recepcion': fecha,
+            'Descripcion del Problema': 'Pantalla azul.',
+            'Responsable Recepcion': 'Carlos V.',
+            'Estado': 'Recibido'
+        }
+        registro.update(extra)
+        return registro
+    return crear
@@ -0,0 +1,37 @@
+# tests/test_atomic_io.py
+import os
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from src.storage.atomic_io import read_bytes, write_bytes_atomic
+
+# --- Tests ---
+
+def test_escritura_interrumpida_conserva_el_archivo_original(tmp_path):
+    """Verifica que un fallo durante la escritura no toca el archivo ni deja temporales."""
+    # ARRANGE
+    destino = tmp_path / "libro.xlsx"
+    destino.write_bytes(b"version anterior")
+
+    # ACT
+    with patch('os.fsync', side_effect=OSError("Conexión interrumpida")):
+        with pytest.raises(OSError):
+            write_bytes_atomic(destino, b"version nueva")
+
+    # ASSERT
+    assert read_bytes(destino).getvalue() == b"version anterior", "El archivo original debería quedar intacto"
+    assert os.listdir(tmp_path) == ["libro.xlsx"], "No deberían quedar archivos temporales"
+
+
+def test_guardados_se_reemplazan_de_forma_atomica(data_manager, nuevo_registro):
+    """Verifica que añadir filas y reescribir el libro pasan por una escritura atómica completa."""
+    # ACT
+    with patch('src.storage.atomic_io.write_bytes_atomic', wraps=write_bytes_atomic) as escritura:
+        data_manager.add_record(nuevo_registro('SN-ATOM-001'))
+        df = data_manager.load_data()
+        data_manager.save_data(df)
+
+    # ASSERT
+    destinos = [call.args[0] for call in escritura.call_args_list]
+    assert destinos == [data_manager.active_path] * 2, "Cada guardado debería ser una escritura atómica del libro"
+    assert list(pd.read_excel(data_manager.active_path)['Numero de Serie']) == ['SN-ATOM-001']
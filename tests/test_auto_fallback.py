@@ -1,9 +1,11 @@
 # tests/test_auto_fallback.py
 import pytest
 import os
+import time
 from unittest.mock import patch
 from src.data_manager import DataManager
 from src.config import Config
+from src.network_probe import load_network_state, save_network_state
 
 # --- Fixtures de Pytest ---
 
@@ -78,4 +80,53 @@ def test_fallback_creates_excel_file_in_local_path(temp_excel_path, monkeypatch)
     import pandas as pd
     df = pd.read_excel(dm.active_path)
     assert list(df.columns) == Config.COLUMNS, "Las columnas del Excel deberían coincidir con la configuración"
-    assert df.empty, "El Excel recién creado debería estar vacío"
\ No newline at end of file
+    assert df.empty, "El Excel recién creado debería estar vacío"
+
+def _sondeo_lento(network_dir):
+    """Simula un recurso SMB que tarda en responder."""
+    time.sleep(1.0)
+    return True, None
+
+
+def test_sondeo_de_red_lento_arranca_en_local_dentro_del_plazo(temp_excel_path, monkeypatch):
+    """Prueba que una red que no responde a tiempo no bloquea el arranque."""
+    # ARRANGE
+    monkeypatch.setattr(Config, 'EXCEL_LOCAL_PATH', temp_excel_path)
+    monkeypatch.setattr(Config, 'NETWORK_PROBE_TIMEOUT', 0.1)
+
+    # ACT
+    with patch('src.network_probe.check_network_dir', side_effect=_sondeo_lento):
+        inicio = time.perf_counter()
+        dm = DataManager()
+        transcurrido = time.perf_counter() - inicio
+        resultado_tardio = dm.network_probe.wait(None)
+
+    # ASSERT
+    assert dm.is_network_mode is False, "Debería arrancar en modo local si la red no responde a tiempo"
+    assert transcurrido < 0.8, f"El arranque no debería esperar al sondeo completo ({transcurrido:.2f} s)"
+    assert "no respondió" in dm.connection_error, "El error debería indicar que venció el plazo"
+    assert resultado_tardio == (True, None), "El sondeo debería terminar en segundo plano"
+    assert load_network_state(Config.NETWORK_STATE_FILE)['reachable'] is True, \
+        "El resultado tardío debería guardarse para el próximo arranque"
+
+
+def test_red_inaccesible_conocida_arranca_en_local_sin_esperar(temp_excel_path, monkeypatch):
+    """Prueba que el último estado 'sin red' evita esperar el sondeo en el arranque."""
+    # ARRANGE
+    monkeypatch.setattr(Config, 'EXCEL_LOCAL_PATH', temp_excel_path)
+    monkeypatch.setattr(Config, 'NETWORK_PROBE_TIMEOUT', 5.0)
+    save_network_state(Config.NETWORK_STATE_FILE, False, "Host inaccesible")
+
+    # ACT
+    with patch('src.network_probe.check_network_dir', side_effect=_sondeo_lento):
+        inicio = time.perf_counter()
+        dm = DataManager()
+        transcurrido = time.perf_counter() - inicio
+        dm.network_probe.wait(None)
+
+    # ASSERT
+    assert dm.is_network_mode is False, "Debería arrancar en modo local si la red estaba inaccesible"
+    assert transcurrido < 0.8, f"No debería esperar el plazo de sondeo ({transcurrido:.2f} s)"
+    assert "Host inaccesible" in dm.connection_error, "El error debería citar la última causa conocida"
+    assert load_network_state(Config.NETWORK_STATE_FILE)['reachable'] is True, \
+        "El sondeo en segundo plano debería actualizar el estado guardado"
@@ -0,0 +1,57 @@
+# tests/test_connectivity_monitor.py
+import pytest
+import pandas as pd
+from unittest.mock import patch
+from src.data_manager import DataManager
+from src.config import Config
+from src.main_app import MainApp
+
+# --- Fixtures de Pytest ---
+
+@pytest.fixture
+def rutas(rutas, monkeypatch):
+    """Rutas de conftest con reintentos de conexión rápidos."""
+    monkeypatch.setattr(Config, 'CONNECTIVITY_RETRY_INITIAL', 0.01)
+    return rutas
+
+# --- Tests ---
+
+def test_switch_to_network_cambia_el_backend_y_la_cache(rutas, nuevo_registro):
+    """Verifica que al pasar a modo red los guardados y lecturas usan el libro de red."""
+    # ARRANGE
+    red, local = rutas
+    with patch('src.network_probe.check_network_dir', return_value=(False, "Host inaccesible")):
+        dm = DataManager()
+    dm.add_record(nuevo_registro('SN-LOCAL'))
+
+    # ACT
+    cambiado = dm.switch_to_network()
+    dm.add_record(nuevo_registro('SN-RED'))
+
+    # ASSERT
+    assert cambiado and dm.is_network_mode, "El DataManager debería quedar en modo red"
+    assert dm.active_path == red and dm.connection_error is None
+    assert list(pd.read_excel(red)['Numero de Serie']) == ['SN-RED'], "El guardado debería ir al libro de red"
+    assert list(pd.read_excel(local)['Numero de Serie']) == ['SN-LOCAL'], "El libro local no debería perder registros"
+    assert dm.find_by_serial('SN-LOCAL') is None, "La caché debería corresponder al libro de red"
+
+
+def test_monitor_reintenta_y_actualiza_la_barra_de_estado(qtbot, rutas):
+    """Verifica que el monitor reintenta con retroceso y promueve la sesión a modo red."""
+    # ARRANGE
+    with patch('src.network_probe.check_network_dir', return_value=(False, "Host inaccesible")):
+        dm = DataManager()
+    resultados = [(False, "Host inaccesible"), (True, None)]
+
+    # ACT
+    with patch('src.network_probe.check_network_dir', side_effect=lambda path: resultados.pop(0)):
+        main_app = MainApp(dm)
+        qtbot.addWidget(main_app)
+        monitor = main_app.connectivity_monitor
+        qtbot.waitUntil(lambda: "Conectado" in main_app.status_bar.currentMessage(), timeout=5000)
+
+    # ASSERT
+    assert monitor.attempts == 2, "Debería haber reintentado tras el primer fallo"
+    assert dm.is_network_mode, "El DataManager debería haber vuelto a modo red"
+    main_app.close()
+    assert not monitor.isRunning(), "El monitor debería terminar al recuperar la red"
@@ -1,9 +1,11 @@
 # tests/test_data_manager.py
 import pytest
 import os
+import threading
 import pandas as pd
 from src.data_manager import DataManager
 from src.config import Config
+from src.stats import StatsEngine
 
 # --- Fixtures de Pytest ---
 
@@ -188,4 +190,408 @@ def test_find_by_serial_validaciones_entrada(data_manager_con_ruta_temporal):
     
     # Búsqueda sin resultados (debe devolver None, no lanzar error)
     resultado_inexistente = dm.find_by_serial("SN-INEXISTENTE")
-    assert resultado_inexistente is None, "Debería devolver None para registros inexistentes"
\ No newline at end of file
+    assert resultado_inexistente is None, "Debería devolver None para registros inexistentes"
+
+def test_load_data_usa_cache_si_el_archivo_no_cambia(data_manager_con_ruta_temporal):
+    """
+    Verifica que lecturas repetidas sin cambios en el archivo se sirven
+    desde la caché en memoria y no vuelven a procesar el Excel.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.invalidate_cache()
+
+    # ACT
+    dm.load_data()
+    dm.load_data()
+    dm.find_by_serial('SN-CUALQUIERA')
+
+    # ASSERT
+    stats = dm.cache_stats()
+    assert stats['misses'] == 1, "Solo la primera lectura debería procesar el archivo."
+    assert stats['hits'] == 2, "Las lecturas siguientes deberían ser aciertos de caché."
+
+
+def test_load_data_relee_si_otro_cliente_modifica_el_archivo(data_manager_con_ruta_temporal):
+    """
+    Verifica que la caché se invalida cuando el archivo cambia externamente
+    (p. ej. otra estación guardó un registro en la red).
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    assert dm.load_data().empty
+
+    externo = pd.DataFrame([{col: None for col in Config.COLUMNS}])
+    externo['ID'] = 7
+    externo['Numero de Serie'] = 'SN-EXTERNO-007'
+    externo.to_excel(dm.active_path, index=False)
+    # Garantizar un mtime distinto aunque el sistema de archivos sea de baja resolución
+    stat = os.stat(dm.active_path)
+    os.utime(dm.active_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+    # ACT
+    misses_antes = dm.cache_stats()['misses']
+    resultado = dm.find_by_serial('SN-EXTERNO-007')
+
+    # ASSERT
+    assert dm.cache_stats()['misses'] == misses_antes + 1, "El cambio externo debería forzar una relectura."
+    assert resultado is not None, "El registro escrito por otro cliente debería ser visible."
+    assert resultado['ID'] == 7
+
+
+def test_add_record_anade_fila_sin_reescritura_completa(data_manager_con_ruta_temporal, monkeypatch):
+    """
+    Verifica que en modo append add_record escribe solo la fila nueva
+    (sin pasar por save_data) respetando el orden de Config.COLUMNS.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    monkeypatch.setattr(Config, 'EXCEL_APPEND_MODE', True)
+    monkeypatch.setattr(dm, 'save_data', lambda df: pytest.fail("No debería reescribirse el libro completo."))
+    registro = {
+        'Estado': 'Recibido',
+        'Numero de Serie': 'SN-APPEND-001',
+        'Tipo de Equipo': 'Laptop',
+        'Marca y Modelo': 'Dell XPS 15',
+        'Fecha de Recepcion': '2025-08-04',
+        'Descripcion del Problema': 'No enciende.',
+        'Responsable Recepcion': 'Carlos V.',
+    }
+
+    # ACT
+    assert dm.add_record(dict(registro)) is True
+    assert dm.add_record(dict(registro, **{'Numero de Serie': 'SN-APPEND-002'})) is True
+
+    # ASSERT
+    df = pd.read_excel(dm.active_path)
+    assert list(df.columns) == Config.COLUMNS, "El orden de columnas debe mantenerse."
+    assert list(df['Numero de Serie']) == ['SN-APPEND-001', 'SN-APPEND-002']
+    assert list(df['ID']) == [1, 2]
+    assert dm.find_by_serial('SN-APPEND-002')['ID'] == 2, "La caché debe reflejar la fila añadida."
+
+
+def test_add_record_reescribe_si_cambia_el_esquema(data_manager_con_ruta_temporal):
+    """
+    Verifica que un registro con columnas fuera de Config.COLUMNS usa la
+    reescritura completa para no perder la información nueva.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    registro = {
+        'Numero de Serie': 'SN-ESQUEMA-001',
+        'Columna Nueva': 'valor extra',
+    }
+
+    # ACT
+    resultado = dm.add_record(registro)
+
+    # ASSERT
+    df = pd.read_excel(dm.active_path)
+    assert resultado is True
+    assert 'Columna Nueva' in df.columns, "La reescritura completa debe conservar la columna nueva."
+    assert df.iloc[0]['Numero de Serie'] == 'SN-ESQUEMA-001'
+
+
+def test_find_all_by_serial_devuelve_todas_las_visitas(data_manager_con_ruta_temporal):
+    """
+    Verifica que el índice por número de serie devuelve todas las filas
+    coincidentes y se mantiene al día con add_record sin reconstruirse.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    base = {
+        'Tipo de Equipo': 'Laptop',
+        'Marca y Modelo': 'Dell XPS 15',
+        'Fecha de Recepcion': '2025-08-04',
+        'Descripcion del Problema': 'Pantalla azul.',
+        'Responsable Recepcion': 'Carlos V.',
+        'Estado': 'Recibido'
+    }
+    dm.add_record(dict(base, **{'Numero de Serie': 'SN-REPETIDO'}))
+    dm.add_record(dict(base, **{'Numero de Serie': 'SN-OTRO'}))
+    dm.find_all_by_serial('SN-OTRO')  # Construye el índice
+    version_indice = dm.serial_index.version
+
+    # ACT
+    dm.add_record(dict(base, **{'Numero de Serie': 'SN-REPETIDO', 'Estado': 'En Reparacion'}))
+    visitas = dm.find_all_by_serial(' SN-REPETIDO ')
+
+    # ASSERT
+    assert [v['ID'] for v in visitas] == [1, 3], "Deberían devolverse todas las visitas del equipo."
+    assert dm.serial_index.version == version_indice, "El índice debería actualizarse sin reconstruirse."
+    assert dm.find_all_by_serial('SN-INEXISTENTE') == []
+
+
+def test_normalize_serial_unifica_series_numericas():
+    """Verifica que las series numéricas leídas como float coinciden con su texto."""
+    from src.indexes import normalize_serial
+
+    assert normalize_serial(12345.0) == '12345'
+    assert normalize_serial('  ABC-1 ') == 'ABC-1'
+    assert normalize_serial(float('nan')) == ''
+    assert normalize_serial(None) == ''
+
+
+def test_arranque_en_frio_usa_instantanea_local(data_manager_con_ruta_temporal, monkeypatch):
+    """
+    Verifica que una instancia nueva carga los datos desde la instantánea
+    columnar local sin procesar el .xlsx, mientras el libro no cambie.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.add_record({'Numero de Serie': 'SN-SNAP-001', 'Estado': 'Recibido'})
+    dm.load_data()
+    dm.backend.snapshot.wait()
+
+    def _read_excel_prohibido(*args, **kwargs):
+        raise AssertionError("No debería procesarse el libro Excel.")
+
+    monkeypatch.setattr(pd, 'read_excel', _read_excel_prohibido)
+
+    # ACT
+    dm_nuevo = DataManager()
+    resultado = dm_nuevo.find_by_serial('SN-SNAP-001')
+
+    # ASSERT
+    assert resultado is not None and resultado['ID'] == 1
+
+
+def test_instantanea_se_descarta_si_el_libro_cambia(data_manager_con_ruta_temporal):
+    """Verifica que una instantánea con firma distinta a la del libro no se usa."""
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.load_data()
+    dm.backend.snapshot.wait()
+    firma_vieja = dm.backend._workbook_signature()
+
+    # ACT
+    dm.add_record({'Numero de Serie': 'SN-SNAP-002', 'Estado': 'Recibido'})
+    dm.backend.snapshot.wait()
+
+    # ASSERT
+    assert dm.backend.snapshot.load(firma_vieja) is None, "La firma anterior ya no es válida."
+    actual = dm.backend.snapshot.load(dm.backend._workbook_signature())
+    assert actual is not None and list(actual['Numero de Serie']) == ['SN-SNAP-002']
+
+
+def test_scan_serial_recorre_el_libro_en_streaming(data_manager_con_ruta_temporal, monkeypatch):
+    """
+    Verifica que la búsqueda en streaming lee el libro por bloques, sin
+    cargarlo en la caché, y se detiene al alcanzar el límite.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    monkeypatch.setattr(Config, 'SNAPSHOT_ENABLED', False)
+    for i in range(7):
+        dm.add_record({'Numero de Serie': f'SN-STREAM-{i}', 'Estado': 'Recibido'})
+    dm_nuevo = DataManager()
+    monkeypatch.setattr(pd, 'read_excel', lambda *a, **k: pytest.fail("No debería materializarse el libro."))
+    bloques_leidos = []
+    iter_original = dm_nuevo.backend.iter_chunks
+
+    def _iter_contado(chunk_size):
+        for bloque in iter_original(chunk_size):
+            bloques_leidos.append(len(bloque))
+            yield bloque
+
+    monkeypatch.setattr(dm_nuevo.backend, 'iter_chunks', _iter_contado)
+    monkeypatch.setattr(Config, 'STREAM_CHUNK_SIZE', 2)
+
+    # ACT
+    resultado = dm_nuevo.scan_serial(' SN-STREAM-2 ', limit=1)
+
+    # ASSERT
+    assert [r['ID'] for r in resultado] == [3]
+    assert bloques_leidos == [2, 2], "La lectura debería detenerse en el bloque de la coincidencia."
+    assert dm_nuevo._cache_df is None, "El streaming no debe llenar la caché."
+    assert sum(1 for _ in dm_nuevo.iter_records()) == 7
+
+
+def test_suggest_serials_por_prefijo(data_manager_con_ruta_temporal):
+    """
+    Verifica que el índice de prefijos sugiere series sin distinguir
+    mayúsculas, respeta el límite e incluye los registros recién añadidos.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    for serial in ['ABC-100', 'abc-200', 'ABD-300', 'ABC-100']:
+        dm.add_record({'Numero de Serie': serial, 'Estado': 'Recibido'})
+    dm.suggest_serials('AB')
+
+    # ACT
+    dm.add_record({'Numero de Serie': 'ABC-150', 'Estado': 'Recibido'})
+
+    # ASSERT
+    assert dm.suggest_serials('abc') == ['ABC-100', 'ABC-150', 'abc-200']
+    assert dm.suggest_serials('ab', limit=2) == ['ABC-100', 'ABC-150']
+    assert dm.suggest_serials('XYZ') == []
+    assert dm.suggest_serials('  ') == []
+
+
+def test_search_text_indice_invertido(data_manager_con_ruta_temporal):
+    """
+    Verifica la búsqueda de texto completo: sin acentos ni mayúsculas,
+    exige todos los términos, ordena por relevancia e incluye registros nuevos.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.add_record({'Numero de Serie': 'SN-T1', 'Estado': 'Recibido',
+                   'Descripcion del Problema': 'Falla en el disco duro.'})
+    dm.add_record({'Numero de Serie': 'SN-T2', 'Estado': 'Recibido',
+                   'Descripcion del Problema': 'Pantalla rota.'})
+    dm.search_text('pantalla')
+
+    # ACT
+    dm.add_record({'Numero de Serie': 'SN-T3', 'Estado': 'Recibido',
+                   'Descripcion del Problema': 'PANTÁLLA parpadea',
+                   'Historial Intervenciones': 'Se cambió la pantalla; pantalla nueva.'})
+
+    # ASSERT
+    assert [r['Numero de Serie'] for r in dm.search_text('Pantalla')] == ['SN-T3', 'SN-T2']
+    assert [r['Numero de Serie'] for r in dm.search_text('DISCO duro')] == ['SN-T1']
+    assert dm.search_text('disco pantalla') == [], "Deben coincidir todos los términos."
+    assert dm.search_text('de la') == []
+
+
+def test_query_combina_criterios_con_indices(data_manager_con_ruta_temporal):
+    """
+    Verifica la consulta por estado, responsable y rango de fechas, su
+    paginación perezosa y que incluye registros añadidos tras construir los índices.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    registros = [
+        ('SN-Q1', 'Recibido', 'Ana', '2025-07-01'),
+        ('SN-Q2', 'Recibido', 'Luis', '2025-07-10'),
+        ('SN-Q3', 'Entregado', 'Ana', '2025-07-05'),
+        ('SN-Q4', 'Recibido', 'Ana', '2025-08-01'),
+    ]
+    for serial, estado, responsable, fecha in registros[:3]:
+        dm.add_record({'Numero de Serie': serial, 'Estado': estado,
+                       'Responsable Recepcion': responsable, 'Fecha de Recepcion': fecha})
+    assert len(dm.query(status='Recibido')) == 2
+    serial, estado, responsable, fecha = registros[3]
+    dm.add_record({'Numero de Serie': serial, 'Estado': estado,
+                   'Responsable Recepcion': responsable, 'Fecha de Recepcion': fecha})
+
+    # ACT
+    antiguos = dm.query(status='Recibido', received_to='2025-07-10')
+    de_ana = dm.query(technician=['Ana'], received_from='2025-07-02', page_size=1)
+    todos = dm.query(status=['Recibido', 'Entregado'], page_size=3)
+
+    # ASSERT
+    assert [r['Numero de Serie'] for r in antiguos.records()] == ['SN-Q1', 'SN-Q2']
+    assert [r['Numero de Serie'] for r in de_ana.records()] == ['SN-Q3', 'SN-Q4']
+    assert de_ana.page_count == 2 and de_ana.page(1)[0]['Numero de Serie'] == 'SN-Q4'
+    assert [len(pagina) for pagina in todos] == [3, 1]
+    assert len(dm.query(status='Cancelado')) == 0
+
+
+def test_query_con_fechas_no_interpretables_las_trata_sin_limite(data_manager_con_ruta_temporal):
+    """Verifica que un límite de fecha inválido no provoca error y se ignora."""
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    for serial, fecha in [('SN-F1', '2025-07-01'), ('SN-F2', '2025-08-01')]:
+        dm.add_record({'Numero de Serie': serial, 'Estado': 'Recibido', 'Fecha de Recepcion': fecha})
+
+    # ACT
+    sin_inicio = dm.query(received_from='no-es-fecha', received_to='2025-07-15')
+    sin_limites = dm.query(received_from='31/31/2025', delivered_to='')
+
+    # ASSERT
+    assert [r['Numero de Serie'] for r in sin_inicio.records()] == ['SN-F1']
+    assert len(sin_limites) == 2, "Los límites inválidos deberían tratarse como abiertos"
+
+
+def test_find_all_by_serial_ordena_visitas_por_fecha(data_manager_con_ruta_temporal):
+    """
+    Verifica que las visitas de un equipo se devuelven por fecha de
+    recepción (la más antigua primero) y que las visitas sin fecha van al final.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    for fecha in ['2025-09-01', None, '2025-03-15', '2025-06-30']:
+        dm.add_record({'Numero de Serie': 'SN-HIST', 'Estado': 'Recibido', 'Fecha de Recepcion': fecha})
+
+    # ACT
+    visitas = dm.find_all_by_serial('SN-HIST')
+
+    # ASSERT
+    assert [v['ID'] for v in visitas] == [3, 4, 1, 2]
+    assert dm.find_by_serial('SN-HIST')['ID'] == 3, "find_by_serial devuelve la primera visita."
+
+
+def test_estadisticas_incrementales_coinciden_con_recalculo(data_manager_con_ruta_temporal):
+    """
+    Verifica que los agregados del dashboard se actualizan con cada guardado
+    sin recalcularse y coinciden con un recálculo completo desde el archivo.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.add_record({'Numero de Serie': 'SN-E1', 'Estado': 'Entregado',
+                   'Fecha de Recepcion': '2025-08-04', 'Fecha de Entrega': '2025-08-10'})
+    dm.get_stats()
+    version = dm.stats.version
+
+    # ACT
+    dm.add_record({'Numero de Serie': 'SN-E2', 'Estado': 'Recibido', 'Fecha de Recepcion': '2025-08-05'})
+    dm.add_record({'Numero de Serie': 'SN-E3', 'Estado': 'Entregado',
+                   'Fecha de Recepcion': '2025-08-11', 'Fecha de Entrega': '2025-08-13'})
+    incremental = dm.get_stats()
+    recalculado = DataManager().get_stats()
+
+    # ASSERT
+    assert dm.stats.version == version, "Los guardados propios no deberían forzar un recálculo."
+    assert incremental == recalculado
+    assert incremental['by_status'] == {'Entregado': 2, 'Recibido': 1}
+    assert incremental['open_backlog'] == 1
+    assert incremental['mean_turnaround_days'] == 4.0
+    assert incremental['intakes_per_week'] == {'2025-W32': 2, '2025-W33': 1}
+
+
+def test_estadisticas_agrupan_estados_vacios_y_nulos():
+    """Verifica que NaN y '' cuentan juntos como "Sin estado" al recalcular."""
+    # ARRANGE
+    df = pd.DataFrame({'Estado': ['Recibido', None, '', '  ', float('nan')]})
+    motor = StatsEngine()
+
+    # ACT
+    motor.build(df, version=1)
+
+    # ASSERT
+    assert motor.by_status == {'Recibido': 1, 'Sin estado': 4}, "Los estados vacíos no deberían sobrescribirse."
+
+
+def test_lectura_lenta_no_bloquea_las_consultas_de_la_ui(data_manager_con_ruta_temporal, monkeypatch):
+    """
+    Verifica que mientras un hilo relee el archivo (p. ej. sobre la red) la
+    caché no queda bloqueada: el autocompletado responde con los datos previos.
+    """
+    # ARRANGE
+    dm = data_manager_con_ruta_temporal
+    dm.add_record({'Numero de Serie': 'SN-UI-1', 'Estado': 'Recibido'})
+    dm.suggest_serials('SN')
+    dm.invalidate_cache()
+    leyendo, continuar = threading.Event(), threading.Event()
+    load_original = dm.backend.load
+
+    def load_lento():
+        leyendo.set()
+        continuar.wait(5)
+        return load_original()
+    monkeypatch.setattr(dm.backend, 'load', load_lento)
+    lector = threading.Thread(target=dm.load_data)
+    lector.start()
+    assert leyendo.wait(5)
+
+    # ACT
+    libre = dm._lock.acquire(timeout=1)
+    if libre:
+        dm._lock.release()
+    sugerencias = dm.suggest_serials('SN')
+    continuar.set()
+    lector.join(5)
+
+    # ASSERT
+    assert libre, "La lectura del archivo no debería retener el bloqueo de la caché"
+    assert sugerencias == ['SN-UI-1']
@@ -0,0 +1,122 @@
+# tests/test_id_allocator.py
+import os
+import time
+import pytest
+import pandas as pd
+from src.data_manager import DataManager
+from src.config import Config
+from src.file_lock import FileLock, sidecar_path
+
+# --- Tests ---
+
+def test_estaciones_alternadas_no_duplican_ids(libro_temporal, nuevo_registro):
+    """
+    Verifica que dos instancias sobre el mismo libro (dos estaciones)
+    asignan IDs consecutivos sin duplicados.
+    """
+    # ARRANGE
+    estacion_a = DataManager()
+    estacion_b = DataManager()
+
+    # ACT
+    estacion_a.add_record(nuevo_registro('SN-A-1'))
+    estacion_b.add_record(nuevo_registro('SN-B-1'))
+    estacion_a.add_record(nuevo_registro('SN-A-2'))
+
+    # ASSERT
+    df = pd.read_excel(libro_temporal)
+    assert list(df['ID']) == [1, 2, 3], "Los IDs deberían ser únicos y consecutivos."
+
+
+def test_marca_auxiliar_evita_procesar_el_libro(libro_temporal, nuevo_registro):
+    """
+    Verifica que una estación nueva obtiene el siguiente ID desde el archivo
+    auxiliar de marca máxima, sin procesar el Excel completo.
+    """
+    # ARRANGE
+    DataManager().add_record(nuevo_registro('SN-PREVIO'))
+    estacion_nueva = DataManager()
+
+    # ACT
+    siguiente = estacion_nueva.get_next_id()
+
+    # ASSERT
+    assert siguiente == 2
+    assert estacion_nueva.cache_stats()['misses'] == 0, "No debería haberse leído el libro."
+
+
+def test_add_record_falla_si_otra_estacion_mantiene_el_bloqueo(libro_temporal, monkeypatch, nuevo_registro):
+    """Verifica que add_record informa el error si no obtiene el bloqueo a tiempo."""
+    # ARRANGE
+    monkeypatch.setattr(Config, 'WRITE_LOCK_TIMEOUT', 0.1)
+    dm = DataManager()
+
+    # ACT
+    with FileLock(sidecar_path(dm.active_path, ".lock")):
+        resultado = dm.add_record(nuevo_registro('SN-BLOQUEADO'))
+
+    # ASSERT
+    assert resultado is False, "Sin bloqueo no debería escribirse el registro."
+    assert pd.read_excel(libro_temporal).empty
+
+
+def test_error_de_lectura_aborta_el_alta_sin_reiniciar_ids(libro_temporal, monkeypatch, nuevo_registro):
+    """
+    Verifica que si el libro no se puede leer al calcular el ID, add_record
+    falla en lugar de asumir un libro vacío y repartir el ID 1 otra vez.
+    """
+    # ARRANGE
+    DataManager().add_record(nuevo_registro('SN-1'))
+    DataManager().add_record(nuevo_registro('SN-2'))
+    estacion = DataManager()
+    estacion.backend._id_allocator.path.unlink()  # sin marca auxiliar: hay que leer el libro
+
+    def lectura_fallida():
+        raise OSError("Recurso de red no disponible")
+    monkeypatch.setattr(estacion.backend, 'load', lectura_fallida)
+
+    # ACT
+    resultado = estacion.add_record(nuevo_registro('SN-3'))
+
+    # ASSERT
+    assert resultado is False, "El alta debería abortarse si no se pudo leer el libro"
+    assert list(pd.read_excel(libro_temporal)['ID']) == [1, 2], "El libro no debería cambiar"
+    assert not estacion.backend._id_allocator.path.exists(), "No debería guardarse una marca de IDs errónea"
+
+
+def test_liberar_no_elimina_el_bloqueo_de_otra_estacion(tmp_path):
+    """Verifica que release() no borra un bloqueo que otra estación tomó por abandonado."""
+    # ARRANGE
+    ruta = tmp_path / ".libro.lock"
+    bloqueo = FileLock(ruta)
+    bloqueo.acquire()
+    os.remove(ruta)
+    ruta.write_bytes(b"otra-estacion:1:testigo")  # otra estación lo dio por abandonado y lo tomó
+
+    # ACT
+    bloqueo.release()
+
+    # ASSERT
+    assert ruta.read_bytes() == b"otra-estacion:1:testigo", "El bloqueo ajeno no debería eliminarse"
+
+
+def test_bloqueo_abandonado_se_detecta_con_el_reloj_local(tmp_path):
+    """
+    Verifica que el abandono no depende del mtime del servidor: un mtime
+    antiguo (reloj desfasado) no libera el bloqueo, pero uno que no cambia
+    durante `stale_after` segundos locales sí.
+    """
+    # ARRANGE: mtime una hora en el pasado, como con un servidor desfasado
+    ruta = tmp_path / ".libro.lock"
+    ruta.write_bytes(b"otra-estacion:1:testigo")
+    hace_una_hora = time.time() - 3600
+    os.utime(ruta, (hace_una_hora, hace_una_hora))
+
+    # ACT / ASSERT
+    with pytest.raises(TimeoutError):
+        FileLock(ruta, timeout=0.1, stale_after=5.0, poll_interval=0.01).acquire()
+    bloqueo = FileLock(ruta, timeout=2.0, stale_after=0.2, poll_interval=0.01)
+    bloqueo.acquire()
+    assert ruta.read_bytes() != b"otra-estacion:1:testigo", "El bloqueo abandonado debería reemplazarse"
+    bloqueo.release()
+    assert not ruta.exists()
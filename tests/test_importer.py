@@ -0,0 +1,74 @@
+# tests/test_importer.py
+import pandas as pd
+from src.config import Config
+from src.importer import import_file
+
+# --- Tests ---
+
+def test_add_records_valida_y_asigna_bloque_de_ids(data_manager, monkeypatch, nuevo_registro):
+    """
+    Verifica que add_records rechaza filas incompletas, asigna IDs
+    contiguos a las válidas y guarda con una sola escritura.
+    """
+    # ARRANGE
+    dm = data_manager
+    dm.add_record(nuevo_registro('SN-PREVIO'))
+    escrituras = []
+    append_original = dm.backend.append
+    monkeypatch.setattr(dm.backend, 'append', lambda rows: escrituras.append(len(rows)) or append_original(rows))
+    registros = [
+        nuevo_registro('SN-LOTE-1', ID=999),
+        nuevo_registro('SN-LOTE-2', **{'Estado': '  '}),
+        nuevo_registro('SN-LOTE-3'),
+        {'Numero de Serie': 'SN-INCOMPLETO'},
+    ]
+
+    # ACT
+    reporte = dm.add_records(registros)
+
+    # ASSERT
+    assert escrituras == [2], "Las filas válidas deberían guardarse en una sola escritura."
+    assert reporte['added'] == 2
+    assert (reporte['first_id'], reporte['last_id']) == (2, 3)
+    assert [r['row'] for r in reporte['rejected']] == [1, 3]
+    assert "Estado" in reporte['rejected'][0]['reason']
+    df = pd.read_excel(dm.active_path)
+    assert list(df['ID']) == [1, 2, 3], "Los IDs entrantes deben ignorarse en favor del bloque contiguo."
+
+
+def test_import_file_csv_por_bloques(data_manager, tmp_path, nuevo_registro):
+    """
+    Verifica la importación de un CSV heredado por bloques, con encabezados
+    acentuados y reporte de filas rechazadas por número de fila del archivo.
+    """
+    # ARRANGE
+    origen = tmp_path / "legado.csv"
+    filas = [nuevo_registro(f'SN-CSV-{i}') for i in range(5)]
+    filas[3]['Responsable Recepcion'] = ''
+    df_origen = pd.DataFrame(filas).rename(columns={'Numero de Serie': 'Número de Serie'})
+    df_origen.to_csv(origen, index=False)
+
+    # ACT
+    reporte = import_file(data_manager, origen, chunk_size=2)
+
+    # ASSERT
+    assert reporte['chunks'] == 3
+    assert reporte['added'] == 4
+    assert [r['row'] for r in reporte['rejected']] == [5], "La 4.ª fila de datos es la fila 5 del archivo."
+    assert data_manager.find_by_serial('SN-CSV-4') is not None
+
+
+def test_import_file_xlsx_omite_filas_vacias(data_manager, tmp_path, nuevo_registro):
+    """Verifica la importación de un XLSX en modo streaming ignorando filas vacías."""
+    # ARRANGE
+    origen = tmp_path / "legado.xlsx"
+    filas = [nuevo_registro('SN-XLSX-1'), {}, nuevo_registro('SN-XLSX-2')]
+    pd.DataFrame(filas, columns=Config.COLUMNS).to_excel(origen, index=False)
+
+    # ACT
+    reporte = import_file(data_manager, origen)
+
+    # ASSERT
+    assert reporte['added'] == 2
+    assert reporte['rejected'] == []
+    assert len(data_manager.load_data()) == 2
@@ -12,7 +12,7 @@ import os
 import tempfile
 import pandas as pd
 from pathlib import Path
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QModelIndex
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtTest import QTest
 
@@ -120,8 +120,9 @@ def test_busqueda_por_serial_exitosa(main_app_with_data, qtbot):
     # Ingresar número de serie en el campo
     search_view.serial_input.setText("TEST-SN-002")
     
-    # Hacer clic en el botón de búsqueda
-    search_view.search_button.click()
+    # Hacer clic en el botón de búsqueda (la consulta se resuelve en segundo plano)
+    with qtbot.waitSignal(search_view.search_completed, timeout=5000):
+        search_view.search_button.click()
     
     # Verificar que se muestra el resultado correcto
     results_text = search_view.results_text.toPlainText()
@@ -146,9 +147,186 @@ def test_busqueda_por_serial_no_encontrado(main_app_with_data, qtbot):
     # Ingresar número de serie inexistente
     search_view.serial_input.setText("SERIAL-INEXISTENTE")
     
-    # Hacer clic en el botón de búsqueda
-    search_view.search_button.click()
+    # Hacer clic en el botón de búsqueda (la consulta se resuelve en segundo plano)
+    with qtbot.waitSignal(search_view.search_completed, timeout=5000):
+        search_view.search_button.click()
     
     # Verificar que se muestra mensaje de no encontrado
     results_text = search_view.results_text.toPlainText()
-    assert "No se encontró" in results_text
\ No newline at end of file
+    assert "No se encontró" in results_text
+
+def test_sugerencias_de_serie_mientras_se_escribe(main_app_with_data, qtbot):
+    """
+    Verifica que al teclear un prefijo parcial el completador ofrece las
+    series coincidentes sin distinguir mayúsculas.
+    """
+    # Navegar a la vista de búsqueda
+    main_app_with_data.btn_busqueda.click()
+    search_view = main_app_with_data.search_page
+    
+    # Simular la escritura del técnico (prefijo en minúsculas)
+    qtbot.keyClicks(search_view.serial_input, "test-sn-00")
+    
+    # Verificar que el modelo del completador contiene ambas series
+    assert search_view.suggestion_model.stringList() == ["TEST-SN-001", "TEST-SN-002"]
+
+
+def test_busqueda_por_texto_muestra_lista_de_resultados(main_app_with_data, qtbot):
+    """
+    Verifica que la búsqueda por texto libre llena la lista de resultados
+    y muestra el detalle del registro seleccionado.
+    """
+    # Navegar a la vista de búsqueda
+    main_app_with_data.btn_busqueda.click()
+    search_view = main_app_with_data.search_page
+    
+    # Buscar una palabra de la descripción sin acento ni mayúsculas
+    search_view.text_input.setText("no ENCIENDE")
+    with qtbot.waitSignal(search_view.search_completed, timeout=5000):
+        search_view.text_search_button.click()
+    
+    # Verificar la lista y el detalle del primer resultado
+    assert search_view.text_results_list.count() == 1
+    assert "TEST-SN-002" in search_view.text_results_list.item(0).text()
+    assert "Samsung 24\"" in search_view.results_text.toPlainText()
+
+
+def test_busqueda_muestra_todas_las_visitas(main_app_with_data, qtbot):
+    """
+    Verifica que la consulta por serie muestra el historial completo
+    cuando el equipo ingresó más de una vez.
+    """
+    # Registrar una segunda visita del mismo equipo
+    main_app_with_data.data_manager.add_record({
+        'Numero de Serie': 'TEST-SN-001',
+        'Fecha de Recepcion': '2025-09-01',
+        'Descripcion del Problema': 'Teclado dañado.',
+        'Estado': 'Recibido'
+    })
+    main_app_with_data.btn_busqueda.click()
+    search_view = main_app_with_data.search_page
+    
+    # Buscar el equipo
+    search_view.serial_input.setText("TEST-SN-001")
+    with qtbot.waitSignal(search_view.search_completed, timeout=5000):
+        search_view.search_button.click()
+    
+    # Verificar que aparecen ambas visitas en orden
+    results_text = search_view.results_text.toPlainText()
+    assert "2 visitas" in search_view.results_header.text()
+    assert results_text.index("Pantalla azul.") < results_text.index("Teclado dañado.")
+
+
+def test_dashboard_muestra_estadisticas(main_app_with_data, qtbot):
+    """
+    Verifica que el dashboard muestra los agregados del inventario.
+    """
+    dashboard = main_app_with_data.dashboard_page
+    
+    # El dashboard es la vista inicial: las métricas se calculan al mostrarse
+    assert dashboard.stat_labels['total'].text() == "2"
+    assert dashboard.stat_labels['open_backlog'].text() == "2"
+    assert "Recibido: 1" in dashboard.status_breakdown_label.text()
+
+
+def test_navegacion_a_inventario_muestra_registros(main_app_with_data, qtbot):
+    """
+    Verifica que la vista de inventario se registra en el índice 3 y
+    muestra los registros del archivo.
+    """
+    # Navegar al inventario
+    main_app_with_data.btn_inventario.click()
+    assert main_app_with_data.stacked_widget.currentIndex() == 3
+    assert main_app_with_data.btn_inventario.isChecked()
+    
+    # Verificar el contenido de la tabla
+    model = main_app_with_data.inventory_page.model
+    assert model.rowCount() == 2
+    assert "2 registro(s)" in main_app_with_data.inventory_page.count_label.text()
+    serial_col = list(model.frame.columns).index('Numero de Serie')
+    assert model.data(model.index(1, serial_col)) == "TEST-SN-002"
+
+
+def test_modelo_inventario_carga_por_lotes_y_ordena(qtbot, monkeypatch):
+    """
+    Verifica que el modelo expone las filas por lotes (fetchMore) y que
+    ordenar solo reordena las posiciones.
+    """
+    from src.views.inventory_view import InventoryTableModel
+    monkeypatch.setattr(Config, 'INVENTORY_FETCH_BATCH', 100)
+    df = pd.DataFrame({'ID': range(1, 251), 'Numero de Serie': [f"SN-{i:03d}" for i in range(250)]})
+    model = InventoryTableModel()
+    model.set_frame(df)
+    
+    # Primer lote y lotes siguientes bajo demanda
+    assert model.rowCount() == 100
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+    assert model.rowCount() == 250
+    
+    # Orden descendente por serie sin modificar el DataFrame
+    model.sort(1, Qt.SortOrder.DescendingOrder)
+    assert model.data(model.index(0, 1)) == "SN-249"
+    assert model.data(model.index(0, 0)) == "250"
+    assert df['Numero de Serie'].iloc[0] == "SN-000"
+
+
+def test_busqueda_obsoleta_se_descarta(main_app_with_data, qtbot):
+    """
+    Verifica que, si se lanzan dos búsquedas seguidas, solo se muestra el
+    resultado de la más reciente y el encabezado indica la búsqueda en curso.
+    """
+    main_app_with_data.btn_busqueda.click()
+    search_view = main_app_with_data.search_page
+    
+    # Lanzar dos búsquedas sin esperar a la primera
+    with qtbot.waitSignal(search_view.search_completed, timeout=5000):
+        search_view.serial_input.setText("TEST-SN-001")
+        search_view.search_button.click()
+        assert "Buscando" in search_view.results_header.text()
+        search_view.serial_input.setText("TEST-SN-002")
+        search_view.search_button.click()
+    
+    # Dar tiempo a que cualquier resultado tardío llegue y verificar que se ignora
+    search_view.thread_pool.waitForDone(5000)
+    qtbot.wait(50)
+    results_text = search_view.results_text.toPlainText()
+    assert "TEST-SN-002" in results_text
+    assert "TEST-SN-001" not in results_text
+
+
+def test_vistas_se_construyen_al_navegar(qtbot, monkeypatch, temp_excel_path):
+    """
+    Verifica que solo el Dashboard se construye al crear la ventana y que
+    las demás vistas se crean en su primera navegación.
+    """
+    monkeypatch.setattr(Config, 'EXCEL_NETWORK_PATH', Path(temp_excel_path))
+    monkeypatch.setattr(Config, 'EXCEL_LOCAL_PATH', Path(temp_excel_path))
+    monkeypatch.setattr('os.access', lambda path, mode: True)
+    monkeypatch.setattr(Config, 'PREBUILD_VIEWS_ON_IDLE', False)
+    main_app = MainApp(DataManager())
+    qtbot.addWidget(main_app)
+    
+    # Solo el Dashboard existe; las demás posiciones son marcadores
+    assert main_app.registration_page is None
+    assert main_app.search_page is None
+    assert main_app.stacked_widget.count() == 4
+    
+    # La primera navegación construye la vista en su índice
+    main_app.btn_registro.click()
+    assert main_app.registration_page is not None
+    assert main_app.stacked_widget.currentWidget() is main_app.registration_page
+    assert main_app.stacked_widget.indexOf(main_app.registration_page) == 1
+    assert main_app.search_page is None
+
+
+def test_preconstruccion_en_ocio_y_tiempo_de_primer_cuadro(main_app_with_data, qtbot):
+    """
+    Verifica que, tras mostrarse la ventana, se registra el tiempo hasta el
+    primer cuadro y las vistas pendientes se construyen en segundo plano.
+    """
+    qtbot.waitUntil(lambda: main_app_with_data.time_to_first_frame is not None, timeout=5000)
+    qtbot.waitUntil(lambda: main_app_with_data.inventory_page is not None, timeout=5000)
+    assert main_app_with_data.registration_page is not None
+    assert main_app_with_data.search_page is not None
+    assert main_app_with_data.stacked_widget.currentIndex() == 0, "La preconstrucción no debe cambiar de vista."
@@ -0,0 +1,143 @@
+# tests/test_journal.py
+import threading
+import pytest
+import pandas as pd
+from src.data_manager import DataManager
+from src.config import Config
+from src.storage.journal import WriteAheadJournal
+
+# --- Fixtures de Pytest ---
+
+@pytest.fixture
+def dm_con_bitacora(libro_temporal, monkeypatch):
+    """DataManager sobre un libro temporal con la bitácora activada."""
+    monkeypatch.setattr(Config, 'JOURNAL_ENABLED', True)
+    monkeypatch.setattr(Config, 'JOURNAL_COMPACT_THRESHOLD', 3)
+    return DataManager()
+
+# --- Tests ---
+
+def test_registros_en_bitacora_son_visibles_antes_de_compactar(dm_con_bitacora, nuevo_registro):
+    """
+    Verifica que los registros guardados en la bitácora se ven en las
+    lecturas (también desde otra estación) aunque el libro no cambie.
+    """
+    # ARRANGE
+    dm = dm_con_bitacora
+
+    # ACT
+    dm.add_record(nuevo_registro('SN-WAL-001'))
+    dm.add_record(nuevo_registro('SN-WAL-002'))
+
+    # ASSERT
+    assert pd.read_excel(dm.active_path).empty, "El libro no debería reescribirse antes de compactar."
+    otra_estacion = DataManager()
+    assert otra_estacion.find_by_serial('SN-WAL-002')['ID'] == 2
+    assert len(otra_estacion.load_data()) == 2
+
+
+def test_compactacion_por_lotes_integra_la_bitacora(dm_con_bitacora, nuevo_registro):
+    """Verifica que al alcanzar el umbral los registros se integran al libro de una vez."""
+    # ARRANGE
+    dm = dm_con_bitacora
+
+    # ACT
+    for i in range(3):
+        dm.add_record(nuevo_registro(f'SN-LOTE-{i}'))
+
+    # ASSERT
+    df = pd.read_excel(dm.active_path)
+    assert list(df['ID']) == [1, 2, 3]
+    assert not dm.backend.journal.path.exists(), "La bitácora debería vaciarse tras compactar."
+    assert len(dm.load_data()) == 3
+
+
+def test_compactacion_interrumpida_no_duplica_registros(dm_con_bitacora, nuevo_registro):
+    """
+    Verifica que si el libro ya contiene registros de la bitácora (corte
+    entre la escritura del libro y el vaciado), no se duplican.
+    """
+    # ARRANGE
+    dm = dm_con_bitacora
+    dm.add_record(nuevo_registro('SN-CORTE-1'))
+    pendientes = dm.backend.journal.read()
+    dm.backend._append_to_workbook(pendientes)  # Simula la mitad de una compactación
+
+    # ACT
+    leidos = DataManager().load_data()
+    integrados = dm.compact_journal()
+
+    # ASSERT
+    assert len(leidos) == 1, "El registro no debe aparecer dos veces al leer."
+    assert integrados == 0
+    assert len(pd.read_excel(dm.active_path)) == 1
+
+
+def test_compactacion_con_esquema_distinto_conserva_series_numericas(dm_con_bitacora, nuevo_registro):
+    """
+    Verifica que la reescritura completa de la compactación (encabezado
+    distinto de Config.COLUMNS) no convierte series como '00777' en números.
+    """
+    # ARRANGE: libro con una columna adicional y una serie que parece un número
+    dm = dm_con_bitacora
+    existente = pd.DataFrame([{**nuevo_registro('00777'), 'ID': 1}], columns=Config.COLUMNS + ['Notas'])
+    existente.to_excel(dm.active_path, index=False)
+    dm.add_record(nuevo_registro('SN-NUEVO'))
+
+    # ACT
+    integrados = dm.compact_journal()
+
+    # ASSERT
+    df = pd.read_excel(dm.active_path, dtype={'Numero de Serie': str})
+    assert integrados == 1
+    assert list(df['Numero de Serie']) == ['00777', 'SN-NUEVO'], "La serie no debería perder sus ceros"
+    assert 'Notas' in df.columns, "La reescritura no debería perder columnas del libro"
+
+
+def test_linea_incompleta_no_se_pega_al_siguiente_registro(tmp_path, capsys):
+    """
+    Verifica que tras un corte a mitad de línea el siguiente registro se
+    escribe en su propia línea y se conserva; el fragmento se descarta con aviso.
+    """
+    # ARRANGE: un registro completo y otro cortado sin salto de línea
+    bitacora = WriteAheadJournal(tmp_path / "libro.journal.jsonl")
+    bitacora.append([{'ID': 1, 'Numero de Serie': 'SN-OK'}])
+    with open(bitacora.path, "ab") as f:
+        f.write(b'{"ID": 2, "Numero de Se')
+
+    # ACT
+    bitacora.append([{'ID': 3, 'Numero de Serie': 'SN-DESPUES'}])
+    registros = bitacora.read()
+
+    # ASSERT
+    assert [r['ID'] for r in registros] == [1, 3], "El registro confirmado tras el corte no debería perderse"
+    assert "Línea incompleta descartada" in capsys.readouterr().out
+
+
+def test_compactacion_no_retiene_el_bloqueo_de_la_cache(dm_con_bitacora, nuevo_registro, monkeypatch):
+    """Verifica que las vistas pueden leer la caché mientras se compacta la bitácora."""
+    # ARRANGE
+    dm = dm_con_bitacora
+    dm.add_record(nuevo_registro('SN-COMPACTA'))
+    compactando, continuar = threading.Event(), threading.Event()
+    compact_original = dm.backend.compact
+
+    def compact_lento():
+        compactando.set()
+        continuar.wait(5)
+        return compact_original()
+    monkeypatch.setattr(dm.backend, 'compact', compact_lento)
+    hilo = threading.Thread(target=dm.compact_journal)
+    hilo.start()
+    assert compactando.wait(5)
+
+    # ACT
+    libre = dm._lock.acquire(timeout=1)
+    if libre:
+        dm._lock.release()
+    continuar.set()
+    hilo.join(5)
+
+    # ASSERT
+    assert libre, "La compactación no debería retener el bloqueo de la caché"
+    assert len(pd.read_excel(dm.active_path)) == 1
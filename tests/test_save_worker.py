@@ -0,0 +1,107 @@
+# tests/test_save_worker.py
+import pytest
+import pandas as pd
+from src.save_worker import SaveWorker
+from src.views.registration_view import RegistrationView
+
+# --- Fixtures de Pytest ---
+
+@pytest.fixture
+def save_worker(data_manager):
+    """SaveWorker que se detiene al terminar la prueba."""
+    worker = SaveWorker(data_manager)
+    yield worker
+    worker.stop()
+
+# --- Tests ---
+
+def test_save_worker_guarda_en_segundo_plano(qtbot, save_worker, data_manager, nuevo_registro):
+    """Verifica que los trabajos encolados se guardan en orden y se notifican por señales."""
+    # ACT
+    with qtbot.waitSignal(save_worker.pending_changed, check_params_cb=lambda n: n == 0, timeout=10000):
+        save_worker.submit(nuevo_registro('SN-BG-001'))
+        save_worker.submit(nuevo_registro('SN-BG-002'))
+
+    # ASSERT
+    df = pd.read_excel(data_manager.active_path)
+    assert list(df['Numero de Serie']) == ['SN-BG-001', 'SN-BG-002']
+    assert list(df['ID']) == [1, 2]
+
+
+def test_save_worker_reporta_fallos(qtbot, save_worker, data_manager, monkeypatch, nuevo_registro):
+    """Verifica que un guardado fallido se informa con la señal `failed`."""
+    # ARRANGE
+    monkeypatch.setattr(data_manager, 'add_record', lambda record: False)
+
+    # ACT
+    with qtbot.waitSignal(save_worker.failed, timeout=10000) as blocker:
+        save_worker.submit(nuevo_registro('SN-FALLA'))
+
+    # ASSERT
+    assert blocker.args[0] == 'SN-FALLA'
+    assert blocker.args[2]['Numero de Serie'] == 'SN-FALLA', "La señal debería devolver los datos del registro"
+    assert 'ID' not in blocker.args[2]
+
+
+def test_registration_view_limpia_el_formulario_sin_esperar(qtbot, save_worker, data_manager):
+    """
+    Verifica que con un SaveWorker el formulario se limpia de inmediato y
+    el guardado ocurre en segundo plano.
+    """
+    # ARRANGE
+    view = RegistrationView(data_manager, save_worker)
+    qtbot.addWidget(view)
+    view.fields['Tipo de Equipo'].setCurrentIndex(0)
+    view.fields['Numero de Serie'].setText('SN-FORM-001')
+    view.fields['Responsable Recepcion'].setText('Carlos V.')
+    view.fields['Descripcion del Problema'].setPlainText('No enciende.')
+
+    # ACT
+    with qtbot.waitSignal(save_worker.saved, timeout=10000):
+        view.save_record()
+        assert view.fields['Numero de Serie'].text() == '', "El formulario debería limpiarse al encolar."
+
+    # ASSERT
+    assert data_manager.find_by_serial('SN-FORM-001') is not None
+
+
+def test_registration_view_recupera_el_registro_si_falla(qtbot, save_worker, data_manager, monkeypatch):
+    """
+    Verifica que si el guardado en segundo plano falla (p. ej. por tiempo de
+    espera del bloqueo) los datos capturados vuelven al formulario.
+    """
+    # ARRANGE
+    monkeypatch.setattr(data_manager, 'add_record', lambda record: False)
+    view = RegistrationView(data_manager, save_worker)
+    qtbot.addWidget(view)
+    view.fields['Numero de Serie'].setText('SN-REINTENTO')
+    view.fields['Responsable Recepcion'].setText('Carlos V.')
+    view.fields['Descripcion del Problema'].setPlainText('No enciende.')
+
+    # ACT
+    with qtbot.waitSignal(save_worker.failed, timeout=10000):
+        view.save_record()
+    qtbot.waitUntil(lambda: view.fields['Numero de Serie'].text() != '', timeout=5000)
+
+    # ASSERT
+    assert view.fields['Numero de Serie'].text() == 'SN-REINTENTO'
+    assert view.fields['Responsable Recepcion'].text() == 'Carlos V.'
+    assert view.fields['Descripcion del Problema'].toPlainText() == 'No enciende.'
+
+
+def test_registro_fallido_no_sobrescribe_la_captura_en_curso(qtbot, data_manager, nuevo_registro):
+    """Verifica que un registro fallido espera a que el formulario quede libre."""
+    # ARRANGE
+    view = RegistrationView(data_manager)
+    qtbot.addWidget(view)
+    view.fields['Numero de Serie'].setText('SN-EN-CURSO')
+
+    # ACT
+    view.restore_failed_record('SN-FALLIDO', '', nuevo_registro('SN-FALLIDO'))
+    en_curso = view.fields['Numero de Serie'].text()
+    view.clear_form()
+
+    # ASSERT
+    assert en_curso == 'SN-EN-CURSO', "La captura en curso no debería sobrescribirse"
+    assert view.fields['Numero de Serie'].text() == 'SN-FALLIDO'
+    assert view.failed_records == []
@@ -0,0 +1,106 @@
+# tests/test_schema.py
+import pytest
+import pandas as pd
+from src.data_manager import DataManager
+from src.config import Config
+from src.schema import apply_schema
+
+# --- Fixtures de Pytest ---
+
+@pytest.fixture
+def data_manager(libro_temporal):
+    """DataManager sobre un libro temporal con series numéricas heredadas."""
+    pd.DataFrame({
+        'ID': [1, 2],
+        'Numero de Serie': [12345, 'ABC-01'],
+        'Fecha de Recepcion': ['2025-08-04', '2025-08-05'],
+        'Fecha de Entrega': [None, None],
+        'Estado': ['Recibido', 'Recibido'],
+    }, columns=Config.COLUMNS).to_excel(libro_temporal, index=False)
+    return DataManager()
+
+# --- Tests ---
+
+def test_carga_aplica_el_esquema_de_tipos(data_manager):
+    """
+    Verifica que las series numéricas se cargan como texto, las fechas como
+    datetime64 y los campos repetitivos como categorías.
+    """
+    # ACT
+    df = data_manager.load_data()
+
+    # ASSERT
+    assert list(df['Numero de Serie']) == ['12345', 'ABC-01'], "La serie no debe convertirse a float."
+    assert pd.api.types.is_datetime64_any_dtype(df['Fecha de Recepcion'])
+    assert isinstance(df['Estado'].dtype, pd.CategoricalDtype)
+    assert data_manager.find_by_serial('12345')['ID'] == 1
+
+
+def test_anadir_registro_conserva_los_tipos(data_manager):
+    """Verifica que la caché sigue tipada tras añadir un registro con un estado nuevo."""
+    # ARRANGE
+    data_manager.load_data()
+
+    # ACT
+    data_manager.add_record({'Numero de Serie': 'SN-NUEVO', 'Estado': 'En Reparación',
+                             'Fecha de Recepcion': '2025-08-06'})
+    df = data_manager.load_data()
+
+    # ASSERT
+    assert data_manager.cache_stats()['misses'] == 1, "El guardado no debería forzar una relectura."
+    assert isinstance(df['Estado'].dtype, pd.CategoricalDtype)
+    assert list(df['Estado']) == ['Recibido', 'Recibido', 'En Reparación']
+    assert df['Fecha de Recepcion'].iloc[-1] == pd.Timestamp('2025-08-06')
+
+
+def test_fechas_heredadas_no_interpretables_se_conservan():
+    """Verifica que una columna con fechas no interpretables no se convierte (ni se pierde)."""
+    # ARRANGE
+    df = pd.DataFrame({'Fecha de Recepcion': ['2025-08-04', 'semana 32']})
+
+    # ACT
+    resultado = apply_schema(df)
+
+    # ASSERT
+    assert list(resultado['Fecha de Recepcion']) == ['2025-08-04', 'semana 32']
+
+
+def test_reescritura_completa_guarda_fechas_como_texto(data_manager):
+    """
+    Verifica que una reescritura completa guarda las fechas con
+    Config.FORMATO_FECHA, igual que las filas añadidas, sin mezclar celdas
+    datetime y texto en la misma columna.
+    """
+    # ARRANGE
+    from openpyxl import load_workbook
+    data_manager.add_record({'Numero de Serie': 'SN-NUEVO', 'Fecha de Recepcion': '2025-08-06',
+                             'Estado': 'Recibido'})
+
+    # ACT
+    data_manager.save_data(data_manager.load_data())
+
+    # ASSERT
+    hoja = load_workbook(data_manager.active_path).active
+    columna = Config.COLUMNS.index('Fecha de Recepcion') + 1
+    fechas = [hoja.cell(row=fila, column=columna).value for fila in range(2, hoja.max_row + 1)]
+    assert fechas == ['2025-08-04', '2025-08-05', '2025-08-06'], \
+        "Las fechas deberían conservar el formato de texto del libro"
+
+
+def test_reescritura_completa_deja_la_cache_tipada(libro_temporal, nuevo_registro, monkeypatch):
+    """
+    Verifica que tras una reescritura completa la caché conserva el esquema
+    y la búsqueda de un equipo con varias visitas las ordena por fecha.
+    """
+    # ARRANGE
+    monkeypatch.setattr(Config, 'EXCEL_APPEND_MODE', False)
+    dm = DataManager()
+    dm.add_record(nuevo_registro('SN-VISITAS', fecha='2025-09-01'))
+
+    # ACT
+    dm.add_record(nuevo_registro('SN-VISITAS', fecha='2025-08-04'))
+    visitas = dm.find_all_by_serial('SN-VISITAS')
+
+    # ASSERT
+    assert [v['ID'] for v in visitas] == [2, 1], "Las visitas deberían ordenarse por fecha de recepción"
+    assert pd.api.types.is_datetime64_any_dtype(dm.current_frame()['Fecha de Recepcion'])
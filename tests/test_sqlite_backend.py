@@ -0,0 +1,105 @@
+# tests/test_sqlite_backend.py
+import sqlite3
+import pytest
+import pandas as pd
+from src.data_manager import DataManager
+from src.config import Config
+from src.storage import SQLiteBackend, ExcelBackend
+
+# --- Fixtures de Pytest ---
+
+@pytest.fixture
+def temp_excel_path(libro_temporal, monkeypatch):
+    """Libro temporal con el backend SQLite seleccionado."""
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'sqlite')
+    return libro_temporal
+
+# --- Tests ---
+
+def test_config_selecciona_backend_sqlite(temp_excel_path):
+    """Verifica que Config.STORAGE_BACKEND elige el backend SQLite con sus índices."""
+    # ACT
+    dm = DataManager()
+
+    # ASSERT
+    assert isinstance(dm.backend, SQLiteBackend)
+    assert dm.backend.path == temp_excel_path.with_suffix('.sqlite')
+    with sqlite3.connect(dm.backend.path) as conn:
+        indices = {row[1] for row in conn.execute("PRAGMA index_list(registros)")}
+        modo = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert {'idx_registros_serial', 'idx_registros_recepcion'} <= indices
+    assert dm.is_network_mode and modo == 'delete', "En la red no debería usarse WAL."
+
+
+def test_sqlite_local_usa_wal(tmp_path):
+    """Verifica que una base local usa el modo WAL configurado."""
+    # ARRANGE
+    backend = SQLiteBackend(tmp_path / "local.sqlite", Config.COLUMNS, journal_mode=Config.SQLITE_JOURNAL_MODE)
+
+    # ACT
+    backend.ensure_exists()
+
+    # ASSERT
+    with sqlite3.connect(backend.path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_sqlite_add_find_y_next_id(temp_excel_path, nuevo_registro):
+    """Verifica el ciclo completo de alta y búsqueda con el backend SQLite."""
+    # ARRANGE
+    dm = DataManager()
+
+    # ACT
+    dm.add_record(nuevo_registro('SN-SQL-001'))
+    dm.add_record(nuevo_registro('SN-SQL-002'))
+    dm.add_record(nuevo_registro('SN-SQL-001', fecha='2025-09-01'))
+
+    # ASSERT
+    assert dm.get_next_id() == 4
+    visitas = dm.find_all_by_serial('SN-SQL-001')
+    assert [v['ID'] for v in visitas] == [1, 3]
+    assert dm.find_by_serial('SN-SQL-002')['Estado'] == 'Recibido'
+    assert len(dm.load_data()) == 3
+
+
+def test_sqlite_importa_libro_existente_y_exporta_excel(temp_excel_path, monkeypatch, nuevo_registro):
+    """
+    Verifica que el backend SQLite importa el libro histórico al crearse
+    y que la exportación regenera el Excel que el personal consulta.
+    """
+    # ARRANGE: libro Excel previo con un registro
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'excel')
+    dm_excel = DataManager()
+    assert isinstance(dm_excel.backend, ExcelBackend)
+    dm_excel.add_record(nuevo_registro('SN-HISTORICO'))
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'sqlite')
+
+    # ACT
+    dm = DataManager()
+    dm.add_record(nuevo_registro('SN-NUEVO'))
+    exportado = dm.export_to_excel()
+
+    # ASSERT
+    assert dm.find_by_serial('SN-HISTORICO')['ID'] == 1, "El libro existente debería importarse."
+    assert exportado == temp_excel_path
+    df = pd.read_excel(exportado)
+    assert list(df['Numero de Serie']) == ['SN-HISTORICO', 'SN-NUEVO']
+    assert list(df.columns) == Config.COLUMNS
+
+
+def test_sqlite_migracion_conserva_ceros_a_la_izquierda(temp_excel_path, monkeypatch, nuevo_registro):
+    """Verifica que la importación del libro histórico no convierte series como '00123' en números."""
+    # ARRANGE: libro Excel previo cuya única serie parece un número
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'excel')
+    DataManager().add_record(nuevo_registro('00123'))
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'sqlite')
+
+    # ACT
+    dm = DataManager()
+    exportado = dm.export_to_excel()
+
+    # ASSERT
+    assert [v['Numero de Serie'] for v in dm.find_all_by_serial('00123')] == ['00123'], \
+        "La serie migrada debería conservar sus ceros a la izquierda"
+    df = pd.read_excel(exportado, dtype={'Numero de Serie': str})
+    assert list(df['Numero de Serie']) == ['00123'], "La exportación no debería alterar la serie"
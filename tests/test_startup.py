@@ -0,0 +1,80 @@
+# tests/test_startup.py
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _modulos_cargados(import_statement):
+    """Ejecuta un import en un intérprete nuevo y devuelve los módulos cargados."""
+    code = f"{import_statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_nucleo_de_datos_no_importa_qt():
+    """Verifica que Config y DataManager se pueden importar sin Qt."""
+    modulos = _modulos_cargados("import src.data_manager")
+    assert not any(nombre.startswith("PyQt6") for nombre in modulos), "El núcleo no debe depender de Qt."
+
+
+def test_arranque_difiere_pandas_y_openpyxl():
+    """
+    Verifica que el módulo de arranque no importa pandas ni openpyxl en el
+    hilo principal (se cargan en DataManagerInitializer).
+    """
+    modulos = _modulos_cargados("import run")
+    assert "pandas" not in modulos
+    assert "openpyxl" not in modulos
+
+
+def test_inicializador_por_etapas_deja_datos_en_caliente(qtbot, libro_temporal):
+    """
+    Verifica que el inicializador informa cada etapa al splash y entrega un
+    DataManager con la caché cargada y todos los índices construidos.
+    """
+    # ARRANGE
+    from src.data_manager_initializer import DataManagerInitializer
+    initializer = DataManagerInitializer()
+    mensajes, progreso = [], []
+    initializer.stage_started.connect(mensajes.append)
+    initializer.progress.connect(progreso.append)
+
+    # ACT
+    with qtbot.waitSignal(initializer.finished, timeout=10000) as blocker:
+        initializer.start()
+    initializer.wait()
+    dm = blocker.args[0]
+
+    # ASSERT
+    assert mensajes == [mensaje for _, mensaje in DataManagerInitializer.STAGES]
+    assert progreso[-1] == 100
+    assert set(initializer.timings) == {"probe", "storage", "load", "indexes"}
+    assert all(indice.version == dm._data_version for indice in dm._indexes)
+    fallos = dm.cache_stats()['misses']
+    assert dm.find_by_serial('SN-CUALQUIERA') is None
+    assert dm.cache_stats()['misses'] == fallos, "La primera búsqueda no debería releer el archivo."
+
+
+def test_splash_muestra_progreso_y_duracion_de_etapas(qtbot, libro_temporal):
+    """Verifica que el splash recibe el progreso y la duración de las etapas del inicializador."""
+    # ARRANGE
+    import run
+    from src.config import Config
+    from src.data_manager_initializer import DataManagerInitializer
+    splash = run.ProfessionalSplashScreen()
+    qtbot.addWidget(splash)
+    initializer = DataManagerInitializer()
+    run.connect_splash(initializer, splash)
+
+    # ACT
+    with qtbot.waitSignal(initializer.finished, timeout=10000):
+        initializer.start()
+    initializer.wait()
+
+    # ASSERT
+    assert splash.progress_bar.value() == 100, "La barra debería llegar al 100 % al terminar"
+    assert splash.timing_label.text().startswith("Última etapa:"), "Debería mostrarse la duración de la última etapa"
+    assert splash.message_label.text() == Config.MSG_INICIO_INDICES
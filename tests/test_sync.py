@@ -0,0 +1,99 @@
+# tests/test_sync.py
+import pandas as pd
+from unittest.mock import patch
+from src.data_manager import DataManager
+from src.config import Config
+from src.sync import SyncEngine
+
+
+def _data_manager(en_red):
+    resultado = (True, None) if en_red else (False, "Host inaccesible")
+    with patch('src.network_probe.check_network_dir', return_value=resultado):
+        return DataManager()
+
+# --- Tests ---
+
+def test_sync_omite_duplicados_y_reasigna_ids(rutas, nuevo_registro):
+    """Verifica que la sincronización sube en un lote solo las visitas nuevas con IDs de la red."""
+    # ARRANGE
+    red, local = rutas
+    dm_red = _data_manager(en_red=True)
+    dm_red.add_record(nuevo_registro('SN-001'))
+    dm_red.add_record(nuevo_registro('SN-002'))
+    dm_local = _data_manager(en_red=False)
+    dm_local.add_record(nuevo_registro('SN-002'))                      # misma visita que en la red
+    dm_local.add_record(nuevo_registro('SN-002', fecha='2025-09-01'))  # visita nueva del mismo equipo
+    dm_local.add_record(nuevo_registro('SN-003'))
+
+    # ACT
+    with patch.object(dm_red, 'add_records', wraps=dm_red.add_records) as add_records:
+        reporte = SyncEngine(dm_red).sync()
+
+    # ASSERT
+    df = pd.read_excel(red)
+    assert add_records.call_count == 1, "Los registros pendientes deberían subirse en una sola escritura"
+    assert reporte['pending'] == 3 and reporte['duplicates'] == 1 and reporte['added'] == 2
+    assert reporte['id_map'] == {2: 3, 3: 4}, "Los IDs locales deberían reasignarse tras los de la red"
+    assert list(df['Numero de Serie']) == ['SN-001', 'SN-002', 'SN-002', 'SN-003']
+    assert df['ID'].is_unique, "No debería haber IDs repetidos en el libro de red"
+    assert reporte['watermark'] == 3, "La marca de agua debería quedar en el mayor ID local"
+
+
+def test_sync_incremental_usa_la_marca_de_agua(rutas, nuevo_registro):
+    """Verifica que una segunda sincronización solo procesa lo guardado después."""
+    # ARRANGE
+    dm_red = _data_manager(en_red=True)
+    dm_local = _data_manager(en_red=False)
+    dm_local.add_record(nuevo_registro('SN-100'))
+    SyncEngine(dm_red).sync()
+    dm_local.add_record(nuevo_registro('SN-101'))
+
+    # ACT
+    reporte = SyncEngine(dm_red).sync()
+    repetido = SyncEngine(dm_red).sync()
+
+    # ASSERT
+    assert reporte['pending'] == 1 and reporte['added'] == 1, "Solo debería procesarse el registro nuevo"
+    assert repetido['pending'] == 0, "Sin cambios locales no debería haber pendientes"
+    assert [r['Numero de Serie'] for r in dm_red.iter_records()] == ['SN-100', 'SN-101']
+
+
+def test_sync_fallida_no_avanza_la_marca(rutas, monkeypatch, nuevo_registro):
+    """Verifica que si la escritura en red falla el lote se reintenta en la siguiente sincronización."""
+    # ARRANGE
+    dm_red = _data_manager(en_red=True)
+    dm_local = _data_manager(en_red=False)
+    dm_local.add_record(nuevo_registro('SN-200'))
+    monkeypatch.setattr(dm_red, '_write_rows', lambda rows: False)
+
+    # ACT
+    reporte = SyncEngine(dm_red).sync()
+
+    # ASSERT
+    assert reporte['error'] == Config.MSG_ERROR_GUARDADO
+    assert SyncEngine(dm_red).load_watermark() == 0, "La marca no debería avanzar si no se escribió nada"
+
+
+def test_sync_con_backend_sqlite_sube_la_base_local(rutas, monkeypatch, nuevo_registro):
+    """
+    Verifica que con STORAGE_BACKEND='sqlite' se sincroniza la base .sqlite
+    local aunque no exista el libro .xlsx local.
+    """
+    # ARRANGE
+    red, local = rutas
+    monkeypatch.setattr(Config, 'STORAGE_BACKEND', 'sqlite')
+    dm_red = _data_manager(en_red=True)
+    dm_local = _data_manager(en_red=False)
+    dm_local.add_record(nuevo_registro('SN-SQL-1'))
+    dm_local.add_record(nuevo_registro('SN-SQL-2'))
+    motor = SyncEngine(dm_red)
+
+    # ACT
+    hay_datos = motor.has_local_data()
+    reporte = motor.sync()
+
+    # ASSERT
+    assert not local.exists(), "En modo sqlite los datos locales no deberían estar en el .xlsx"
+    assert hay_datos, "La base .sqlite local debería detectarse como pendiente de sincronizar"
+    assert reporte['added'] == 2
+    assert list(dm_red.current_frame()['Numero de Serie']) == ['SN-SQL-1', 'SN-SQL-2']